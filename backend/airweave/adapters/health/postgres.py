@@ -24,4 +24,4 @@ class PostgresHealthProbe(HealthProbe):
         async with self._engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
         latency = (time.perf_counter() - start) * 1000
-        return DependencyCheck(status=CheckStatus.up, latency_ms=round(latency, 2))
+        return DependencyCheck.model_construct(status=CheckStatus.up, latency_ms=round(latency, 2))
@@ -22,4 +22,4 @@ class RedisHealthProbe(HealthProbe):
         start = time.perf_counter()
         await self._client.ping()
         latency = (time.perf_counter() - start) * 1000
-        return DependencyCheck(status=CheckStatus.up, latency_ms=round(latency, 2))
+        return DependencyCheck.model_construct(status=CheckStatus.up, latency_ms=round(latency, 2))
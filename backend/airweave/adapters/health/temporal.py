@@ -10,6 +10,9 @@ from temporalio.client import Client as TemporalClientType
 from airweave.core.health.protocols import HealthProbe
 from airweave.schemas.health import CheckStatus, DependencyCheck
 
+# Reported on every check until the client connects; shared, never mutated.
+_SKIPPED = DependencyCheck.model_construct(status=CheckStatus.skipped)
+
 
 class TemporalHealthProbe(HealthProbe):
     """Probes Temporal via the gRPC health check on its service client."""
@@ -24,8 +27,8 @@ class TemporalHealthProbe(HealthProbe):
     async def check(self) -> DependencyCheck:
         client = self._get_client()
         if client is None:
-            return DependencyCheck(status=CheckStatus.skipped)
+            return _SKIPPED
         start = time.perf_counter()
         await client.service_client.check_health()
         latency = (time.perf_counter() - start) * 1000
-        return DependencyCheck(status=CheckStatus.up, latency_ms=round(latency, 2))
+        return DependencyCheck.model_construct(status=CheckStatus.up, latency_ms=round(latency, 2))
@@ -14,6 +14,7 @@ import asyncio
 import copy
 import json
 import logging
+import re
 from collections.abc import Callable, Coroutine
 from typing import Any, TypeVar
 
@@ -60,7 +61,9 @@ class BaseLLM(LLMProtocol):
     _TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
 
     # Fallback string matching for exceptions that don't expose status_code
-    # (e.g. wrapped errors, connection issues, custom exceptions).
+    # (e.g. wrapped errors, connection issues, custom exceptions). Each list is
+    # compiled into one case-insensitive alternation so an error message is
+    # scanned once per category instead of lowercased and scanned per keyword.
     _FATAL_FALLBACK_INDICATORS = [
         "authentication",
         "unauthorized",
@@ -76,6 +79,10 @@ class BaseLLM(LLMProtocol):
         "network",
         "overloaded",
     ]
+    _FATAL_FALLBACK_RE = re.compile("|".join(map(re.escape, _FATAL_FALLBACK_INDICATORS)), re.I)
+    _TRANSIENT_FALLBACK_RE = re.compile(
+        "|".join(map(re.escape, _TRANSIENT_FALLBACK_INDICATORS)), re.I
+    )
 
     def __init__(
         self,
@@ -312,16 +319,16 @@ class BaseLLM(LLMProtocol):
                 )
 
         # 2. Fallback: string matching for exceptions without status_code
-        error_str = str(error).lower()
+        error_str = str(error)
 
-        if any(indicator in error_str for indicator in self._FATAL_FALLBACK_INDICATORS):
+        if self._FATAL_FALLBACK_RE.search(error_str):
             return LLMFatalError(
                 f"{self._name} {label} fatal error: {error}",
                 provider=self._name,
                 cause=error,
             )
 
-        if any(indicator in error_str for indicator in self._TRANSIENT_FALLBACK_INDICATORS):
+        if self._TRANSIENT_FALLBACK_RE.search(error_str):
             return LLMTransientError(
                 f"{self._name} {label} transient error: {error}",
                 provider=self._name,
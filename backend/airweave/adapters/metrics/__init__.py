@@ -1,23 +1,50 @@
 """Metrics adapters — Prometheus and Fake implementations.
 
 Re-exports every public adapter so consumers can import directly from
-``airweave.adapters.metrics``.
+``airweave.adapters.metrics``.  Submodules are imported lazily on first
+attribute access (PEP 562) so e.g. the API process, which never touches
+the worker gauges, does not pay for importing them.
 """
 
-from airweave.adapters.metrics.agentic_search import (
-    FakeAgenticSearchMetrics,
-    PrometheusAgenticSearchMetrics,
-    StepDurationRecord,
-)
-from airweave.adapters.metrics.db_pool import FakeDbPoolMetrics, PrometheusDbPoolMetrics
-from airweave.adapters.metrics.http import (
-    FakeHttpMetrics,
-    PrometheusHttpMetrics,
-    RequestRecord,
-    ResponseSizeRecord,
-)
-from airweave.adapters.metrics.renderer import FakeMetricsRenderer, PrometheusMetricsRenderer
-from airweave.adapters.metrics.worker import FakeWorkerMetrics, PrometheusWorkerMetrics
+from typing import TYPE_CHECKING
+
+from airweave.core.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from airweave.adapters.metrics.agentic_search import (
+        FakeAgenticSearchMetrics,
+        PrometheusAgenticSearchMetrics,
+        StepDurationRecord,
+    )
+    from airweave.adapters.metrics.db_pool import FakeDbPoolMetrics, PrometheusDbPoolMetrics
+    from airweave.adapters.metrics.http import (
+        FakeHttpMetrics,
+        PrometheusHttpMetrics,
+        RequestRecord,
+        ResponseSizeRecord,
+    )
+    from airweave.adapters.metrics.renderer import FakeMetricsRenderer, PrometheusMetricsRenderer
+    from airweave.adapters.metrics.worker import FakeWorkerMetrics, PrometheusWorkerMetrics
+
+# Public name -> defining submodule, relative to this package.
+_LAZY_EXPORTS = {
+    "FakeAgenticSearchMetrics": ".agentic_search",
+    "PrometheusAgenticSearchMetrics": ".agentic_search",
+    "StepDurationRecord": ".agentic_search",
+    "FakeDbPoolMetrics": ".db_pool",
+    "PrometheusDbPoolMetrics": ".db_pool",
+    "FakeHttpMetrics": ".http",
+    "PrometheusHttpMetrics": ".http",
+    "RequestRecord": ".http",
+    "ResponseSizeRecord": ".http",
+    "FakeMetricsRenderer": ".renderer",
+    "PrometheusMetricsRenderer": ".renderer",
+    "FakeWorkerMetrics": ".worker",
+    "PrometheusWorkerMetrics": ".worker",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "FakeAgenticSearchMetrics",
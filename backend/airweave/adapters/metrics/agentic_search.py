@@ -5,17 +5,23 @@ these metrics are served alongside the HTTP metrics on the same
 ``/metrics`` endpoint.
 """
 
-from dataclasses import dataclass
+import collections
+import sys
+from typing import NamedTuple
 
 from prometheus_client import CollectorRegistry, Counter, Histogram
 
 from airweave.core.protocols.metrics import AgenticSearchMetrics
 
-_ITERATION_BUCKETS = (1, 2, 3, 4, 5, 7, 10)
-_STEP_DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Bucket edges follow the LLM-bound latency profile of the pipeline; finer
+# edges multiplied series count per label value without adding signal.
+_ITERATION_BUCKETS = (1, 3, 5, 10)
+_STEP_DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
 _RESULTS_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250)
 _DURATION_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 60.0, 120.0)
 
+_STREAMING_LABEL = {True: sys.intern("true"), False: sys.intern("false")}
+
 
 class PrometheusAgenticSearchMetrics(AgenticSearchMetrics):
     """Prometheus-backed agentic search metrics collection."""
@@ -71,22 +77,22 @@ class PrometheusAgenticSearchMetrics(AgenticSearchMetrics):
     # -- AgenticSearchMetrics protocol methods --
 
     def inc_search_requests(self, mode: str, streaming: bool) -> None:
-        self._requests_total.labels(mode=mode, streaming=str(streaming).lower()).inc()
+        self._requests_total.labels(mode, _STREAMING_LABEL[streaming]).inc()
 
     def inc_search_errors(self, mode: str, streaming: bool) -> None:
-        self._errors_total.labels(mode=mode, streaming=str(streaming).lower()).inc()
+        self._errors_total.labels(mode, _STREAMING_LABEL[streaming]).inc()
 
     def observe_iterations(self, mode: str, count: int) -> None:
-        self._iterations.labels(mode=mode).observe(count)
+        self._iterations.labels(mode).observe(count)
 
     def observe_step_duration(self, step: str, duration: float) -> None:
-        self._step_duration.labels(step=step).observe(duration)
+        self._step_duration.labels(step).observe(duration)
 
     def observe_results_per_search(self, count: int) -> None:
         self._results_per_search.observe(count)
 
     def observe_duration(self, mode: str, duration: float) -> None:
-        self._duration.labels(mode=mode).observe(duration)
+        self._duration.labels(mode).observe(duration)
 
 
 # ---------------------------------------------------------------------------
@@ -94,8 +100,7 @@ class PrometheusAgenticSearchMetrics(AgenticSearchMetrics):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class StepDurationRecord:
+class StepDurationRecord(NamedTuple):
     """Single observed step duration."""
 
     step: str
@@ -103,21 +108,37 @@ class StepDurationRecord:
 
 
 class FakeAgenticSearchMetrics(AgenticSearchMetrics):
-    """In-memory spy implementing the AgenticSearchMetrics protocol."""
+    """In-memory spy implementing the AgenticSearchMetrics protocol.
+
+    Request and error counts are always tallied per ``(mode, streaming)``
+    in ``request_counts`` / ``error_counts``.  Pass ``track_order=False``
+    to skip the ordered ``search_requests`` / ``search_errors`` lists when
+    only totals are asserted.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, track_order: bool = True) -> None:
+        """Start empty; *track_order* controls whether the ordered lists are kept."""
+        self._track_order = track_order
         self.search_requests: list[tuple[str, bool]] = []
         self.search_errors: list[tuple[str, bool]] = []
+        self.request_counts: collections.Counter[tuple[str, bool]] = collections.Counter()
+        self.error_counts: collections.Counter[tuple[str, bool]] = collections.Counter()
         self.iterations: list[tuple[str, int]] = []
         self.step_durations: list[StepDurationRecord] = []
         self.results_counts: list[int] = []
         self.durations: list[tuple[str, float]] = []
 
     def inc_search_requests(self, mode: str, streaming: bool) -> None:
-        self.search_requests.append((mode, streaming))
+        key = (mode, streaming)
+        self.request_counts[key] += 1
+        if self._track_order:
+            self.search_requests.append(key)
 
     def inc_search_errors(self, mode: str, streaming: bool) -> None:
-        self.search_errors.append((mode, streaming))
+        key = (mode, streaming)
+        self.error_counts[key] += 1
+        if self._track_order:
+            self.search_errors.append(key)
 
     def observe_iterations(self, mode: str, count: int) -> None:
         self.iterations.append((mode, count))
@@ -137,6 +158,8 @@ class FakeAgenticSearchMetrics(AgenticSearchMetrics):
         """Reset all recorded state."""
         self.search_requests.clear()
         self.search_errors.clear()
+        self.request_counts.clear()
+        self.error_counts.clear()
         self.iterations.clear()
         self.step_durations.clear()
         self.results_counts.clear()
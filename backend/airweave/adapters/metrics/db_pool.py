@@ -1,12 +1,29 @@
 """DB pool metrics adapters (Prometheus + Fake).
 
-Prometheus implementation exposes five gauges on the shared
-CollectorRegistry for connection pool state.
+Prometheus implementation exposes connection pool state on the shared
+CollectorRegistry as one ``airweave_db_pool_connections`` gauge labelled
+by ``state`` plus a static ``airweave_db_pool_max_overflow`` gauge.  The
+gauges are served by a custom collector so each sampling tick is a single
+tuple assignment instead of several locked ``Gauge.set()`` calls.
 """
 
-from prometheus_client import CollectorRegistry, Gauge
+from collections.abc import Iterator
 
-from airweave.core.protocols.metrics import DbPoolMetrics
+from prometheus_client import CollectorRegistry
+from prometheus_client.core import GaugeMetricFamily, Metric
+
+from airweave.core.protocols.metrics import DbPoolMetrics, PoolSnapshot
+
+_CONNECTIONS_GAUGE = "airweave_db_pool_connections"
+_CONNECTIONS_HELP = (
+    "Connection pool state: size (current pool size), checked_out (in use), "
+    "checked_in (idle), overflow (beyond pool size)"
+)
+# ``state`` label values, in the same order as the sampled tuple.
+_POOL_STATES = ("size", "checked_out", "checked_in", "overflow")
+
+_MAX_OVERFLOW_GAUGE = "airweave_db_pool_max_overflow"
+_MAX_OVERFLOW_HELP = "Maximum overflow connections allowed"
 
 
 class PrometheusDbPoolMetrics(DbPoolMetrics):
@@ -17,55 +34,36 @@ class PrometheusDbPoolMetrics(DbPoolMetrics):
         registry: CollectorRegistry | None = None,
         max_overflow: int = 0,
     ) -> None:
+        """Register the pool collector on *registry*, or on a fresh one if omitted."""
         self._registry = registry or CollectorRegistry()
-
-        self._pool_size = Gauge(
-            "airweave_db_pool_size",
-            "Current size of the connection pool",
-            registry=self._registry,
-        )
-
-        self._max_overflow = Gauge(
-            "airweave_db_pool_max_overflow",
-            "Maximum overflow connections allowed",
-            registry=self._registry,
-        )
-
-        self._checked_out = Gauge(
-            "airweave_db_pool_checked_out",
-            "Connections currently checked out from the pool",
-            registry=self._registry,
-        )
-
-        self._checked_in = Gauge(
-            "airweave_db_pool_checked_in",
-            "Idle connections available in the pool",
-            registry=self._registry,
-        )
-
-        self._overflow = Gauge(
-            "airweave_db_pool_overflow",
-            "Connections currently in overflow",
-            registry=self._registry,
-        )
-
         # Static value — set once.
-        self._max_overflow.set(max_overflow)
+        self._max_overflow = max_overflow
+        # Snapshot from the last tick, stored as-is (field order = _POOL_STATES).
+        self._sample = PoolSnapshot(0, 0, 0, 0)
+        self._registry.register(self)
 
     # -- DbPoolMetrics protocol method --
 
-    def update(
-        self,
-        *,
-        pool_size: int,
-        checked_out: int,
-        checked_in: int,
-        overflow: int,
-    ) -> None:
-        self._pool_size.set(pool_size)
-        self._checked_out.set(checked_out)
-        self._checked_in.set(checked_in)
-        self._overflow.set(overflow)
+    def update(self, snapshot: PoolSnapshot) -> None:
+        """Store *snapshot* for the next scrape."""
+        self._sample = snapshot
+
+    # -- prometheus_client Collector interface --
+
+    def describe(self) -> list[Metric]:
+        """Return metric families without values for registry name checks."""
+        return [
+            GaugeMetricFamily(_CONNECTIONS_GAUGE, _CONNECTIONS_HELP, labels=["state"]),
+            GaugeMetricFamily(_MAX_OVERFLOW_GAUGE, _MAX_OVERFLOW_HELP),
+        ]
+
+    def collect(self) -> Iterator[Metric]:
+        """Yield the most recent pool sample at scrape time."""
+        connections = GaugeMetricFamily(_CONNECTIONS_GAUGE, _CONNECTIONS_HELP, labels=["state"])
+        for state, value in zip(_POOL_STATES, self._sample, strict=True):
+            connections.add_metric([state], value)
+        yield connections
+        yield GaugeMetricFamily(_MAX_OVERFLOW_GAUGE, _MAX_OVERFLOW_HELP, value=self._max_overflow)
 
 
 # ---------------------------------------------------------------------------
@@ -77,24 +75,16 @@ class FakeDbPoolMetrics(DbPoolMetrics):
     """In-memory spy implementing the DbPoolMetrics protocol."""
 
     def __init__(self) -> None:
+        """Start with no recorded snapshot."""
         self.pool_size: int | None = None
         self.checked_out: int | None = None
         self.checked_in: int | None = None
         self.overflow: int | None = None
         self.update_count: int = 0
 
-    def update(
-        self,
-        *,
-        pool_size: int,
-        checked_out: int,
-        checked_in: int,
-        overflow: int,
-    ) -> None:
-        self.pool_size = pool_size
-        self.checked_out = checked_out
-        self.checked_in = checked_in
-        self.overflow = overflow
+    def update(self, snapshot: PoolSnapshot) -> None:
+        """Record *snapshot* and count the call."""
+        self.pool_size, self.checked_out, self.checked_in, self.overflow = snapshot
         self.update_count += 1
 
     # -- test helpers --
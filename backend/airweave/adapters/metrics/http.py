@@ -4,7 +4,9 @@ Prometheus implementation creates a dedicated CollectorRegistry so API
 metrics are isolated from the default global registry.
 """
 
-from dataclasses import dataclass
+import sys
+from collections import defaultdict
+from typing import NamedTuple
 
 from prometheus_client import (
     CollectorRegistry,
@@ -27,12 +29,44 @@ _RESPONSE_SIZE_BUCKETS = (
     1_000_000,
 )
 
+# Upper bound on distinct ``endpoint`` label values.  The middleware already
+# passes route templates, so this only trips if a caller leaks raw paths;
+# anything past the cap is folded into ``_OTHER_LABEL``.
+_MAX_ENDPOINTS = 512
+_OTHER_LABEL = sys.intern("other")
+
+# Standard methods map to one interned string each, so child-cache keys
+# compare by identity; any other method token a client sends collapses to
+# ``_OTHER_LABEL`` instead of minting a new series.
+_METHOD_LABELS = {
+    m: sys.intern(m)
+    for m in ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT")
+}
+
+
+# Likewise every valid status code (100-599) maps to one interned string.
+# The middleware builds a fresh ``str`` per response; looking it up here
+# both validates it and swaps it for the canonical object.
+_STATUS_CODE_LABELS = {str(c): sys.intern(str(c)) for c in range(100, 600)}
+
+
+def _status_code_label(status_code: str) -> str:
+    """Return the interned *status_code* if it is a valid HTTP status, else ``"other"``."""
+    return _STATUS_CODE_LABELS.get(status_code, _OTHER_LABEL)
+
 
 class PrometheusHttpMetrics(HttpMetrics):
     """Prometheus-backed HTTP metrics collection."""
 
-    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: CollectorRegistry | None = None,
+        max_endpoints: int = _MAX_ENDPOINTS,
+    ) -> None:
+        """Create the HTTP metrics on *registry*, admitting at most *max_endpoints* labels."""
         self._registry = registry or CollectorRegistry()
+        self._max_endpoints = max_endpoints
+        self._endpoints: set[str] = set()
 
         self._requests_total = Counter(
             "airweave_http_requests_total",
@@ -63,13 +97,36 @@ class PrometheusHttpMetrics(HttpMetrics):
             registry=self._registry,
         )
 
+        # Labelled children keyed by label tuple.  ``.labels()`` takes a lock
+        # and rebuilds the key on every call; resolving each child once keeps
+        # the per-request path to a single dict lookup.
+        self._requests_total_children: dict[tuple[str, str, str], Counter] = {}
+        self._request_duration_children: dict[tuple[str, str], Histogram] = {}
+        self._in_progress_children: dict[str, Gauge] = {}
+        self._response_size_children: dict[tuple[str, str], Histogram] = {}
+
+    def _in_progress_child(self, method: str) -> Gauge:
+        child = self._in_progress_children.get(method)
+        if child is None:
+            child = self._in_progress_children[method] = self._in_progress.labels(method)
+        return child
+
+    def _endpoint_label(self, endpoint: str) -> str:
+        """Admit *endpoint* as a label value until the cap is reached."""
+        if endpoint in self._endpoints:
+            return endpoint
+        if len(self._endpoints) >= self._max_endpoints:
+            return _OTHER_LABEL
+        self._endpoints.add(endpoint)
+        return endpoint
+
     # -- HttpMetrics protocol methods --
 
     def inc_in_progress(self, method: str) -> None:
-        self._in_progress.labels(method=method).inc()
+        self._in_progress_child(_METHOD_LABELS.get(method, _OTHER_LABEL)).inc()
 
     def dec_in_progress(self, method: str) -> None:
-        self._in_progress.labels(method=method).dec()
+        self._in_progress_child(_METHOD_LABELS.get(method, _OTHER_LABEL)).dec()
 
     def observe_request(
         self,
@@ -78,15 +135,28 @@ class PrometheusHttpMetrics(HttpMetrics):
         status_code: str,
         duration: float,
     ) -> None:
-        self._requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=status_code,
-        ).inc()
-        self._request_duration.labels(method=method, endpoint=endpoint).observe(duration)
+        method = _METHOD_LABELS.get(method, _OTHER_LABEL)
+        endpoint = self._endpoint_label(endpoint)
+        key = (method, endpoint, _status_code_label(status_code))
+        counter = self._requests_total_children.get(key)
+        if counter is None:
+            counter = self._requests_total_children[key] = self._requests_total.labels(*key)
+        counter.inc()
+
+        duration_key = (method, endpoint)
+        histogram = self._request_duration_children.get(duration_key)
+        if histogram is None:
+            histogram = self._request_duration_children[duration_key] = (
+                self._request_duration.labels(*duration_key)
+            )
+        histogram.observe(duration)
 
     def observe_response_size(self, method: str, endpoint: str, size: int) -> None:
-        self._response_size.labels(method=method, endpoint=endpoint).observe(size)
+        key = (_METHOD_LABELS.get(method, _OTHER_LABEL), self._endpoint_label(endpoint))
+        histogram = self._response_size_children.get(key)
+        if histogram is None:
+            histogram = self._response_size_children[key] = self._response_size.labels(*key)
+        histogram.observe(size)
 
 
 # ---------------------------------------------------------------------------
@@ -94,8 +164,7 @@ class PrometheusHttpMetrics(HttpMetrics):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
-class RequestRecord:
+class RequestRecord(NamedTuple):
     """Single observed request."""
 
     method: str
@@ -104,8 +173,7 @@ class RequestRecord:
     duration: float
 
 
-@dataclass
-class ResponseSizeRecord:
+class ResponseSizeRecord(NamedTuple):
     """Single observed response size."""
 
     method: str
@@ -117,15 +185,15 @@ class FakeHttpMetrics(HttpMetrics):
     """In-memory spy implementing the HttpMetrics protocol."""
 
     def __init__(self) -> None:
-        self.in_progress: dict[str, int] = {}
+        self.in_progress: defaultdict[str, int] = defaultdict(int)
         self.requests: list[RequestRecord] = []
         self.response_sizes: list[ResponseSizeRecord] = []
 
     def inc_in_progress(self, method: str) -> None:
-        self.in_progress[method] = self.in_progress.get(method, 0) + 1
+        self.in_progress[method] += 1
 
     def dec_in_progress(self, method: str) -> None:
-        self.in_progress[method] = self.in_progress.get(method, 0) - 1
+        self.in_progress[method] -= 1
 
     def observe_request(
         self,
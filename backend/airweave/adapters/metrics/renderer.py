@@ -5,6 +5,9 @@ can serialize all registered collectors into Prometheus text exposition
 format.
 """
 
+import threading
+import time
+
 from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
 
 from airweave.core.protocols.metrics import MetricsRenderer
@@ -25,12 +28,28 @@ def _parse_content_type(raw: str) -> tuple[str, str]:
 
 _CONTENT_TYPE, _CHARSET = _parse_content_type(CONTENT_TYPE_LATEST)
 
+# Scrapes arriving within this window share one serialized payload.
+_DEFAULT_CACHE_TTL = 0.5
 
-class PrometheusMetricsRenderer(MetricsRenderer):
-    """Render all metrics in a shared CollectorRegistry."""
 
-    def __init__(self, registry: CollectorRegistry) -> None:
+class PrometheusMetricsRenderer(MetricsRenderer):
+    """Render all metrics in a shared CollectorRegistry.
+
+    The encoded payload is memoized for ``cache_ttl`` seconds so bursts of
+    scrapes (several Prometheus replicas, ad-hoc curls) do not each
+    re-serialize every collector.  Pass ``cache_ttl=0`` to disable.
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+    ) -> None:
+        """Render *registry*, reusing the encoded payload for *cache_ttl* seconds."""
         self._registry = registry
+        self._cache_ttl = cache_ttl
+        self._cache: tuple[float, bytes] | None = None
+        self._lock = threading.Lock()
 
     @property
     def content_type(self) -> str:
@@ -41,7 +60,14 @@ class PrometheusMetricsRenderer(MetricsRenderer):
         return _CHARSET
 
     def generate(self) -> bytes:
-        return generate_latest(self._registry)
+        with self._lock:
+            now = time.monotonic()
+            cached = self._cache
+            if cached is not None and now - cached[0] < self._cache_ttl:
+                return cached[1]
+            payload = generate_latest(self._registry)
+            self._cache = (now, payload)
+            return payload
 
 
 # ---------------------------------------------------------------------------
@@ -20,6 +20,17 @@ class TestFakeAgenticSearchMetrics:
         fake.inc_search_errors("thinking", True)
         assert fake.search_errors == [("thinking", True)]
 
+    def test_counts_are_tallied_without_order_tracking(self):
+        fake = FakeAgenticSearchMetrics(track_order=False)
+        fake.inc_search_requests("fast", False)
+        fake.inc_search_requests("fast", False)
+        fake.inc_search_errors("thinking", True)
+
+        assert fake.request_counts == {("fast", False): 2}
+        assert fake.error_counts == {("thinking", True): 1}
+        assert fake.search_requests == []
+        assert fake.search_errors == []
+
     def test_observe_iterations(self):
         fake = FakeAgenticSearchMetrics()
         fake.observe_iterations("thinking", 3)
@@ -57,6 +68,8 @@ class TestFakeAgenticSearchMetrics:
 
         assert fake.search_requests == []
         assert fake.search_errors == []
+        assert fake.request_counts == {}
+        assert fake.error_counts == {}
         assert fake.iterations == []
         assert fake.step_durations == []
         assert fake.results_counts == []
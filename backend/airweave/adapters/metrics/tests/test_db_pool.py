@@ -1,6 +1,7 @@
 """Unit tests for DB pool metrics adapters."""
 
 from airweave.adapters.metrics import FakeDbPoolMetrics, PrometheusDbPoolMetrics
+from airweave.core.protocols.metrics import PoolSnapshot
 
 
 # ---------------------------------------------------------------------------
@@ -13,7 +14,7 @@ class TestFakeDbPoolMetrics:
 
     def test_update_records_values(self):
         fake = FakeDbPoolMetrics()
-        fake.update(pool_size=20, checked_out=5, checked_in=15, overflow=0)
+        fake.update(PoolSnapshot(20, 5, 15, 0))
 
         assert fake.pool_size == 20
         assert fake.checked_out == 5
@@ -23,7 +24,7 @@ class TestFakeDbPoolMetrics:
 
     def test_clear_resets_all_state(self):
         fake = FakeDbPoolMetrics()
-        fake.update(pool_size=20, checked_out=5, checked_in=15, overflow=0)
+        fake.update(PoolSnapshot(20, 5, 15, 0))
         fake.clear()
 
         assert fake.pool_size is None
@@ -53,15 +54,26 @@ class TestPrometheusDbPoolMetrics:
         registry = CollectorRegistry()
         adapter = PrometheusDbPoolMetrics(registry=registry, max_overflow=40)
 
-        adapter.update(pool_size=20, checked_out=5, checked_in=15, overflow=2)
+        adapter.update(PoolSnapshot(20, 5, 15, 2))
         output = generate_latest(registry).decode()
 
-        assert "airweave_db_pool_size 20.0" in output
-        assert "airweave_db_pool_checked_out 5.0" in output
-        assert "airweave_db_pool_checked_in 15.0" in output
-        assert "airweave_db_pool_overflow 2.0" in output
+        assert 'airweave_db_pool_connections{state="size"} 20.0' in output
+        assert 'airweave_db_pool_connections{state="checked_out"} 5.0' in output
+        assert 'airweave_db_pool_connections{state="checked_in"} 15.0' in output
+        assert 'airweave_db_pool_connections{state="overflow"} 2.0' in output
         assert "airweave_db_pool_max_overflow 40.0" in output
 
+    def test_pool_state_shares_one_metric_family(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusDbPoolMetrics(registry=registry)
+        adapter.update(PoolSnapshot(20, 5, 15, 2))
+
+        output = generate_latest(registry).decode()
+        assert output.count("# TYPE airweave_db_pool_connections gauge") == 1
+        assert "airweave_db_pool_size" not in output
+
     def test_max_overflow_set_once(self):
         """max_overflow gauge should reflect the constructor arg."""
         from prometheus_client import CollectorRegistry, generate_latest
@@ -78,9 +90,9 @@ class TestPrometheusDbPoolMetrics:
         registry = CollectorRegistry()
         adapter = PrometheusDbPoolMetrics(registry=registry)
 
-        adapter.update(pool_size=10, checked_out=1, checked_in=9, overflow=0)
-        adapter.update(pool_size=20, checked_out=8, checked_in=12, overflow=3)
+        adapter.update(PoolSnapshot(10, 1, 9, 0))
+        adapter.update(PoolSnapshot(20, 8, 12, 3))
 
         output = generate_latest(registry).decode()
-        assert "airweave_db_pool_size 20.0" in output
-        assert "airweave_db_pool_checked_out 8.0" in output
+        assert 'airweave_db_pool_connections{state="size"} 20.0' in output
+        assert 'airweave_db_pool_connections{state="checked_out"} 8.0' in output
@@ -1,5 +1,7 @@
 """Unit tests for HTTP metrics adapters and renderer."""
 
+import sys
+
 import pytest
 
 from airweave.adapters.metrics import FakeHttpMetrics, FakeMetricsRenderer, PrometheusHttpMetrics
@@ -33,6 +35,15 @@ class TestParseContentType:
 class TestFakeHttpMetrics:
     """Tests for the FakeHttpMetrics test helper."""
 
+    def test_in_progress_tracks_per_method(self):
+        fake = FakeHttpMetrics()
+        fake.inc_in_progress("GET")
+        fake.inc_in_progress("GET")
+        fake.dec_in_progress("GET")
+        fake.dec_in_progress("POST")
+
+        assert fake.in_progress == {"GET": 1, "POST": -1}
+
     def test_clear_resets_all_state(self):
         """clear() should empty every collection."""
         fake = FakeHttpMetrics()
@@ -83,6 +94,63 @@ class TestPrometheusHttpMetrics:
         output = generate_latest(registry).decode()
         assert 'airweave_http_requests_in_progress{method="GET"} 1.0' in output
 
+    def test_labelled_children_are_reused(self):
+        """Repeated observations with the same labels resolve one child."""
+        adapter = PrometheusHttpMetrics()
+        adapter.observe_request("GET", "/api/v1/items", "200", 0.01)
+        adapter.observe_request("GET", "/api/v1/items", "200", 0.02)
+        adapter.inc_in_progress("GET")
+        adapter.dec_in_progress("GET")
+
+        assert len(adapter._requests_total_children) == 1
+        assert len(adapter._request_duration_children) == 1
+        assert len(adapter._in_progress_children) == 1
+
+    def test_endpoints_past_cap_collapse_to_other(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusHttpMetrics(registry=registry, max_endpoints=1)
+        adapter.observe_request("GET", "/api/v1/items", "200", 0.01)
+        adapter.observe_request("GET", "/api/v1/items/123", "200", 0.01)
+
+        output = generate_latest(registry).decode()
+        assert 'endpoint="/api/v1/items",method="GET",status_code="200"} 1.0' in output
+        assert 'endpoint="other",method="GET",status_code="200"} 1.0' in output
+        assert "/api/v1/items/123" not in output
+
+    def test_unknown_method_collapses_to_other(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusHttpMetrics(registry=registry)
+        adapter.inc_in_progress("BREW")
+        adapter.observe_request("BREW", "/test", "405", 0.01)
+
+        output = generate_latest(registry).decode()
+        assert 'airweave_http_requests_in_progress{method="other"} 1.0' in output
+        assert 'method="other",status_code="405"' in output
+        assert "BREW" not in output
+
+    def test_invalid_status_code_collapses_to_other(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusHttpMetrics(registry=registry)
+        adapter.observe_request("GET", "/test", "bogus", 0.01)
+
+        output = generate_latest(registry).decode()
+        assert 'status_code="other"' in output
+
+    def test_status_code_labels_are_interned(self):
+        adapter = PrometheusHttpMetrics()
+        adapter.observe_request("GET", "/test", str(200), 0.01)
+        adapter.observe_request("GET", "/test", "".join(["2", "00"]), 0.01)
+
+        assert len(adapter._requests_total_children) == 1
+        (key,) = adapter._requests_total_children
+        assert key[2] is sys.intern("200")
+
     def test_observe_response_size(self):
         from prometheus_client import CollectorRegistry, generate_latest
 
@@ -147,6 +215,32 @@ class TestPrometheusMetricsRenderer:
         output = renderer.generate().decode()
         assert "airweave_http_requests_total" in output
 
+    def test_generate_reuses_payload_within_ttl(self):
+        from prometheus_client import CollectorRegistry
+
+        from airweave.adapters.metrics import PrometheusMetricsRenderer
+
+        registry = CollectorRegistry()
+        http = PrometheusHttpMetrics(registry=registry)
+        renderer = PrometheusMetricsRenderer(registry=registry, cache_ttl=60)
+
+        first = renderer.generate()
+        http.observe_request("GET", "/test", "200", 0.01)
+        assert renderer.generate() is first
+
+    def test_generate_without_ttl_is_fresh(self):
+        from prometheus_client import CollectorRegistry
+
+        from airweave.adapters.metrics import PrometheusMetricsRenderer
+
+        registry = CollectorRegistry()
+        http = PrometheusHttpMetrics(registry=registry)
+        renderer = PrometheusMetricsRenderer(registry=registry, cache_ttl=0)
+
+        renderer.generate()
+        http.observe_request("GET", "/test", "200", 0.01)
+        assert "airweave_http_requests_total" in renderer.generate().decode()
+
 
 class TestFakeMetricsRenderer:
     """Tests for the FakeMetricsRenderer test double."""
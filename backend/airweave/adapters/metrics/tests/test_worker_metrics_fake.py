@@ -42,6 +42,16 @@ def test_clear_resets_state():
     assert fake.last_snapshot is None
 
 
+def test_history_is_bounded_by_maxlen():
+    fake = FakeWorkerMetrics(maxlen=2)
+    fake.update(_make_snapshot(worker_id="0"))
+    fake.update(_make_snapshot(worker_id="1"))
+    fake.update(_make_snapshot(worker_id="2"))
+
+    assert [s.worker_id for s in fake.snapshots] == ["1", "2"]
+    assert fake.last_snapshot is fake.snapshots[-1]
+
+
 def test_snapshot_fields_accessible():
     fake = FakeWorkerMetrics()
     snap = _make_snapshot(
@@ -123,6 +123,19 @@ def test_multiple_workers():
     assert 'worker_id="1"' in text
 
 
+def test_labelled_children_resolved_once_per_worker():
+    adapter, registry = _make_adapter()
+    snapshot = _make_snapshot(
+        connector_metrics={"slack": ConnectorSnapshot(active_syncs=1, active_and_pending_workers=2)}
+    )
+    adapter.update(snapshot)
+    adapter.update(_make_snapshot(uptime_seconds=150.0, connector_metrics={}))
+
+    assert list(adapter._scalar_children) == ["0"]
+    assert list(adapter._connector_children) == [("0", "slack")]
+    assert 'airweave_worker_uptime_seconds{worker_id="0"} 150.0' in _render(registry)
+
+
 def test_config_value_gauges():
     adapter, registry = _make_adapter()
     adapter.update(_make_snapshot(sync_max_workers=25, thread_pool_size=150))
@@ -4,6 +4,8 @@ Prometheus implementation owns all 11 gauges, the Info metric, and the
 ProcessCollector for Temporal worker instrumentation.
 """
 
+from collections import deque
+
 from prometheus_client import CollectorRegistry, Gauge, Info, ProcessCollector
 
 from airweave.core.protocols.metrics import WorkerMetrics
@@ -17,6 +19,7 @@ class PrometheusWorkerMetrics(WorkerMetrics):
         """Initialize Prometheus gauges and process collector on the given registry."""
         self._registry = registry
         self._previous_connector_labels: dict[str, set[str]] = {}
+        self._last_info: dict[str, str] | None = None
 
         # Process metrics (memory, CPU, file descriptors)
         ProcessCollector(registry=registry, namespace="airweave_worker")
@@ -107,31 +110,57 @@ class PrometheusWorkerMetrics(WorkerMetrics):
             registry=registry,
         )
 
+        # Labelled children resolved once per worker id / connector.
+        # ``.labels()`` takes a lock and rebuilds its key on every call, and
+        # a snapshot touches every gauge, so each push would otherwise pay
+        # that per gauge.  Scalar children are stored in the order that
+        # ``_scalar_values`` emits.
+        self._scalar_children: dict[str, tuple[Gauge, ...]] = {}
+        self._connector_children: dict[tuple[str, str], tuple[Gauge, Gauge]] = {}
+
+    def _scalar_gauges(self, wid: str) -> tuple[Gauge, ...]:
+        children = self._scalar_children.get(wid)
+        if children is None:
+            children = self._scalar_children[wid] = tuple(
+                gauge.labels(wid)
+                for gauge in (
+                    self._uptime_seconds,
+                    self._status,
+                    self._active_activities,
+                    self._active_sync_jobs,
+                    self._pool_active_and_pending,
+                    self._sync_max_workers_config,
+                    self._thread_pool_size_config,
+                    self._thread_pool_active,
+                )
+            )
+        return children
+
+    def _connector_gauges(self, wid: str, connector_type: str) -> tuple[Gauge, Gauge]:
+        key = (wid, connector_type)
+        children = self._connector_children.get(key)
+        if children is None:
+            children = self._connector_children[key] = (
+                self._pool_active_and_pending_by_connector.labels(wid, connector_type),
+                self._active_syncs_by_connector.labels(wid, connector_type),
+            )
+        return children
+
     # -- WorkerMetrics protocol method --
 
     def update(self, snapshot: WorkerMetricsSnapshot) -> None:
         """Push a snapshot into all Prometheus gauges."""
         wid = snapshot.worker_id
 
-        # Static info
-        self._worker_info.info(
-            {
-                "worker_id": wid,
-                "task_queue": snapshot.task_queue,
-            }
-        )
-
-        # Status mapping
-        status_value = {"stopped": 0, "running": 1, "draining": 2}.get(snapshot.status, 0)
+        # Static info -- only re-published when it changes
+        info = {"worker_id": wid, "task_queue": snapshot.task_queue}
+        if info != self._last_info:
+            self._worker_info.info(info)
+            self._last_info = info
 
         # Scalar gauges
-        self._uptime_seconds.labels(worker_id=wid).set(snapshot.uptime_seconds)
-        self._status.labels(worker_id=wid).set(status_value)
-        self._active_activities.labels(worker_id=wid).set(snapshot.active_activities_count)
-        self._active_sync_jobs.labels(worker_id=wid).set(snapshot.active_sync_jobs_count)
-        self._pool_active_and_pending.labels(worker_id=wid).set(
-            snapshot.worker_pool_active_and_pending_count
-        )
+        for gauge, value in zip(self._scalar_gauges(wid), _scalar_values(snapshot), strict=True):
+            gauge.set(value)
 
         # Per-connector gauges
         current_connector_labels: set[str] = set()
@@ -139,32 +168,35 @@ class PrometheusWorkerMetrics(WorkerMetrics):
         for connector_type, cs in snapshot.connector_metrics.items():
             current_connector_labels.add(connector_type)
 
-            self._pool_active_and_pending_by_connector.labels(
-                worker_id=wid, connector_type=connector_type
-            ).set(cs.active_and_pending_workers)
-
-            self._active_syncs_by_connector.labels(
-                worker_id=wid, connector_type=connector_type
-            ).set(cs.active_syncs)
+            pending, syncs = self._connector_gauges(wid, connector_type)
+            pending.set(cs.active_and_pending_workers)
+            syncs.set(cs.active_syncs)
 
         # Zero out connectors that finished since last scrape
         previous = self._previous_connector_labels.get(wid, set())
         for connector_type in previous - current_connector_labels:
-            self._pool_active_and_pending_by_connector.labels(
-                worker_id=wid, connector_type=connector_type
-            ).set(0)
-            self._active_syncs_by_connector.labels(
-                worker_id=wid, connector_type=connector_type
-            ).set(0)
+            pending, syncs = self._connector_gauges(wid, connector_type)
+            pending.set(0)
+            syncs.set(0)
 
         self._previous_connector_labels[wid] = current_connector_labels
 
-        # Config gauges
-        self._sync_max_workers_config.labels(worker_id=wid).set(snapshot.sync_max_workers)
-        self._thread_pool_size_config.labels(worker_id=wid).set(snapshot.thread_pool_size)
 
-        # Thread pool active
-        self._thread_pool_active.labels(worker_id=wid).set(snapshot.thread_pool_active)
+_STATUS_VALUES = {"stopped": 0, "running": 1, "draining": 2}
+
+
+def _scalar_values(snapshot: WorkerMetricsSnapshot) -> tuple[float, ...]:
+    """Scalar gauge values, aligned with ``PrometheusWorkerMetrics._scalar_gauges``."""
+    return (
+        snapshot.uptime_seconds,
+        _STATUS_VALUES.get(snapshot.status, 0),
+        snapshot.active_activities_count,
+        snapshot.active_sync_jobs_count,
+        snapshot.worker_pool_active_and_pending_count,
+        snapshot.sync_max_workers,
+        snapshot.thread_pool_size,
+        snapshot.thread_pool_active,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -172,12 +204,20 @@ class PrometheusWorkerMetrics(WorkerMetrics):
 # ---------------------------------------------------------------------------
 
 
+_DEFAULT_SNAPSHOT_HISTORY = 4096
+
+
 class FakeWorkerMetrics(WorkerMetrics):
     """In-memory spy implementing the WorkerMetrics protocol."""
 
-    def __init__(self) -> None:
-        """Initialize empty snapshot list."""
-        self.snapshots: list[WorkerMetricsSnapshot] = []
+    def __init__(self, maxlen: int | None = _DEFAULT_SNAPSHOT_HISTORY) -> None:
+        """Initialize an empty snapshot buffer.
+
+        Args:
+            maxlen: Number of most recent snapshots to retain, or ``None``
+                to keep the full history.
+        """
+        self.snapshots: deque[WorkerMetricsSnapshot] = deque(maxlen=maxlen)
 
     def update(self, snapshot: WorkerMetricsSnapshot) -> None:
         """Record a snapshot for later assertion."""
@@ -10,14 +10,17 @@ Usage patterns:
 
 Notes:
 - Publishes accept either strings (already JSON) or dicts which will be JSON-encoded
-- Subscriptions create a dedicated Redis connection suited for long-lived SSE streams
+- Subscriptions check out a dedicated Redis connection suited for long-lived SSE streams
+  from a subscriber pool that is built once per adapter
 """
 
 from __future__ import annotations
 
 import json
 import platform
+import socket
 from typing import Any
+from urllib.parse import quote
 
 import redis.asyncio as redis
 
@@ -25,9 +28,44 @@ from airweave.core.config import settings
 from airweave.core.redis_client import redis_client
 
 
+def _build_subscriber_client() -> redis.Redis:
+    """Build the client whose pool backs long-lived pubsub subscriptions."""
+    if settings.REDIS_PASSWORD:
+        encoded_pwd = quote(settings.REDIS_PASSWORD, safe="")
+        redis_url = (
+            f"redis://:{encoded_pwd}@{settings.REDIS_HOST}:"
+            f"{settings.REDIS_PORT}/{settings.REDIS_DB}"
+        )
+    else:
+        redis_url = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+
+    if platform.system() == "Darwin":
+        socket_keepalive_options = {}
+    elif hasattr(socket, "TCP_KEEPIDLE"):
+        socket_keepalive_options = {
+            socket.TCP_KEEPIDLE: 60,
+            socket.TCP_KEEPINTVL: 10,
+            socket.TCP_KEEPCNT: 6,
+        }
+    else:
+        socket_keepalive_options = {}
+
+    return redis.from_url(
+        redis_url,
+        decode_responses=True,
+        socket_keepalive=True,
+        socket_connect_timeout=5,
+        socket_keepalive_options=socket_keepalive_options,
+    )
+
+
 class RedisPubSub:
     """Redis-backed implementation of the PubSub protocol."""
 
+    def __init__(self) -> None:
+        """Initialize the adapter; the subscriber client is created lazily."""
+        self._subscriber: redis.Redis | None = None
+
     @staticmethod
     def make_channel(namespace: str, id_str: str) -> str:
         """Build a Redis channel name as ``<namespace>:<id>``."""
@@ -55,8 +93,9 @@ class RedisPubSub:
     async def subscribe(self, namespace: str, id_value: Any) -> redis.client.PubSub:
         """Create a dedicated pubsub connection and subscribe to a channel.
 
-        A separate client is created for pubsub to avoid connection pool
-        interference with regular Redis usage.
+        Subscriptions draw from a separate client to avoid connection pool
+        interference with regular Redis usage. That client is built on first
+        use and reused, so each subscription only checks out a connection.
 
         Args:
             namespace: The channel namespace
@@ -67,39 +106,9 @@ class RedisPubSub:
         """
         channel = self.make_channel(namespace, str(id_value))
 
-        if settings.REDIS_PASSWORD:
-            from urllib.parse import quote
-
-            encoded_pwd = quote(settings.REDIS_PASSWORD, safe="")
-            redis_url = (
-                f"redis://:{encoded_pwd}@{settings.REDIS_HOST}:"
-                f"{settings.REDIS_PORT}/{settings.REDIS_DB}"
-            )
-        else:
-            redis_url = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
-
-        if platform.system() == "Darwin":
-            socket_keepalive_options = {}
-        else:
-            import socket
-
-            if hasattr(socket, "TCP_KEEPIDLE"):
-                socket_keepalive_options = {
-                    socket.TCP_KEEPIDLE: 60,
-                    socket.TCP_KEEPINTVL: 10,
-                    socket.TCP_KEEPCNT: 6,
-                }
-            else:
-                socket_keepalive_options = {}
-
-        pubsub_redis = await redis.from_url(
-            redis_url,
-            decode_responses=True,
-            socket_keepalive=True,
-            socket_connect_timeout=5,
-            socket_keepalive_options=socket_keepalive_options,
-        )
+        if self._subscriber is None:
+            self._subscriber = _build_subscriber_client()
 
-        pubsub = pubsub_redis.pubsub()
+        pubsub = self._subscriber.pubsub()
         await pubsub.subscribe(channel)
         return pubsub
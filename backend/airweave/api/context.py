@@ -6,6 +6,7 @@ Only the API layer creates these via deps.get_context().
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
@@ -91,6 +92,13 @@ class ApiContext(BaseContext):
         """User ID if available."""
         return self.user.id if self.user else None
 
+    @cached_property
+    def user_organization_ids(self) -> frozenset[UUID]:
+        """IDs of the user's organizations, built once per request for access checks."""
+        if self.user is None:
+            return frozenset()
+        return frozenset(org.organization.id for org in self.user.user_organizations)
+
     # --- API-specific helpers ---
 
     @property
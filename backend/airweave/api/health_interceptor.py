@@ -0,0 +1,107 @@
+"""Pure ASGI fast path for the health endpoints.
+
+Orchestrator probes hit ``/health``, ``/health/live`` and ``/health/ready``
+continuously.  Routed through FastAPI they pass every ``BaseHTTPMiddleware``
+layer (request id, metrics, body size, timeout, logging, analytics, CORS),
+each of which spawns its own task group per request.  This interceptor sits
+outside that stack and answers plain ``GET`` probes directly, with the same
+bodies and status codes as the routed endpoints in ``api/v1/endpoints/health``.
+
+Requests carrying an ``Origin`` header fall through to the app so browsers
+still get CORS headers.
+"""
+
+import json
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from airweave.core import container as container_mod
+from airweave.core.config import settings
+from airweave.core.protocols import HealthServiceProtocol
+from airweave.schemas.health import ReadinessResponse
+
+_HEALTH_BODY = json.dumps({"status": "healthy"}, separators=(",", ":")).encode()
+_LIVE_BODY = json.dumps({"status": "alive"}, separators=(",", ":")).encode()
+
+_READY_PATH = "/health/ready"
+
+
+def _response_messages(status: int, body: bytes) -> tuple[Message, Message]:
+    """Build the ``http.response.start`` and ``http.response.body`` messages."""
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+# Static probes never change, so their ASGI messages are built once and the
+# hot path is just two ``send`` calls.
+_STATIC_RESPONSES = {
+    "/health": _response_messages(200, _HEALTH_BODY),
+    "/health/live": _response_messages(200, _LIVE_BODY),
+}
+
+
+class HealthCheckInterceptor:
+    """ASGI middleware that serves health probes without the middleware stack."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI app."""
+        self.app = app
+        # HealthService hands back the same response object while it is
+        # cached, so its encoded body is kept alongside and reused.
+        self._ready_body: tuple[ReadinessResponse, bytes] | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer health probes directly; pass everything else through."""
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if len(path) > 1 and path.endswith("/"):
+            path = path[:-1]
+
+        static = _STATIC_RESPONSES.get(path)
+        if (static is None and path != _READY_PATH) or _has_origin(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if static is None:
+            health = _health_service()
+            if health is None:
+                await self.app(scope, receive, send)
+                return
+            result = await health.check_readiness(debug=settings.DEBUG)
+            status = 200 if result.status == "ready" else 503
+            start, body = _response_messages(status, self._encode_readiness(result))
+        else:
+            start, body = static
+
+        await send(start)
+        await send(body)
+
+    def _encode_readiness(self, result: ReadinessResponse) -> bytes:
+        """Serialize *result*, reusing the bytes if it is the last one encoded."""
+        cached = self._ready_body
+        if cached is not None and cached[0] is result:
+            return cached[1]
+        body = result.model_dump_json().encode()
+        self._ready_body = (result, body)
+        return body
+
+
+def _has_origin(scope: Scope) -> bool:
+    """Whether the request is a browser cross-origin request."""
+    return any(name == b"origin" for name, _ in scope["headers"])
+
+
+def _health_service() -> HealthServiceProtocol | None:
+    """The container's health service, or None before the container is initialized."""
+    container = container_mod.container
+    return container.health if container is not None else None
@@ -0,0 +1,110 @@
+"""Tests for the ASGI health-probe fast path."""
+
+import json
+
+import pytest
+
+from airweave.api.health_interceptor import HealthCheckInterceptor
+from airweave.core import container as container_mod
+from airweave.core.health.fakes import FakeFailingProbe, FakeProbe
+from airweave.core.health.service import HealthService
+
+
+class _Downstream:
+    """Inner ASGI app that records whether it was reached."""
+
+    def __init__(self) -> None:
+        self.called = False
+
+    async def __call__(self, scope, receive, send):
+        self.called = True
+        await send({"type": "http.response.start", "status": 418, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+
+async def _call(app, path: str, method: str = "GET", headers=()):
+    scope = {"type": "http", "method": method, "path": path, "headers": list(headers)}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], sent[1]["body"]
+
+
+@pytest.fixture
+def health_container(monkeypatch):
+    def _install(health):
+        monkeypatch.setattr(container_mod, "container", type("C", (), {"health": health})())
+
+    return _install
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, body",
+    [("/health", {"status": "healthy"}), ("/health/live/", {"status": "alive"})],
+)
+async def test_static_probes_bypass_app(path, body):
+    inner = _Downstream()
+    status, raw = await _call(HealthCheckInterceptor(inner), path)
+
+    assert status == 200
+    assert json.loads(raw) == body
+    assert inner.called is False
+
+
+@pytest.mark.asyncio
+async def test_ready_uses_health_service(health_container):
+    health_container(
+        HealthService(critical=[FakeFailingProbe("postgres", ConnectionError())], informational=[])
+    )
+    inner = _Downstream()
+    status, raw = await _call(HealthCheckInterceptor(inner), "/health/ready")
+
+    assert status == 503
+    assert json.loads(raw)["status"] == "not_ready"
+    assert inner.called is False
+
+
+@pytest.mark.asyncio
+async def test_ready_ok(health_container):
+    health_container(HealthService(critical=[FakeProbe("postgres")], informational=[]))
+    status, raw = await _call(HealthCheckInterceptor(_Downstream()), "/health/ready")
+
+    assert status == 200
+    assert json.loads(raw)["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_cached_readiness_reuses_encoded_body(health_container):
+    health_container(
+        HealthService(critical=[FakeProbe("postgres")], informational=[], cache_ttl=60.0)
+    )
+    interceptor = HealthCheckInterceptor(_Downstream())
+
+    _, first = await _call(interceptor, "/health/ready")
+    _, second = await _call(interceptor, "/health/ready")
+
+    assert second is first
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, method, headers",
+    [
+        ("/collections", "GET", ()),
+        ("/health", "POST", ()),
+        ("/health", "GET", ((b"origin", b"https://app.airweave.ai"),)),
+    ],
+)
+async def test_other_requests_pass_through(path, method, headers):
+    inner = _Downstream()
+    status, _ = await _call(HealthCheckInterceptor(inner), path, method, headers)
+
+    assert status == 418
+    assert inner.called is True
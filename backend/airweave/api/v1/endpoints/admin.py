@@ -56,6 +56,7 @@ from airweave.domains.temporal.protocols import (
 from airweave.domains.usage.repository import UsageRepository
 from airweave.models.organization import Organization
 from airweave.models.organization_billing import OrganizationBilling
+from airweave.models.source_connection import SourceConnection
 from airweave.models.user_organization import UserOrganization
 from airweave.schemas.organization_billing import BillingPlan, BillingStatus
 
@@ -214,7 +215,6 @@ def _build_sort_subqueries(query, sort_by: str):
     from sqlalchemy import select as sa_select
 
     from airweave.models.billing_period import BillingPeriod
-    from airweave.models.source_connection import SourceConnection
     from airweave.models.usage import Usage
     from airweave.models.user import User
     from airweave.schemas.billing_period import BillingPeriodStatus
@@ -502,8 +502,6 @@ async def list_all_organizations(
     usage_map = await crud.usage.get_current_usage_for_orgs(db, organization_ids=org_ids)
 
     # Fetch source connection counts in one query (dynamically counted, not stored in usage)
-    from airweave.models.source_connection import SourceConnection
-
     source_connection_count_query = (
         select(
             SourceConnection.organization_id,
@@ -1130,7 +1128,6 @@ async def resync_with_execution_config(
     from airweave.db.unit_of_work import UnitOfWork
     from airweave.models.collection import Collection
     from airweave.models.connection import Connection
-    from airweave.models.source_connection import SourceConnection
     from airweave.models.sync import Sync
     from airweave.models.sync_connection import SyncConnection
     from airweave.models.sync_job import SyncJob
@@ -1464,6 +1461,34 @@ async def admin_get_user_principals(
     return list(access_context.all_principals)
 
 
+async def _get_source_connection_sync_id(
+    db: AsyncSession, source_connection_id: str, ctx: ApiContext
+) -> UUID:
+    """Resolve the sync_id of a source connection in a single keyed query.
+
+    Raises:
+        HTTPException: 404 if the source connection does not exist in the
+            caller's organization or has no sync attached.
+    """
+    try:
+        sc_id = UUID(source_connection_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Source connection not found")
+
+    result = await db.execute(
+        select(SourceConnection.id, SourceConnection.sync_id).where(
+            SourceConnection.id == sc_id,
+            SourceConnection.organization_id == ctx.organization.id,
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Source connection not found")
+    if not row.sync_id:
+        raise HTTPException(status_code=404, detail="No sync found for this source connection")
+    return row.sync_id
+
+
 @router.get("/source-connections/{source_connection_id}/cursor")
 async def admin_get_cursor(
     source_connection_id: str,
@@ -1490,21 +1515,7 @@ async def admin_get_cursor(
 
     _require_admin_permission(ctx, FeatureFlagEnum.API_KEY_ADMIN_SYNC)
 
-    # Find the source connection and its sync_id
-    source_connections = await crud.source_connection.get_multi(db, ctx=ctx)
-    target_sc = None
-    for sc in source_connections:
-        if str(sc.id) == source_connection_id:
-            target_sc = sc
-            break
-
-    if not target_sc:
-        raise HTTPException(status_code=404, detail="Source connection not found")
-
-    # source_connection has a sync_id field linking to the sync
-    sync_id = getattr(target_sc, "sync_id", None)
-    if not sync_id:
-        raise HTTPException(status_code=404, detail="No sync found for this source connection")
+    sync_id = await _get_source_connection_sync_id(db, source_connection_id, ctx)
 
     # Get cursor data
     cursor_data = await sync_cursor_service.get_cursor_data(db=db, sync_id=sync_id, ctx=ctx)
@@ -1536,20 +1547,7 @@ async def admin_delete_cursor(
 
     _require_admin_permission(ctx, FeatureFlagEnum.API_KEY_ADMIN_SYNC)
 
-    # Find source connection and its sync_id
-    source_connections = await crud.source_connection.get_multi(db, ctx=ctx)
-    target_sc = None
-    for sc in source_connections:
-        if str(sc.id) == source_connection_id:
-            target_sc = sc
-            break
-
-    if not target_sc:
-        raise HTTPException(status_code=404, detail="Source connection not found")
-
-    sync_id = getattr(target_sc, "sync_id", None)
-    if not sync_id:
-        raise HTTPException(status_code=404, detail="No sync found for this source connection")
+    sync_id = await _get_source_connection_sync_id(db, source_connection_id, ctx)
 
     # Delete cursor
     deleted = await sync_cursor_service.delete_cursor(db=db, sync_id=sync_id, ctx=ctx)
@@ -1996,7 +1994,6 @@ async def admin_delete_sync(
     """
     from sqlalchemy import select as sa_select
 
-    from airweave.models.source_connection import SourceConnection
     from airweave.models.sync import Sync
 
     _require_admin_permission(ctx, FeatureFlagEnum.API_KEY_ADMIN_SYNC)
@@ -5,9 +5,10 @@ collections. Collections are containers that group related data from one or
 more source connections, enabling unified search across multiple data sources.
 """
 
-from typing import List
+import hashlib
+from typing import Iterable, List, Optional, Union
 
-from fastapi import Depends, HTTPException, Path, Query
+from fastapi import Depends, HTTPException, Path, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import schemas
@@ -21,7 +22,9 @@ from airweave.api.router import TrailingSlashRouter
 from airweave.domains.collections.exceptions import (
     CollectionAlreadyExistsError,
     CollectionNotFoundError,
+    InvalidCollectionCursorError,
 )
+from airweave.domains.collections.pagination import CollectionCursor
 from airweave.domains.collections.protocols import CollectionServiceProtocol
 from airweave.schemas.errors import (
     NotFoundErrorResponse,
@@ -31,6 +34,39 @@ from airweave.schemas.errors import (
 
 router = TrailingSlashRouter()
 
+# Short client-side reuse window; conditional requests cover the rest.
+_COLLECTION_CACHE_CONTROL = "private, max-age=5"
+
+
+def _collections_etag(collections: Iterable[schemas.Collection]) -> str:
+    """Weak ETag over the fields that change what a collection response shows.
+
+    ``status`` and the source connection summaries are derived from other
+    tables, so they are hashed alongside ``modified_at``; the summaries are
+    hashed in full so that renaming a source connection changes the tag.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for c in collections:
+        digest.update(f"{c.id}:{c.modified_at.isoformat()}:{c.status}:".encode())
+        for sc in c.source_connection_summaries:
+            digest.update(sc.model_dump_json().encode())
+        digest.update(b";")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set caching headers and return a 304 if the client already has ``etag``."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _COLLECTION_CACHE_CONTROL
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    # If-None-Match uses weak comparison, so a "W/" prefix on either side is ignored.
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
+
 
 @router.get(
     "/",
@@ -42,7 +78,13 @@ Collections are containers that group related data from one or more source
 connections, enabling unified search across multiple data sources.
 
 Results are sorted by creation date (newest first) and support pagination
-and text search filtering.""",
+and text search filtering.
+
+For deep pagination prefer `cursor` over `skip`: when a page is full, the
+`X-Next-Cursor` response header carries the cursor for the next page.
+
+Responses carry a weak `ETag`; send it back in `If-None-Match` to receive
+`304 Not Modified` when nothing on the page has changed.""",
     responses={
         **create_collection_list_response(["finance_data"], "Finance data collection"),
         422: {"model": ValidationErrorResponse, "description": "Validation Error"},
@@ -50,12 +92,21 @@ and text search filtering.""",
     },
 )
 async def list(
+    request: Request,
+    response: Response,
     skip: int = Query(
         0,
         ge=0,
-        description="Number of collections to skip for pagination",
+        description=(
+            "Number of collections to skip for pagination. Deprecated in favour of `cursor`; "
+            "ignored when `cursor` is set"
+        ),
         json_schema_extra={"example": 0},
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous page's `X-Next-Cursor` header",
+    ),
     limit: int = Query(
         100,
         ge=1,
@@ -71,9 +122,20 @@ async def list(
     db: AsyncSession = Depends(deps.get_db),
     ctx: ApiContext = Depends(deps.get_context),
     service: CollectionServiceProtocol = Inject(CollectionServiceProtocol),
-) -> List[schemas.Collection]:
+) -> Union[List[schemas.Collection], Response]:
     """List all collections belonging to your organization."""
-    return await service.list(db, ctx=ctx, skip=skip, limit=limit, search_query=search)
+    try:
+        page_cursor = CollectionCursor.decode(cursor) if cursor else None
+    except InvalidCollectionCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    collections = await service.list(
+        db, ctx=ctx, skip=skip, limit=limit, search_query=search, cursor=page_cursor
+    )
+    if len(collections) == limit:
+        last = collections[-1]
+        response.headers["X-Next-Cursor"] = CollectionCursor(last.created_at, last.id).encode()
+    return _not_modified(request, response, _collections_etag(collections)) or collections
 
 
 @router.get("/count", response_model=int)
@@ -136,6 +198,8 @@ configuration details before making updates.""",
     },
 )
 async def get(
+    request: Request,
+    response: Response,
     readable_id: str = Path(
         ...,
         description="The unique readable identifier of the collection (e.g., 'finance-data-ab123')",
@@ -144,12 +208,13 @@ async def get(
     db: AsyncSession = Depends(deps.get_db),
     ctx: ApiContext = Depends(deps.get_context),
     service: CollectionServiceProtocol = Inject(CollectionServiceProtocol),
-) -> schemas.Collection:
+) -> Union[schemas.Collection, Response]:
     """Retrieve a specific collection by its readable ID."""
     try:
-        return await service.get(db, readable_id=readable_id, ctx=ctx)
+        collection = await service.get(db, readable_id=readable_id, ctx=ctx)
     except CollectionNotFoundError:
         raise HTTPException(status_code=404, detail="Collection not found")
+    return _not_modified(request, response, _collections_etag([collection])) or collection
 
 
 @router.patch(
@@ -34,17 +34,21 @@ async def liveness() -> LivenessResponse:
     responses={503: {"model": ReadinessResponse}},
 )
 async def readiness(
-    response: Response,
     health: HealthServiceProtocol = Inject(HealthServiceProtocol),
-) -> ReadinessResponse:
+) -> Response:
     """Readiness probe — checks critical dependencies.
 
     Only critical probes (Postgres) gate the HTTP status code.  Informational
     probes (Redis, Temporal) are reported for observability but do not cause
     a 503.
+
+    The result is built from trusted values by ``HealthService``, so it is
+    serialized directly rather than re-validated against ``response_model``.
     """
     result = await health.check_readiness(debug=settings.DEBUG)
 
-    if result.status != "ready":
-        response.status_code = 503
-    return result
+    return Response(
+        content=result.model_dump_json(),
+        media_type="application/json",
+        status_code=200 if result.status == "ready" else 503,
+    )
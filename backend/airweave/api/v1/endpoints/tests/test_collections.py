@@ -0,0 +1,113 @@
+"""API tests for collection endpoint caching headers."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from airweave import schemas
+from airweave.core.shared_models import CollectionStatus
+from airweave.schemas.collection import SourceConnectionSummary
+
+
+def _make_collection(
+    readable_id: str = "finance-data-ab123",
+    status: CollectionStatus = CollectionStatus.ACTIVE,
+) -> schemas.Collection:
+    now = datetime.now(timezone.utc)
+    return schemas.Collection(
+        id=uuid4(),
+        name="Finance Data",
+        readable_id=readable_id,
+        vector_db_deployment_metadata_id=uuid4(),
+        created_at=now,
+        modified_at=now,
+        organization_id=uuid4(),
+        status=status,
+        vector_size=3072,
+        embedding_model_name="text-embedding-3-large",
+    )
+
+
+class TestCollectionCaching:
+    """ETag / If-None-Match handling on the collection read endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_get_sets_etag_and_returns_304_on_match(self, client, fake_collection_service):
+        fake_collection_service.seed_readable("finance-data-ab123", _make_collection())
+
+        first = await client.get("/collections/finance-data-ab123")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"] == "private, max-age=5"
+
+        second = await client.get(
+            "/collections/finance-data-ab123", headers={"If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_status_change_invalidates_etag(self, client, fake_collection_service):
+        collection = _make_collection()
+        fake_collection_service.seed_readable("finance-data-ab123", collection)
+        etag = (await client.get("/collections/finance-data-ab123")).headers["etag"]
+
+        fake_collection_service.seed_readable(
+            "finance-data-ab123",
+            collection.model_copy(update={"status": CollectionStatus.ERROR}),
+        )
+        response = await client.get(
+            "/collections/finance-data-ab123", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_source_connection_rename_invalidates_etag(self, client, fake_collection_service):
+        collection = _make_collection().model_copy(
+            update={
+                "source_connection_summaries": [
+                    SourceConnectionSummary(short_name="slack", name="Slack")
+                ]
+            }
+        )
+        fake_collection_service.seed_readable("finance-data-ab123", collection)
+        etag = (await client.get("/collections/finance-data-ab123")).headers["etag"]
+
+        renamed = collection.model_copy(
+            update={
+                "source_connection_summaries": [
+                    SourceConnectionSummary(short_name="slack", name="Team Slack")
+                ]
+            }
+        )
+        fake_collection_service.seed_readable("finance-data-ab123", renamed)
+        response = await client.get(
+            "/collections/finance-data-ab123", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_wildcard_if_none_match_returns_304(self, client, fake_collection_service):
+        fake_collection_service.seed_readable("finance-data-ab123", _make_collection())
+
+        response = await client.get(
+            "/collections/finance-data-ab123", headers={"If-None-Match": "*"}
+        )
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_list_returns_304_on_match(self, client, fake_collection_service):
+        fake_collection_service.seed_readable("a-coll", _make_collection("a-coll"))
+        fake_collection_service.seed_readable("b-coll", _make_collection("b-coll"))
+
+        first = await client.get("/collections/")
+        assert first.status_code == 200
+        assert len(first.json()) == 2
+
+        second = await client.get("/collections/", headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
@@ -215,6 +215,7 @@ class Settings(BaseSettings):
 
     # Health probe configuration
     HEALTH_CHECK_TIMEOUT: float = 5.0
+    HEALTH_CHECK_CACHE_TTL: float = 2.0  # Seconds to reuse probe results; 0 disables
     HEALTH_CRITICAL_PROBES: str = "postgres"
 
     # Temporal worker graceful shutdown configuration
@@ -284,6 +285,14 @@ class Settings(BaseSettings):
             raise ValueError("HEALTH_CHECK_TIMEOUT must be positive")
         return v
 
+    @field_validator("HEALTH_CHECK_CACHE_TTL", mode="before")
+    def validate_health_check_cache_ttl(cls, v: float) -> float:
+        """Validate that the health-check cache TTL is not negative."""
+        v = float(v)
+        if v < 0:
+            raise ValueError("HEALTH_CHECK_CACHE_TTL must not be negative")
+        return v
+
     @field_validator("AZURE_KEYVAULT_NAME", mode="before")
     def validate_azure_keyvault_name(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Create a keyvault name based on the environment.
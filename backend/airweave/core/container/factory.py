@@ -80,6 +80,8 @@ from airweave.domains.embedders.config import (
     SPARSE_EMBEDDER,
     validate_embedding_config_sync,
 )
+from airweave.domains.embedders.dense.caching import CachingDenseEmbedder
+from airweave.domains.embedders.dense.coalescing import CoalescingDenseEmbedder
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
 from airweave.domains.embedders.registry import DenseEmbedderRegistry, SparseEmbedderRegistry
 from airweave.domains.embedders.sparse.fastembed import (
@@ -654,6 +656,7 @@ def _create_health_service(settings: Settings) -> HealthService:
         critical=critical,
         informational=informational,
         timeout=settings.HEALTH_CHECK_TIMEOUT,
+        cache_ttl=settings.HEALTH_CHECK_CACHE_TTL,
     )
 
 
@@ -791,33 +794,37 @@ def _create_dense_embedder(
     Uses the domain config constants (DENSE_EMBEDDER, EMBEDDING_DIMENSIONS)
     and the registry to look up the spec and construct the correct embedder.
     """
-    from airweave.domains.embedders.dense.local import LocalDenseEmbedder
-    from airweave.domains.embedders.dense.mistral import MistralDenseEmbedder
-    from airweave.domains.embedders.dense.openai import OpenAIDenseEmbedder
-
     spec = registry.get(DENSE_EMBEDDER)
 
-    if spec.embedder_class_ref is OpenAIDenseEmbedder:
+    # Dispatch on the class name and import only the selected provider, so a
+    # deployment never loads the SDKs of embedders it does not use.
+    if spec.class_name == "OpenAIDenseEmbedder":
+        from airweave.domains.embedders.dense.openai import OpenAIDenseEmbedder
+
         return OpenAIDenseEmbedder(
             api_key=settings.OPENAI_API_KEY,
             model=spec.api_model_name,
             dimensions=EMBEDDING_DIMENSIONS,
         )
 
-    if spec.embedder_class_ref is MistralDenseEmbedder:
+    if spec.class_name == "MistralDenseEmbedder":
+        from airweave.domains.embedders.dense.mistral import MistralDenseEmbedder
+
         return MistralDenseEmbedder(
             api_key=settings.MISTRAL_API_KEY,
             model=spec.api_model_name,
             dimensions=EMBEDDING_DIMENSIONS,
         )
 
-    if spec.embedder_class_ref is LocalDenseEmbedder:
+    if spec.class_name == "LocalDenseEmbedder":
+        from airweave.domains.embedders.dense.local import LocalDenseEmbedder
+
         return LocalDenseEmbedder(
             inference_url=settings.TEXT2VEC_INFERENCE_URL,
             dimensions=EMBEDDING_DIMENSIONS,
         )
 
-    raise ValueError(f"Unknown dense embedder class: {spec.embedder_class_ref}")
+    raise ValueError(f"Unknown dense embedder class: {spec.class_name}")
 
 
 def _create_sparse_embedder(registry: SparseEmbedderRegistry) -> SparseEmbedderProtocol:
@@ -1325,8 +1332,10 @@ def _create_search_services(
     filter_translator = FilterTranslator(logger=logger)
     vector_db = VespaVectorDB(app=vespa_app, logger=logger, filter_translator=filter_translator)
 
+    # Repeated queries are answered from an in-process cache; the remaining
+    # query embeddings from concurrent searches are merged into batched calls.
     executor = SearchPlanExecutor(
-        dense_embedder=dense_embedder,
+        dense_embedder=CachingDenseEmbedder(CoalescingDenseEmbedder(dense_embedder)),
         sparse_embedder=sparse_embedder,
         vector_db=vector_db,
         sc_repo=sc_repo,
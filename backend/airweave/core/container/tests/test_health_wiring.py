@@ -14,6 +14,7 @@ def _make_settings(**overrides) -> MagicMock:
     """Build a minimal mock ``Settings`` with health-related defaults."""
     defaults = {
         "HEALTH_CHECK_TIMEOUT": 5.0,
+        "HEALTH_CHECK_CACHE_TTL": 2.0,
         "HEALTH_CRITICAL_PROBES": "postgres",
     }
     defaults.update(overrides)
@@ -117,3 +118,12 @@ class TestCustomTimeout:
             svc = _create_health_service(settings)
 
         assert svc._timeout == 2.0
+
+    def test_cache_ttl_passed_through(self):
+        """``HEALTH_CHECK_CACHE_TTL`` reaches the service instance."""
+        p_engine, p_redis, p_temporal, engine, redis_mod, temporal_cls = _patches()
+        with p_engine, p_redis, p_temporal:
+            settings = _make_settings(HEALTH_CHECK_CACHE_TTL=7.5)
+            svc = _create_health_service(settings)
+
+        assert svc._cache_ttl == 7.5
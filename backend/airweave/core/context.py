@@ -65,6 +65,11 @@ class BaseContext:
         """User ID if available."""
         return None
 
+    @property
+    def user_organization_ids(self) -> frozenset[UUID]:
+        """IDs of the organizations the user belongs to (empty without a user)."""
+        return frozenset()
+
     @property
     def billing_plan(self) -> Optional[str]:
         """Billing plan as a string value, or None if unavailable."""
@@ -1,17 +1,19 @@
 """Background sampler that pushes DB connection pool stats into gauges.
 
-A lightweight ``asyncio.Task`` polls ``pool.checkedout()`` /
-``checkedin()`` / ``overflow()`` / ``size()`` every *interval* seconds
-and forwards the values to a ``DbPoolMetrics`` implementation.
-
-The loop tolerates transient pool errors (e.g. during shutdown) by
-logging a warning and continuing rather than killing the task.
+A self-rescheduling ``loop.call_later`` callback polls ``pool.checkedout()``
+/ ``checkedin()`` / ``overflow()`` / ``size()`` every *interval* seconds and
+forwards the values to a ``DbPoolMetrics`` implementation.  Sampling is
+synchronous, so a timer handle is all it needs — no task or coroutine frame
+stays alive between ticks.
+
+Each tick tolerates transient pool errors (e.g. during shutdown) by
+logging a warning and rescheduling rather than stopping the sampler.
 """
 
 import asyncio
 import logging
 
-from airweave.core.protocols.metrics import DbPool, DbPoolMetrics
+from airweave.core.protocols.metrics import DbPool, DbPoolMetrics, PoolSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -35,32 +37,27 @@ class DbPoolSampler:
         self._pool = pool
         self._metrics = metrics
         self._interval = interval
-        self._task: asyncio.Task[None] | None = None
+        self._handle: asyncio.Handle | None = None
 
     async def start(self) -> None:
-        """Create the background sampling task."""
-        self._task = asyncio.create_task(self._loop())
+        """Schedule the first sample on the running loop."""
+        self._handle = asyncio.get_running_loop().call_soon(self._tick)
 
     async def stop(self) -> None:
-        """Cancel the background task and wait for it to finish."""
-        if self._task is not None:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-
-    async def _loop(self) -> None:
-        """Sample pool stats and push to metrics on each tick."""
-        while True:
-            try:
-                self._metrics.update(
-                    pool_size=self._pool.size(),
-                    checked_out=self._pool.checkedout(),
-                    checked_in=self._pool.checkedin(),
-                    overflow=self._pool.overflow(),
-                )
-            except Exception:
-                logger.warning("Failed to sample DB pool metrics", exc_info=True)
-            await asyncio.sleep(self._interval)
+        """Cancel the pending sample."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _tick(self) -> None:
+        """Sample pool stats, push to metrics, and schedule the next tick."""
+        try:
+            pool = self._pool
+            self._metrics.update(
+                PoolSnapshot(pool.size(), pool.checkedout(), pool.checkedin(), pool.overflow())
+            )
+        except Exception:
+            logger.warning("Failed to sample DB pool metrics", exc_info=True)
+        finally:
+            loop = asyncio.get_running_loop()
+            self._handle = loop.call_later(self._interval, self._tick)
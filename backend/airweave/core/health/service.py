@@ -7,11 +7,28 @@ Absorbs the orchestrator logic that previously lived in ``core.health``
 
 import asyncio
 import errno
+import time
 from collections.abc import Sequence
 
 from airweave.core.health.protocols import HealthProbe, HealthServiceProtocol
 from airweave.schemas.health import CheckStatus, DependencyCheck, ReadinessResponse
 
+# Responses are assembled from already-typed values, so they are built with
+# ``model_construct`` and skip pydantic validation on every readiness call.
+_SKIPPED = DependencyCheck.model_construct(status=CheckStatus.skipped)
+
+# Production error categories; every failed check shares one of these.
+_ERR_TIMEOUT = "timeout"
+_ERR_CONNECTION_REFUSED = "connection_refused"
+_ERR_UNAVAILABLE = "unavailable"
+
+# Outside debug mode a failed check carries only its category, so each one
+# is a shared instance rather than a fresh model per failing probe.
+_DOWN_CHECKS = {
+    err: DependencyCheck.model_construct(status=CheckStatus.down, error=err)
+    for err in (_ERR_TIMEOUT, _ERR_CONNECTION_REFUSED, _ERR_UNAVAILABLE)
+}
+
 
 class HealthService(HealthServiceProtocol):
     """Concrete ``HealthServiceProtocol`` implementation.
@@ -26,12 +43,27 @@ class HealthService(HealthServiceProtocol):
         critical: Sequence[HealthProbe],
         informational: Sequence[HealthProbe],
         timeout: float = 5.0,
+        cache_ttl: float = 0.0,
     ) -> None:
-        """Initialise with critical and informational probe sequences."""
+        """Initialise with critical and informational probe sequences.
+
+        With a positive *cache_ttl*, the assembled response is reused for
+        that many seconds, so frequent orchestrator polling costs at most one
+        probe fan-out per window.  Concurrent calls always share a single
+        in-flight evaluation, cache or not.
+        """
         self._critical = critical
         self._informational = informational
+        # The probe set is fixed at wiring time, so the combined sequence and
+        # the critical/informational split are computed once here.
+        self._probes: tuple[HealthProbe, ...] = (*critical, *informational)
+        self._n_critical = len(critical)
         self._timeout = timeout
+        self._cache_ttl = cache_ttl
         self._shutting_down = False
+        self._response_cache: dict[bool, tuple[float, ReadinessResponse]] = {}
+        self._inflight: dict[bool, asyncio.Task[ReadinessResponse]] = {}
+        self._shutdown_response: ReadinessResponse | None = None
 
     # -- shutdown flag -------------------------------------------------------
 
@@ -53,55 +85,104 @@ class HealthService(HealthServiceProtocol):
         response to ``not_ready``.  *informational* probes are surfaced
         in the response body but do not affect the status code.
         """
-        all_probes = [*self._critical, *self._informational]
-        critical_names = {p.name for p in self._critical}
-
-        skipped = DependencyCheck(status=CheckStatus.skipped)
-
         if self._shutting_down:
-            return ReadinessResponse(
-                status="not_ready",
-                checks={p.name: skipped for p in all_probes},
-            )
-
-        results = await asyncio.gather(
-            *(self._run_probe(p) for p in all_probes),
-            return_exceptions=True,
-        )
+            # The probe set is fixed at construction, so build this once.
+            if self._shutdown_response is None:
+                self._shutdown_response = ReadinessResponse.model_construct(
+                    status="not_ready",
+                    checks={p.name: _SKIPPED for p in self._probes},
+                )
+            return self._shutdown_response
+
+        if self._cache_ttl > 0:
+            entry = self._response_cache.get(debug)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+
+        # Concurrent misses share one evaluation; shield it so a caller that
+        # gives up does not cancel the others.
+        task = self._inflight.get(debug)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(debug=debug))
+            self._inflight[debug] = task
+            task.add_done_callback(lambda _: self._inflight.pop(debug, None))
+        return await asyncio.shield(task)
 
-        checks: dict[str, DependencyCheck] = {}
-        ready = True
+    # -- helpers -------------------------------------------------------------
 
-        for entry in results:
-            if isinstance(entry, BaseException):
-                continue
+    async def _refresh(self, *, debug: bool) -> ReadinessResponse:
+        """Evaluate readiness and store the response when caching is on."""
+        response = await self._evaluate(debug=debug)
+        if self._cache_ttl > 0:
+            self._response_cache[debug] = (time.monotonic(), response)
+        return response
 
-            name, outcome = entry
+    async def _evaluate(self, *, debug: bool) -> ReadinessResponse:
+        """Run every probe and assemble the readiness response.
 
-            if isinstance(outcome, BaseException):
-                checks[name] = DependencyCheck(
-                    status=CheckStatus.down,
-                    error=self._sanitize_error(outcome, debug=debug),
+        The first critical probe to fail decides the outcome, so the probes
+        still running at that point are cancelled and reported as skipped.
+        """
+        probes = self._probes
+        n_critical = self._n_critical
+        if len(probes) == 1:
+            # Nothing to fan out or cancel, so skip the task group.
+            outcome = await self._run_probe(probes[0])
+            if isinstance(outcome, Exception):
+                return ReadinessResponse.model_construct(
+                    status="not_ready" if n_critical else "ready",
+                    checks={probes[0].name: self._down_check(outcome, debug=debug)},
                 )
-                if name in critical_names:
-                    ready = False
-            else:
-                checks[name] = outcome
-
-        return ReadinessResponse(
-            status="ready" if ready else "not_ready",
-            checks=checks,
-        )
+            return ReadinessResponse.model_construct(
+                status="ready", checks={probes[0].name: outcome}
+            )
 
-    # -- helpers -------------------------------------------------------------
+        checks: list[DependencyCheck | None] = [None] * len(probes)
+        tasks: list[asyncio.Task[None]] = []
+        critical_failed = False
+
+        async def check_into(index: int, probe: HealthProbe) -> None:
+            nonlocal critical_failed
+            outcome = await self._run_probe(probe)
+            if not isinstance(outcome, Exception):
+                checks[index] = outcome
+                return
+            checks[index] = self._down_check(outcome, debug=debug)
+            if index < n_critical:
+                critical_failed = True
+                current = asyncio.current_task()
+                for task in tasks:
+                    if task is not current:
+                        task.cancel()
+
+        async with asyncio.TaskGroup() as tg:
+            for i, probe in enumerate(probes):
+                tasks.append(tg.create_task(check_into(i, probe)))
+
+        return ReadinessResponse.model_construct(
+            status="not_ready" if critical_failed else "ready",
+            checks={
+                p.name: check if check is not None else _SKIPPED
+                for p, check in zip(probes, checks, strict=True)
+            },
+        )
 
-    async def _run_probe(self, probe: HealthProbe) -> tuple[str, DependencyCheck | Exception]:
+    async def _run_probe(self, probe: HealthProbe) -> DependencyCheck | Exception:
         """Execute a single probe with a timeout."""
         try:
-            result = await asyncio.wait_for(probe.check(), timeout=self._timeout)
+            async with asyncio.timeout(self._timeout):
+                return await probe.check()
         except Exception as exc:
-            return probe.name, exc
-        return probe.name, result
+            return exc
+
+    @classmethod
+    def _down_check(cls, exc: Exception, *, debug: bool) -> DependencyCheck:
+        """Return the ``down`` check reported for a probe that raised *exc*."""
+        if debug:
+            return DependencyCheck.model_construct(
+                status=CheckStatus.down, error=cls._sanitize_error(exc, debug=True)
+            )
+        return _DOWN_CHECKS[cls._sanitize_error(exc, debug=False)]
 
     @staticmethod
     def _sanitize_error(exc: Exception, *, debug: bool) -> str:
@@ -114,13 +195,13 @@ class HealthService(HealthServiceProtocol):
         if debug:
             return str(exc)
 
-        if isinstance(exc, asyncio.TimeoutError):
-            return "timeout"
-
-        os_err = getattr(exc, "errno", None) or (
-            getattr(exc.__cause__, "errno", None) if exc.__cause__ else None
-        )
-        if os_err == errno.ECONNREFUSED:
-            return "connection_refused"
-
-        return "unavailable"
+        match exc:
+            case asyncio.TimeoutError():
+                return _ERR_TIMEOUT
+            case (
+                OSError(errno=errno.ECONNREFUSED)
+                | Exception(__cause__=OSError(errno=errno.ECONNREFUSED))
+            ):
+                return _ERR_CONNECTION_REFUSED
+            case _:
+                return _ERR_UNAVAILABLE
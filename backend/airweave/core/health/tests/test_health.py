@@ -45,7 +45,24 @@ class TestCheckReadiness:
 
         assert result.status == "not_ready"
         assert result.checks["postgres"].status == CheckStatus.down
-        assert result.checks["redis"].status == CheckStatus.up
+        # The critical failure decides the outcome; pending probes are cut short.
+        assert result.checks["redis"].status == CheckStatus.skipped
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_does_not_wait_for_slow_probes(self):
+        svc = HealthService(
+            critical=[
+                FakeFailingProbe("postgres", ConnectionRefusedError()),
+                FakeSlowProbe("vespa", delay=10.0),
+            ],
+            informational=[FakeSlowProbe("redis", delay=10.0)],
+        )
+        result = await asyncio.wait_for(svc.check_readiness(debug=False), timeout=1.0)
+
+        assert result.status == "not_ready"
+        assert result.checks["postgres"].status == CheckStatus.down
+        assert result.checks["vespa"].status == CheckStatus.skipped
+        assert result.checks["redis"].status == CheckStatus.skipped
 
     @pytest.mark.asyncio
     async def test_informational_down_still_ready(self):
@@ -59,6 +76,32 @@ class TestCheckReadiness:
         assert result.checks["postgres"].status == CheckStatus.up
         assert result.checks["redis"].status == CheckStatus.down
 
+    @pytest.mark.asyncio
+    async def test_single_informational_probe_down_still_ready(self):
+        svc = HealthService(
+            critical=[],
+            informational=[FakeFailingProbe("redis", ConnectionError("gone"))],
+        )
+        result = await svc.check_readiness(debug=False)
+
+        assert result.status == "ready"
+        assert result.checks["redis"].status == CheckStatus.down
+        assert result.checks["redis"].error == "unavailable"
+
+    @pytest.mark.asyncio
+    async def test_production_down_checks_are_shared(self):
+        svc = HealthService(
+            critical=[],
+            informational=[
+                FakeFailingProbe("redis", ConnectionError("gone")),
+                FakeFailingProbe("temporal", RuntimeError("boom")),
+            ],
+        )
+        result = await svc.check_readiness(debug=False)
+
+        assert result.checks["redis"] is result.checks["temporal"]
+        assert result.checks["redis"].error == "unavailable"
+
     @pytest.mark.asyncio
     async def test_timeout_reported_as_down(self):
         svc = HealthService(
@@ -132,6 +175,14 @@ class TestShuttingDown:
         svc.shutting_down = True
         assert svc.shutting_down is True
 
+    @pytest.mark.asyncio
+    async def test_shutdown_response_is_reused(self):
+        svc = HealthService(critical=[FakeProbe("postgres")], informational=[])
+        svc.shutting_down = True
+
+        first = await svc.check_readiness(debug=False)
+        assert await svc.check_readiness(debug=True) is first
+
 
 # ---------------------------------------------------------------------------
 # _sanitize_error
@@ -197,3 +248,119 @@ class TestCustomTimeout:
 
         assert result.status == "ready"
         assert result.checks["postgres"].status == CheckStatus.up
+
+
+# ---------------------------------------------------------------------------
+# Readiness response caching
+# ---------------------------------------------------------------------------
+
+
+class _CountingProbe(FakeSlowProbe):
+    """Slow probe that counts how many times it actually ran."""
+
+    def __init__(self, name: str, delay: float = 0.01) -> None:
+        super().__init__(name, delay=delay)
+        self.calls = 0
+
+    async def check(self):
+        self.calls += 1
+        return await super().check()
+
+
+class TestReadinessCache:
+    """Tests for the readiness response cache and shared in-flight checks."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        probe = _CountingProbe("postgres")
+        svc = HealthService(critical=[probe], informational=[])
+
+        await svc.check_readiness(debug=False)
+        await svc.check_readiness(debug=False)
+
+        assert probe.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_coalesce_without_cache(self):
+        probe = _CountingProbe("postgres", delay=0.05)
+        svc = HealthService(critical=[probe], informational=[])
+
+        results = await asyncio.gather(*(svc.check_readiness(debug=False) for _ in range(5)))
+
+        assert probe.calls == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_check(self):
+        probe = _CountingProbe("postgres", delay=0.05)
+        svc = HealthService(critical=[probe], informational=[])
+
+        first = asyncio.ensure_future(svc.check_readiness(debug=False))
+        second = asyncio.ensure_future(svc.check_readiness(debug=False))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).status == "ready"
+        assert probe.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_reuses_result_within_ttl(self):
+        probe = _CountingProbe("postgres")
+        svc = HealthService(critical=[probe], informational=[], cache_ttl=60.0)
+
+        await svc.check_readiness(debug=False)
+        result = await svc.check_readiness(debug=False)
+
+        assert probe.calls == 1
+        assert result.status == "ready"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self):
+        probe = _CountingProbe("postgres", delay=0.05)
+        svc = HealthService(critical=[probe], informational=[], cache_ttl=60.0)
+
+        results = await asyncio.gather(*(svc.check_readiness(debug=False) for _ in range(5)))
+
+        assert probe.calls == 1
+        assert all(r.status == "ready" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_production_response_sanitized_after_debug_call(self):
+        probe = FakeFailingProbe("postgres", ConnectionError("db.internal:5432"))
+        svc = HealthService(critical=[probe], informational=[], cache_ttl=60.0)
+
+        await svc.check_readiness(debug=True)
+        result = await svc.check_readiness(debug=False)
+
+        assert result.status == "not_ready"
+        assert result.checks["postgres"].error == "unavailable"
+
+    @pytest.mark.asyncio
+    async def test_response_reused_within_ttl(self):
+        svc = HealthService(critical=[FakeProbe("postgres")], informational=[], cache_ttl=60.0)
+
+        first = await svc.check_readiness(debug=False)
+        second = await svc.check_readiness(debug=False)
+
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_response_cache_keyed_by_debug(self):
+        probe = FakeFailingProbe("postgres", ConnectionError("db.internal:5432"))
+        svc = HealthService(critical=[probe], informational=[], cache_ttl=60.0)
+
+        await svc.check_readiness(debug=False)
+        result = await svc.check_readiness(debug=True)
+
+        assert result.checks["postgres"].error == "db.internal:5432"
+
+    @pytest.mark.asyncio
+    async def test_shutting_down_bypasses_cached_response(self):
+        svc = HealthService(critical=[FakeProbe("postgres")], informational=[], cache_ttl=60.0)
+
+        assert (await svc.check_readiness(debug=False)).status == "ready"
+        svc.shutting_down = True
+        result = await svc.check_readiness(debug=False)
+
+        assert result.status == "not_ready"
+        assert result.checks["postgres"].status == CheckStatus.skipped
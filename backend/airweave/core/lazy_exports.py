@@ -0,0 +1,41 @@
+"""Lazy re-exports for package ``__init__`` modules (PEP 562).
+
+A package that re-exports names from many submodules can hand its export
+table to ``lazy_exports`` and bind the returned pair as its module-level
+``__getattr__`` and ``__dir__``.  Each submodule is then imported only when
+one of its names is first accessed, and the value is cached on the package
+so later lookups are plain attribute reads.
+"""
+
+import sys
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for *package*.
+
+    Args:
+        package: The ``__name__`` of the re-exporting package.
+        exports: Public name -> defining module.  Names starting with ``.``
+            are resolved relative to *package*.
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to bind in the package namespace.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted((*vars(sys.modules[package]), *exports))
+
+    return __getattr__, __dir__
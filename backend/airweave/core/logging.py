@@ -9,6 +9,35 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from airweave.core.context import BaseContext
 
+# LogRecord attributes that are emitted explicitly or must not leak into output.
+_RESERVED_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "custom_dimensions",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool})
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging.
@@ -99,36 +128,18 @@ class JSONFormatter(logging.Formatter):
         # Add any other extra fields (excluding custom_dimensions to avoid duplication)
         if hasattr(record, "__dict__"):
             for key, value in record.__dict__.items():
-                if key not in {
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "getMessage",
-                    "custom_dimensions",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                }:
-                    # Only add serializable values
-                    try:
-                        json.dumps(value)
-                        log_entry[key] = value
-                    except (TypeError, ValueError):
-                        log_entry[key] = str(value)
+                if key in _RESERVED_RECORD_ATTRS:
+                    continue
+                # JSON scalars need no probe; only containers/objects are
+                # test-encoded to decide whether they must be stringified.
+                if value is None or type(value) in _JSON_SCALAR_TYPES:
+                    log_entry[key] = value
+                    continue
+                try:
+                    json.dumps(value)
+                    log_entry[key] = value
+                except (TypeError, ValueError):
+                    log_entry[key] = str(value)
 
         # Add exception info if present
         if record.exc_info:
@@ -58,7 +58,11 @@ class PrometheusMetricsService(MetricsService):
         self._sampler: DbPoolSampler | None = None
 
     async def start(self, *, pool: DbPool) -> None:
-        """Start the sidecar metrics server and the DB pool sampler."""
+        """Start the sidecar metrics server and the DB pool sampler.
+
+        Both run on the caller's loop, which is uvloop in deployed API
+        processes (see ``entrypoint.sh``).
+        """
         self._server = MetricsServer(self._renderer, self._port, self._host)
         await self._server.start()
         self._sampler = DbPoolSampler(pool=pool, metrics=self.db_pool)
@@ -3,38 +3,92 @@
 Domain-specific protocols (repositories, OAuth2, source lifecycle) have moved
 to their respective domains/ directories. This module keeps cross-cutting
 infrastructure protocols only.
+
+Names are re-exported lazily on first attribute access (PEP 562), so
+importing one protocol does not load every other protocol module and its
+dependencies.
 """
 
-from airweave.core.health.protocols import HealthProbe, HealthServiceProtocol
-from airweave.core.protocols.cache import ContextCache
-from airweave.core.protocols.circuit_breaker import CircuitBreaker
-from airweave.core.protocols.email import EmailService
-from airweave.core.protocols.encryption import CredentialEncryptor
-from airweave.core.protocols.event_bus import DomainEvent, EventBus, EventHandler, EventSubscriber
-from airweave.core.protocols.identity import IdentityProvider
-from airweave.core.protocols.llm import LLMProtocol
-from airweave.core.protocols.metrics import (
-    AgenticSearchMetrics,
-    DbPool,
-    DbPoolMetrics,
-    HttpMetrics,
-    MetricsRenderer,
-    MetricsService,
-    WorkerMetrics,
-)
-from airweave.core.protocols.payment import PaymentGatewayProtocol
-from airweave.core.protocols.pubsub import PubSub, PubSubSubscription
-from airweave.core.protocols.rate_limiter import RateLimiter
-from airweave.core.protocols.reranker import RerankerProtocol
-from airweave.core.protocols.tokenizer import TokenizerProtocol
-from airweave.core.protocols.webhooks import (
-    EndpointVerifier,
-    WebhookAdmin,
-    WebhookPublisher,
-    WebhookServiceProtocol,
-)
-from airweave.core.protocols.worker_metrics_registry import WorkerMetricsRegistryProtocol
-from airweave.domains.ocr.protocols import OcrProvider
+from typing import TYPE_CHECKING
+
+from airweave.core.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from airweave.core.health.protocols import HealthProbe, HealthServiceProtocol
+    from airweave.core.protocols.cache import ContextCache
+    from airweave.core.protocols.circuit_breaker import CircuitBreaker
+    from airweave.core.protocols.email import EmailService
+    from airweave.core.protocols.encryption import CredentialEncryptor
+    from airweave.core.protocols.event_bus import (
+        DomainEvent,
+        EventBus,
+        EventHandler,
+        EventSubscriber,
+    )
+    from airweave.core.protocols.identity import IdentityProvider
+    from airweave.core.protocols.llm import LLMProtocol
+    from airweave.core.protocols.metrics import (
+        AgenticSearchMetrics,
+        DbPool,
+        DbPoolMetrics,
+        HttpMetrics,
+        MetricsRenderer,
+        MetricsService,
+        PoolSnapshot,
+        WorkerMetrics,
+    )
+    from airweave.core.protocols.payment import PaymentGatewayProtocol
+    from airweave.core.protocols.pubsub import PubSub, PubSubSubscription
+    from airweave.core.protocols.rate_limiter import RateLimiter
+    from airweave.core.protocols.reranker import RerankerProtocol
+    from airweave.core.protocols.tokenizer import TokenizerProtocol
+    from airweave.core.protocols.webhooks import (
+        EndpointVerifier,
+        WebhookAdmin,
+        WebhookPublisher,
+        WebhookServiceProtocol,
+    )
+    from airweave.core.protocols.worker_metrics_registry import WorkerMetricsRegistryProtocol
+    from airweave.domains.ocr.protocols import OcrProvider
+
+# Public name -> defining module.
+_LAZY_EXPORTS = {
+    "AgenticSearchMetrics": "airweave.core.protocols.metrics",
+    "CircuitBreaker": "airweave.core.protocols.circuit_breaker",
+    "ContextCache": "airweave.core.protocols.cache",
+    "CredentialEncryptor": "airweave.core.protocols.encryption",
+    "DbPool": "airweave.core.protocols.metrics",
+    "DbPoolMetrics": "airweave.core.protocols.metrics",
+    "DomainEvent": "airweave.core.protocols.event_bus",
+    "EmailService": "airweave.core.protocols.email",
+    "EndpointVerifier": "airweave.core.protocols.webhooks",
+    "EventBus": "airweave.core.protocols.event_bus",
+    "EventHandler": "airweave.core.protocols.event_bus",
+    "EventSubscriber": "airweave.core.protocols.event_bus",
+    "HealthProbe": "airweave.core.health.protocols",
+    "HealthServiceProtocol": "airweave.core.health.protocols",
+    "HttpMetrics": "airweave.core.protocols.metrics",
+    "IdentityProvider": "airweave.core.protocols.identity",
+    "LLMProtocol": "airweave.core.protocols.llm",
+    "MetricsRenderer": "airweave.core.protocols.metrics",
+    "MetricsService": "airweave.core.protocols.metrics",
+    "OcrProvider": "airweave.domains.ocr.protocols",
+    "PaymentGatewayProtocol": "airweave.core.protocols.payment",
+    "PoolSnapshot": "airweave.core.protocols.metrics",
+    "PubSub": "airweave.core.protocols.pubsub",
+    "PubSubSubscription": "airweave.core.protocols.pubsub",
+    "RateLimiter": "airweave.core.protocols.rate_limiter",
+    "RerankerProtocol": "airweave.core.protocols.reranker",
+    "TokenizerProtocol": "airweave.core.protocols.tokenizer",
+    "WebhookAdmin": "airweave.core.protocols.webhooks",
+    "WebhookPublisher": "airweave.core.protocols.webhooks",
+    "WebhookServiceProtocol": "airweave.core.protocols.webhooks",
+    "WorkerMetrics": "airweave.core.protocols.metrics",
+    "WorkerMetricsRegistryProtocol": "airweave.core.protocols.worker_metrics_registry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "AgenticSearchMetrics",
@@ -58,6 +112,7 @@ __all__ = [
     "MetricsService",
     "OcrProvider",
     "PaymentGatewayProtocol",
+    "PoolSnapshot",
     "PubSub",
     "PubSubSubscription",
     "RateLimiter",
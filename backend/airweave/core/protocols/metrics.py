@@ -3,7 +3,7 @@
 Consolidates all metrics-related protocols into a single module:
 - HttpMetrics: HTTP request/response instrumentation
 - AgenticSearchMetrics: agentic search pipeline instrumentation
-- DbPoolMetrics: database connection pool gauges
+- DbPoolMetrics: database connection pool gauges (fed ``PoolSnapshot`` tuples)
 - WorkerMetrics: Temporal worker gauge instrumentation
 - MetricsRenderer: metrics serialization for scraping
 - MetricsService: facade that owns all metrics adapters
@@ -11,7 +11,7 @@ Consolidates all metrics-related protocols into a single module:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, NamedTuple, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from airweave.domains.temporal.metrics import WorkerMetricsSnapshot
@@ -131,26 +131,28 @@ class AgenticSearchMetrics(Protocol):
 # ---------------------------------------------------------------------------
 
 
+class PoolSnapshot(NamedTuple):
+    """Pool gauges read in a single sampling tick.
+
+    Attributes:
+        pool_size: Current pool size (``pool.size()``).
+        checked_out: Connections currently checked out.
+        checked_in: Idle connections available in the pool.
+        overflow: Connections currently in overflow.
+    """
+
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+
+
 @runtime_checkable
 class DbPoolMetrics(Protocol):
     """Protocol for database connection pool metrics collection."""
 
-    def update(
-        self,
-        *,
-        pool_size: int,
-        checked_out: int,
-        checked_in: int,
-        overflow: int,
-    ) -> None:
-        """Push a snapshot of pool gauges from a single sampling tick.
-
-        Args:
-            pool_size: Current pool size (``pool.size()``).
-            checked_out: Connections currently checked out.
-            checked_in: Idle connections available in the pool.
-            overflow: Connections currently in overflow.
-        """
+    def update(self, snapshot: PoolSnapshot) -> None:
+        """Push a snapshot of pool gauges from a single sampling tick."""
         ...
 
 
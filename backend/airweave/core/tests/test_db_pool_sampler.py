@@ -84,7 +84,7 @@ class TestDbPoolSampler:
 
     @pytest.mark.asyncio
     async def test_stop_cancels_cleanly(self):
-        """stop() should cancel the task without raising."""
+        """stop() should cancel the pending tick without raising."""
         pool = FakePool()
         fake = FakeDbPoolMetrics()
         sampler = DbPoolSampler(pool, fake, interval=0.01)
@@ -92,7 +92,7 @@ class TestDbPoolSampler:
         await sampler.start()
         await sampler.stop()
 
-        assert sampler._task is None
+        assert sampler._handle is None
 
     @pytest.mark.asyncio
     async def test_stop_is_safe_when_not_started(self):
@@ -103,6 +103,21 @@ class TestDbPoolSampler:
 
         await sampler.stop()  # no-op
 
+    @pytest.mark.asyncio
+    async def test_keeps_sampling_until_stopped(self):
+        """Ticks reschedule themselves and stop() ends the chain."""
+        fake = FakeDbPoolMetrics()
+        sampler = DbPoolSampler(FakePool(), fake, interval=0.01)
+
+        await sampler.start()
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+        ticks = fake.update_count
+        await asyncio.sleep(0.03)
+
+        assert ticks >= 2
+        assert fake.update_count == ticks
+
     @pytest.mark.asyncio
     async def test_pool_error_does_not_crash_loop(self):
         """A transient pool error should be swallowed; the loop continues."""
@@ -1,10 +1,11 @@
 """Unified CRUD class for organization-scoped resources."""
 
-from typing import Any, Generic, Optional, Type, TypeVar, Union
+from functools import cached_property
+from typing import Any, Generic, Optional, Type, TypeVar, Union, cast
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Result, ScalarResult, delete, insert, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.core.context import BaseContext
@@ -32,6 +33,37 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         self.model = model
         self.track_user = track_user
 
+    @cached_property
+    def _needs_orm_delete(self) -> bool:
+        """Whether deleting a row must go through ``session.delete()``.
+
+        That is the case when a relationship cascades the delete to children,
+        or when ``before_delete``/``after_delete`` listeners are registered on
+        the mapper; a bulk ``DELETE`` would bypass both.  Resolved on first
+        use rather than in ``__init__`` so the mappers are fully configured
+        by the time relationships are inspected.
+        """
+        mapper = inspect(self.model)
+        if mapper.dispatch.before_delete or mapper.dispatch.after_delete:
+            return True
+        return any(rel.cascade.delete for rel in mapper.relationships)
+
+    @cached_property
+    def _joins_collections(self) -> bool:
+        """Whether the model eagerly joins a collection, duplicating result rows.
+
+        Only then do results need ``unique()``; otherwise the dedup pass is
+        wasted work.  Resolved lazily for the same reason as above.
+        """
+        return any(
+            rel.uselist and rel.lazy == "joined" for rel in inspect(self.model).relationships
+        )
+
+    def _scalars(self, result: Result[Any]) -> ScalarResult[ModelType]:
+        """Model rows of *result*, de-duplicated only if joined collections can repeat rows."""
+        rows = result.unique() if self._joins_collections else result
+        return cast(ScalarResult[ModelType], rows.scalars())
+
     async def get(
         self,
         db: AsyncSession,
@@ -50,19 +82,16 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         -------
             Optional[ModelType]: The object with the given ID.
         """
-        # Validate auth context has org access
-
-        query = select(self.model).where(
-            self.model.id == id, self.model.organization_id == ctx.organization.id
-        )
-
-        result = await db.execute(query)
-        db_obj = result.unique().scalar_one_or_none()
-        if db_obj is None:
+        # Validate auth context has org access. Rows from any other
+        # organization are rejected below, so the result belongs to this one.
+        self._validate_organization_access(ctx, ctx.organization.id)
+
+        # Primary-key lookup: served from the identity map without SQL when
+        # the object is already loaded in this session.
+        db_obj = await db.get(self.model, id)
+        if db_obj is None or db_obj.organization_id != ctx.organization.id:
             raise NotFoundException(f"{self.model.__name__} not found")
 
-        await self._validate_organization_access(ctx, db_obj.organization_id)
-
         return db_obj
 
     async def get_multi(
@@ -86,7 +115,9 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         -------
             list[ModelType]: A list of objects.
         """
-        # Validate auth context has org access
+        # Validate auth context has org access once; every row is filtered to
+        # the same organization.
+        self._validate_organization_access(ctx, ctx.organization.id)
 
         query = (
             select(self.model)
@@ -96,18 +127,13 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         )
 
         result = await db.execute(query)
-        db_objs = result.unique().scalars().all()
-
-        for db_obj in db_objs:
-            await self._validate_organization_access(ctx, db_obj.organization_id)
-
-        return db_objs
+        return list(self._scalars(result).all())
 
     async def create(
         self,
         db: AsyncSession,
         *,
-        obj_in: CreateSchemaType,
+        obj_in: Union[CreateSchemaType, dict[str, Any]],
         ctx: BaseContext,
         uow: Optional[UnitOfWork] = None,
         skip_validation: bool = False,
@@ -117,7 +143,8 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         Args:
         ----
             db (AsyncSession): The database session.
-            obj_in (CreateSchemaType): The object to create.
+            obj_in (Union[CreateSchemaType, dict[str, Any]]): The object to create. A dict
+                is used as-is, skipping the schema ``model_dump``.
             ctx (BaseContext): The API context.
             organization_id (Optional[UUID]): The organization ID to create in.
             uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
@@ -129,7 +156,7 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         """
         if not skip_validation:
             # Validate auth context has org access
-            await self._validate_organization_access(ctx, ctx.organization.id)
+            self._validate_organization_access(ctx, ctx.organization.id)
 
         if not isinstance(obj_in, dict):
             obj_in = obj_in.model_dump(exclude_unset=True)
@@ -155,6 +182,64 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
 
         return db_obj
 
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: list[Union[CreateSchemaType, dict[str, Any]]],
+        ctx: BaseContext,
+        uow: Optional[UnitOfWork] = None,
+    ) -> list[ModelType]:
+        """Create several organization resources in one statement.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            objs_in (list[Union[CreateSchemaType, dict[str, Any]]]): The objects to create.
+            ctx (BaseContext): The API context.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+        -------
+            list[ModelType]: The created objects, in input order.
+        """
+        if not objs_in:
+            return []
+
+        # Validate auth context has org access once; every row shares it
+        self._validate_organization_access(ctx, ctx.organization.id)
+
+        # Organization and tracking columns are the same for every row
+        shared: dict[str, Any] = {"organization_id": ctx.organization.id}
+        if self.track_user:
+            email = ctx.tracking_email if ctx.has_user_context else None
+            shared["created_by_email"] = email
+            shared["modified_by_email"] = email
+
+        rows = [
+            {
+                **(obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)),
+                **shared,
+            }
+            for obj_in in objs_in
+        ]
+
+        # ORM bulk INSERT ... RETURNING: one round-trip, and the returned
+        # objects are fully loaded, so no per-row refresh is needed.  The
+        # rows may be sent in several batches, so RETURNING is asked to keep
+        # input order explicitly.
+        result = await db.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True), rows
+        )
+        db_objs = list(result.all())
+
+        if not uow:
+            ids = [cast(UUID, db_obj.id) for db_obj in db_objs]
+            await db.commit()
+            await self._reload(db, ids)
+
+        return db_objs
+
     async def update(
         self,
         db: AsyncSession,
@@ -179,16 +264,9 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
             ModelType: The updated object.
         """
         # Validate auth context has org access
-        await self._validate_organization_access(ctx, db_obj.organization_id)
-
-        if not isinstance(obj_in, dict):
-            obj_in = obj_in.model_dump(exclude_unset=True)
+        self._validate_organization_access(ctx, db_obj.organization_id)
 
-        if self.track_user and ctx.has_user_context:
-            obj_in["modified_by_email"] = ctx.tracking_email
-
-        for field, value in obj_in.items():
-            setattr(db_obj, field, value)
+        self._apply_update(db_obj, obj_in, ctx)
 
         if not uow:
             await db.commit()
@@ -196,6 +274,84 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
 
         return db_obj
 
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        updates: list[tuple[ModelType, Union[UpdateSchemaType, dict[str, Any]]]],
+        ctx: BaseContext,
+        uow: Optional[UnitOfWork] = None,
+    ) -> list[ModelType]:
+        """Update several organization resources with a single flush and commit.
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            updates (list[tuple[ModelType, Union[UpdateSchemaType, dict[str, Any]]]]): Pairs
+                of object to update and its new data.
+            ctx (BaseContext): The API context.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+
+        Returns:
+        -------
+            list[ModelType]: The updated objects.
+        """
+        # Validate auth context has org access once per distinct organization
+        for organization_id in {db_obj.organization_id for db_obj, _ in updates}:
+            self._validate_organization_access(ctx, organization_id)
+
+        for db_obj, obj_in in updates:
+            self._apply_update(db_obj, obj_in, ctx)
+
+        db_objs = [db_obj for db_obj, _ in updates]
+        if not uow and db_objs:
+            ids = [cast(UUID, db_obj.id) for db_obj in db_objs]
+            # One flush: rows updating the same columns are sent as a single
+            # executemany batch rather than a commit per object.
+            await db.commit()
+            await self._reload(db, ids)
+
+        return db_objs
+
+    async def _reload(self, db: AsyncSession, ids: list[UUID]) -> None:
+        """Reload objects expired by a commit in one query instead of a refresh each."""
+        await db.execute(
+            select(self.model)
+            .where(self.model.id.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+
+    def _apply_update(
+        self,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, dict[str, Any]],
+        ctx: BaseContext,
+    ) -> None:
+        """Set the fields of *obj_in* that differ from *db_obj*.
+
+        Clients often echo back every field; assigning unchanged values only
+        adds attribute history, so they are skipped.  ``modified_by_email`` is
+        stamped only when something actually changed, so no-op updates leave
+        the audit column alone.
+        """
+        if not isinstance(obj_in, dict):
+            obj_in = obj_in.model_dump(exclude_unset=True)
+
+        # Expired or deferred attributes cannot be compared without a load,
+        # so they are always assigned.
+        unloaded = inspect(db_obj).unloaded
+        changed = {
+            field: value
+            for field, value in obj_in.items()
+            if field in unloaded or getattr(db_obj, field) != value
+        }
+
+        if changed and self.track_user and ctx.has_user_context:
+            changed["modified_by_email"] = ctx.tracking_email
+
+        for field, value in changed.items():
+            setattr(db_obj, field, value)
+
     async def remove(
         self,
         db: AsyncSession,
@@ -221,20 +377,28 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         """
         effective_org_id = organization_id or ctx.organization.id
 
-        query = select(self.model).where(
-            self.model.id == id, self.model.organization_id == effective_org_id
-        )
-        result = await db.execute(query)
-        db_obj = result.unique().scalar_one_or_none()
+        # Validate auth context has org access
+        self._validate_organization_access(ctx, effective_org_id)
+
+        where = (self.model.id == id, self.model.organization_id == effective_org_id)
+        if self._needs_orm_delete:
+            # Load the row so session.delete() can cascade and fire listeners.
+            result = await db.execute(select(self.model).where(*where))
+            db_obj = self._scalars(result).one_or_none()
+            if db_obj is not None:
+                await db.delete(db_obj)
+        else:
+            # Nothing to cascade or notify: delete and fetch the row in one round-trip.
+            result = await db.execute(delete(self.model).where(*where).returning(self.model))
+            db_obj = result.scalar_one_or_none()
+            if db_obj is not None:
+                # Detach the returned row, as session.delete() would, so the
+                # commit does not expire an object whose row is gone.
+                db.expunge(db_obj)
 
         if db_obj is None:
             raise NotFoundException(f"{self.model.__name__} not found")
 
-        # Validate auth context has org access
-        await self._validate_organization_access(ctx, db_obj.organization_id)
-
-        await db.delete(db_obj)
-
         if not uow:
             await db.commit()
 
@@ -285,15 +449,14 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         -------
             list[ModelType]: The deleted objects.
         """
+        # Validate auth context has org access; all rows share this organization
+        self._validate_organization_access(ctx, ctx.organization.id)
+
         query = select(self.model).where(
             self.model.id.in_(ids), self.model.organization_id == ctx.organization.id
         )
         result = await db.execute(query)
-        db_objs = result.unique().scalars().all()
-
-        # Validate access for all objects
-        for db_obj in db_objs:
-            await self._validate_organization_access(ctx, db_obj.organization_id)
+        db_objs = list(self._scalars(result).all())
 
         # Delete each object individually
         for db_obj in db_objs:
@@ -304,7 +467,7 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
 
         return db_objs
 
-    async def _validate_organization_access(self, ctx: BaseContext, organization_id: UUID) -> None:
+    def _validate_organization_access(self, ctx: BaseContext, organization_id: UUID) -> None:
         """Validate auth context has access to organization.
 
         Args:
@@ -321,7 +484,7 @@ class CRUDBaseOrganization(Generic[ModelType, CreateSchemaType, UpdateSchemaType
             if ctx.user.is_admin:
                 return
 
-            if organization_id not in [org.organization.id for org in ctx.user.user_organizations]:
+            if organization_id not in ctx.user_organization_ids:
                 raise PermissionException("User does not have access to organization")
         else:
             if organization_id != ctx.organization.id:
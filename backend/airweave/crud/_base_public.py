@@ -1,11 +1,14 @@
 """Base CRUD class for system-wide public resources."""
 
-from typing import Any, Generic, Optional, Type, TypeVar, Union
+from functools import cached_property
+from typing import Any, Generic, Optional, Type, TypeVar, Union, cast
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import inspect, lambda_stmt, select
+from sqlalchemy.engine import Result, ScalarResult
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from airweave.core.exceptions import NotFoundException
 from airweave.db.unit_of_work import UnitOfWork
@@ -28,6 +31,37 @@ class CRUDPublic(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    @cached_property
+    def _needs_unique(self) -> bool:
+        """Whether a joined eager load on a collection can repeat parent rows.
+
+        Resolved lazily because mappers cannot be inspected until every
+        related model has been imported.
+        """
+        return any(
+            rel.uselist and rel.lazy == "joined" for rel in inspect(self.model).relationships
+        )
+
+    @cached_property
+    def _column_keys(self) -> frozenset[str]:
+        """Attribute names of the model's mapped columns."""
+        return frozenset(attr.key for attr in inspect(self.model).column_attrs)
+
+    def _select_by_id(self, id: UUID) -> StatementLambdaElement:
+        """Primary-key select built as a lambda statement.
+
+        The lambda is cached by code location and ``model``, so repeat calls
+        skip rebuilding the ``Select`` and its cache key; ``id`` is extracted
+        as a bound parameter.
+        """
+        model = self.model
+        return lambda_stmt(lambda: select(model).where(model.id == id))
+
+    def _scalars(self, result: Result[Any]) -> ScalarResult[ModelType]:
+        """Model rows of *result*, with ``unique()`` only when eager loads require it."""
+        rows = result.unique() if self._needs_unique else result
+        return cast(ScalarResult[ModelType], rows.scalars())
+
     async def get(self, db: AsyncSession, id: UUID) -> Optional[ModelType]:
         """Get public resource - no access control.
 
@@ -40,8 +74,8 @@ class CRUDPublic(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         -------
             Optional[ModelType]: The object with the given ID.
         """
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        db_obj = result.unique().scalar_one_or_none()
+        result = await db.execute(self._select_by_id(id))
+        db_obj = self._scalars(result).one_or_none()
         if not db_obj:
             raise NotFoundException(f"Object with ID {id} not found")
         return db_obj
@@ -101,13 +135,13 @@ class CRUDPublic(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             query = query.limit(limit)
 
         result = await db.execute(query)
-        return list(result.unique().scalars().all())
+        return list(self._scalars(result).all())
 
     async def create(
         self,
         db: AsyncSession,
         *,
-        obj_in: CreateSchemaType,
+        obj_in: Union[CreateSchemaType, dict[str, Any]],
         uow: Optional[UnitOfWork] = None,
     ) -> ModelType:
         """Create public resource.
@@ -115,7 +149,8 @@ class CRUDPublic(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
         ----
             db (AsyncSession): The database session.
-            obj_in (CreateSchemaType): The object to create.
+            obj_in (Union[CreateSchemaType, dict[str, Any]]): The object to create. A dict
+                is used as-is, skipping the schema ``model_dump``.
             uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
 
         Returns:
@@ -167,6 +202,49 @@ class CRUDPublic(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return db_obj
 
+    async def update_fields(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        uow: Optional[UnitOfWork] = None,
+        **fields: Any,
+    ) -> ModelType:
+        """Set a known handful of columns on a public resource.
+
+        Skips the schema round-trip of ``update()`` for callers that already
+        know exactly which columns change (e.g. a single status flip).
+
+        Args:
+        ----
+            db (AsyncSession): The database session.
+            db_obj (ModelType): The object to update.
+            uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
+            **fields (Any): Column names mapped to their new values.
+
+        Returns:
+        -------
+            ModelType: The updated object.
+
+        Raises:
+        ------
+            AttributeError: If a field is not a mapped column of the model.
+        """
+        unknown = fields.keys() - self._column_keys
+        if unknown:
+            raise AttributeError(
+                f"Model {self.model.__name__} has no column(s) {', '.join(sorted(unknown))}"
+            )
+
+        for field, value in fields.items():
+            setattr(db_obj, field, value)
+
+        if not uow:
+            await db.commit()
+            await db.refresh(db_obj)
+
+        return db_obj
+
     async def remove(
         self,
         db: AsyncSession,
@@ -186,8 +264,8 @@ class CRUDPublic(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         -------
             Optional[ModelType]: The deleted object.
         """
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        db_obj = result.unique().scalar_one_or_none()
+        result = await db.execute(self._select_by_id(id))
+        db_obj = self._scalars(result).one_or_none()
 
         if db_obj is None:
             raise NotFoundException(f"Object with ID {id} not found")
@@ -59,7 +59,7 @@ class CRUDBaseUser(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         self,
         db: AsyncSession,
         *,
-        obj_in: CreateSchemaType,
+        obj_in: Union[CreateSchemaType, dict[str, Any]],
         current_user: User,
         uow: Optional[UnitOfWork] = None,
     ) -> ModelType:
@@ -68,7 +68,8 @@ class CRUDBaseUser(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
         ----
             db (AsyncSession): The database session.
-            obj_in (CreateSchemaType): The object to create.
+            obj_in (Union[CreateSchemaType, dict[str, Any]]): The object to create. A dict
+                is used as-is, skipping the schema ``model_dump``.
             current_user (User): The current user.
             uow (Optional[UnitOfWork]): The unit of work to use for the transaction.
 
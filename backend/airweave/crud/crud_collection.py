@@ -2,9 +2,11 @@
 
 """CRUD operations for collections."""
 
+from datetime import datetime
 from typing import List, Optional
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.core.context import BaseContext
@@ -28,7 +30,7 @@ class CRUDCollection(CRUDBaseOrganization[Collection, CollectionCreate, Collecti
             raise NotFoundException(f"Collection '{readable_id}' not found.")
 
         try:
-            await self._validate_organization_access(ctx, collection.organization_id)
+            self._validate_organization_access(ctx, collection.organization_id)
         except PermissionException:
             raise NotFoundException(f"Collection '{readable_id}' not found.")
 
@@ -42,8 +44,15 @@ class CRUDCollection(CRUDBaseOrganization[Collection, CollectionCreate, Collecti
         limit: int = 100,
         ctx: BaseContext,
         search_query: Optional[str] = None,
+        after: Optional[tuple[datetime, UUID]] = None,
     ) -> List[Collection]:
-        """Get multiple collections with pagination and optional search."""
+        """Get multiple collections with pagination and optional search.
+
+        Collections are ordered newest first by ``(created_at, id)``.  When
+        ``after`` is given (the ``(created_at, id)`` of the previous page's
+        last row) the page starts right after it via an index seek and
+        ``skip`` is ignored.
+        """
         query = select(Collection).where(Collection.organization_id == ctx.organization.id)
 
         if search_query:
@@ -53,8 +62,12 @@ class CRUDCollection(CRUDBaseOrganization[Collection, CollectionCreate, Collecti
                 | (func.lower(Collection.readable_id).like(search_pattern))
             )
 
-        query = query.order_by(Collection.created_at.desc())
-        query = query.offset(skip).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(Collection.created_at, Collection.id) < after)
+        else:
+            query = query.offset(skip)
+
+        query = query.order_by(Collection.created_at.desc(), Collection.id.desc()).limit(limit)
 
         result = await db.execute(query)
         return list(result.scalars().all())
@@ -75,7 +75,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             raise NotFoundException(f"Connection with ID {id} not found")
 
         if not self._is_native_connection(db_obj):
-            await self._validate_organization_access(ctx, db_obj.organization_id)
+            self._validate_organization_access(ctx, db_obj.organization_id)
 
         return db_obj
 
@@ -256,7 +256,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
             return None
 
         if not self._is_native_connection(db_obj):
-            await self._validate_organization_access(ctx, db_obj.organization_id)
+            self._validate_organization_access(ctx, db_obj.organization_id)
 
         return db_obj
 
@@ -308,7 +308,7 @@ class CRUDConnection(CRUDBaseOrganization[Connection, ConnectionCreate, Connecti
                 "Native connections cannot be deleted as they are system-level resources"
             )
 
-        await self._validate_organization_access(ctx, db_obj.organization_id)
+        self._validate_organization_access(ctx, db_obj.organization_id)
 
         await db.delete(db_obj)
 
@@ -1,7 +1,7 @@
 """CRUD operations for entities."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional, Union
 from uuid import UUID
 
 from sqlalchemy import func, select, update
@@ -30,7 +30,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         self,
         db: AsyncSession,
         *,
-        obj_in: EntityCreate,
+        obj_in: Union[EntityCreate, dict[str, Any]],
         ctx: BaseContext,
         uow: Optional["UnitOfWork"] = None,
         skip_validation: bool = False,
@@ -52,7 +52,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         """
         if not skip_validation:
             # Validate auth context has org access
-            await self._validate_organization_access(ctx, ctx.organization.id)
+            self._validate_organization_access(ctx, ctx.organization.id)
 
         if not isinstance(obj_in, dict):
             obj_in_dict = obj_in.model_dump(exclude_unset=True)
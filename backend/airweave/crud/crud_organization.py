@@ -288,7 +288,7 @@ class CRUDOrganization:
         if not skip_access_validation:
             if not ctx:
                 raise PermissionException("No context provided")
-            await self._validate_organization_access(ctx, id)
+            self._validate_organization_access(ctx, id)
 
         query = (
             select(self.model)
@@ -362,8 +362,7 @@ class CRUDOrganization:
         """
         # Check if the user has access to this organization
         if ctx.has_user_context:
-            user_org_ids = [org.organization.id for org in ctx.user.user_organizations]
-            if db_obj.id not in user_org_ids:
+            if db_obj.id not in ctx.user_organization_ids:
                 from airweave.core.exceptions import PermissionException
 
                 raise PermissionException("User does not have access to organization")
@@ -390,7 +389,7 @@ class CRUDOrganization:
         """Create organization resource with auth context."""
         raise NotImplementedError("This method is not implemented for organizations.")
 
-    async def _validate_organization_access(self, ctx: BaseContext, organization_id: UUID) -> None:
+    def _validate_organization_access(self, ctx: BaseContext, organization_id: UUID) -> None:
         """Validate auth context has access to organization.
 
         Args:
@@ -407,7 +406,7 @@ class CRUDOrganization:
             if ctx.user.is_admin:
                 return
 
-            if organization_id not in [org.organization.id for org in ctx.user.user_organizations]:
+            if organization_id not in ctx.user_organization_ids:
                 raise PermissionException("User does not have access to organization")
         else:
             if organization_id != ctx.organization.id:  # type: ignore
@@ -470,7 +469,7 @@ class CRUDOrganization:
         from fastapi import HTTPException
 
         # First validate basic organization access
-        await self._validate_organization_access(ctx, organization_id)
+        self._validate_organization_access(ctx, organization_id)
 
         # Then check if user is admin/owner by finding their UserOrganization record
         if not ctx.has_user_context:
@@ -506,7 +505,7 @@ class CRUDOrganization:
             UserOrganization record if found, None otherwise
         """
         # Validate current user has access to this organization
-        await self._validate_organization_access(ctx, organization_id)
+        self._validate_organization_access(ctx, organization_id)
 
         # Query the membership
         stmt = select(UserOrganization).where(
@@ -540,7 +539,7 @@ class CRUDOrganization:
             List of UserOrganization records with owner role
         """
         # Validate current user has access to this organization
-        await self._validate_organization_access(ctx, organization_id)
+        self._validate_organization_access(ctx, organization_id)
 
         stmt = select(UserOrganization).where(
             UserOrganization.organization_id == organization_id,
@@ -567,7 +566,7 @@ class CRUDOrganization:
             List of UserOrganization records for the organization
         """
         # Validate current user has access to this organization
-        await self._validate_organization_access(ctx, organization_id)
+        self._validate_organization_access(ctx, organization_id)
 
         stmt = (
             select(UserOrganization)
@@ -465,7 +465,7 @@ class CRUDSourceConnection(
         if not source_connection:
             return None
 
-        await self._validate_organization_access(ctx, source_connection.organization_id)
+        self._validate_organization_access(ctx, source_connection.organization_id)
         return source_connection
 
 
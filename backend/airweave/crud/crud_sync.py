@@ -56,7 +56,7 @@ class CRUDSync(CRUDBaseOrganization[Sync, SyncCreate, SyncUpdate]):
             sync = await self.enrich_sync_with_connections(db, sync=sync)
 
         # Validate user permissions
-        await self._validate_organization_access(ctx, sync.organization_id)
+        self._validate_organization_access(ctx, sync.organization_id)
         return sync
 
     async def get_multi(
@@ -243,7 +243,7 @@ class CRUDSync(CRUDBaseOrganization[Sync, SyncCreate, SyncUpdate]):
 
         # Validate permissions for each sync
         for sync in syncs:
-            await self._validate_organization_access(ctx, sync.organization_id)
+            self._validate_organization_access(ctx, sync.organization_id)
 
         # Enrich all syncs in a single efficient query
         return await self.enricher_for_all(db, syncs)
@@ -275,7 +275,7 @@ class CRUDSync(CRUDBaseOrganization[Sync, SyncCreate, SyncUpdate]):
 
         # Validate permissions for each sync
         for sync in syncs:
-            await self._validate_organization_access(ctx, sync.organization_id)
+            self._validate_organization_access(ctx, sync.organization_id)
 
         # Enrich all syncs in a single efficient query
         return await self.enricher_for_all(db, syncs)
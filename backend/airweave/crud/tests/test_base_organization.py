@@ -0,0 +1,175 @@
+"""Unit tests for CRUDBaseOrganization bulk operations.
+
+Tests cover:
+- create_many returns rows in input order
+- create_many stamps organization and tracking columns on every row
+- create_many with no input skips the database
+- update_many leaves every object loaded after its commit
+- update stamps modified_by_email only when a field changes
+- remove goes through the ORM when the mapper has delete listeners
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, DateTime, String, Uuid, event, inspect
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from airweave.core.datetime_utils import utc_now_naive
+from airweave.crud._base_organization import CRUDBaseOrganization
+
+ORG_ID = uuid.uuid4()
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Widget(_Base):
+    """Minimal organization-scoped model with user tracking columns."""
+
+    __tablename__ = "widget"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    organization_id = Column(Uuid, nullable=False)
+    name = Column(String, nullable=False)
+    created_by_email = Column(String, nullable=True)
+    modified_by_email = Column(String, nullable=True)
+    modified_at = Column(DateTime, default=utc_now_naive, onupdate=utc_now_naive)
+
+
+class _Gadget(_Base):
+    """Organization-scoped model with a ``before_delete`` listener."""
+
+    __tablename__ = "gadget"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    organization_id = Column(Uuid, nullable=False)
+    name = Column(String, nullable=False)
+
+
+_deleted_gadgets: list[str] = []
+
+
+@event.listens_for(_Gadget, "before_delete")
+def _record_gadget_delete(mapper, connection, target):
+    _deleted_gadgets.append(target.name)
+
+
+def _make_ctx():
+    """Build a stub user context with access to ORG_ID only."""
+    ctx = MagicMock()
+    ctx.organization.id = ORG_ID
+    ctx.has_user_context = True
+    ctx.tracking_email = "user@example.com"
+    ctx.user.is_admin = False
+    ctx.user_organization_ids = frozenset({ORG_ID})
+    return ctx
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=True)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def crud():
+    return CRUDBaseOrganization(_Widget)
+
+
+@pytest.fixture
+def gadget_crud():
+    return CRUDBaseOrganization(_Gadget, track_user=False)
+
+
+@pytest.mark.asyncio
+async def test_create_many_preserves_input_order(db, crud):
+    """Returned objects line up with the input rows."""
+    names = [f"widget-{i}" for i in range(10)]
+
+    created = await crud.create_many(db, objs_in=[{"name": n} for n in names], ctx=_make_ctx())
+
+    assert [w.name for w in created] == names
+
+
+@pytest.mark.asyncio
+async def test_create_many_stamps_organization_and_tracking(db, crud):
+    """Every row gets the context's organization and tracking email."""
+    created = await crud.create_many(db, objs_in=[{"name": "a"}, {"name": "b"}], ctx=_make_ctx())
+
+    assert {w.organization_id for w in created} == {ORG_ID}
+    assert {w.created_by_email for w in created} == {"user@example.com"}
+    assert {w.modified_by_email for w in created} == {"user@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_create_many_empty_skips_database(crud):
+    """No input means no statement and no commit."""
+    db = AsyncMock()
+
+    assert await crud.create_many(db, objs_in=[], ctx=_make_ctx()) == []
+    db.scalars.assert_not_called()
+    db.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_many_refreshes_objects_after_commit(db, crud):
+    """Committed updates are reloaded, so no attribute is left expired."""
+    ctx = _make_ctx()
+    created = await crud.create_many(db, objs_in=[{"name": "a"}, {"name": "b"}], ctx=ctx)
+
+    updated = await crud.update_many(
+        db,
+        updates=[(created[0], {"name": "a2"}), (created[1], {"name": "b2"})],
+        ctx=ctx,
+    )
+
+    assert all(not inspect(w).expired_attributes for w in updated)
+    assert [w.name for w in updated] == ["a2", "b2"]
+
+
+@pytest.mark.asyncio
+async def test_update_stamps_modified_by_only_on_change(db, crud):
+    """A no-op update leaves the audit column alone; a real change stamps it."""
+    (widget,) = await crud.create_many(db, objs_in=[{"name": "a"}], ctx=_make_ctx())
+    editor = _make_ctx()
+    editor.tracking_email = "editor@example.com"
+
+    await crud.update(db, db_obj=widget, obj_in={"name": "a"}, ctx=editor)
+    assert widget.modified_by_email == "user@example.com"
+
+    await crud.update(db, db_obj=widget, obj_in={"name": "b"}, ctx=editor)
+    assert widget.modified_by_email == "editor@example.com"
+
+
+@pytest.mark.asyncio
+async def test_remove_fires_delete_listeners(db, gadget_crud):
+    """A mapper with delete listeners is deleted through the session, not in bulk."""
+    ctx = _make_ctx()
+    (gadget,) = await gadget_crud.create_many(db, objs_in=[{"name": "g"}], ctx=ctx)
+    _deleted_gadgets.clear()
+
+    await gadget_crud.remove(db, id=gadget.id, ctx=ctx)
+
+    assert gadget_crud._needs_orm_delete is True
+    assert _deleted_gadgets == ["g"]
+
+
+@pytest.mark.asyncio
+async def test_remove_without_listeners_uses_bulk_delete(db, crud):
+    """Without cascades or listeners the row is deleted in one statement."""
+    ctx = _make_ctx()
+    (widget,) = await crud.create_many(db, objs_in=[{"name": "w"}], ctx=ctx)
+
+    removed = await crud.remove(db, id=widget.id, ctx=ctx)
+
+    assert crud._needs_orm_delete is False
+    assert removed.name == "w"
@@ -0,0 +1,72 @@
+"""Unit tests for CRUDPublic.
+
+Tests cover:
+- update_fields sets the given columns and commits
+- update_fields rejects names that are not mapped columns
+"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, String, Uuid
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from airweave.crud._base_public import CRUDPublic
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Thing(_Base):
+    """Minimal public model."""
+
+    __tablename__ = "thing"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    name = Column(String, nullable=False)
+    status = Column(String, nullable=True)
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=True)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def thing(db):
+    obj = _Thing(name="t")
+    db.add(obj)
+    await db.commit()
+    await db.refresh(obj)
+    return obj
+
+
+@pytest.fixture
+def crud():
+    return CRUDPublic(_Thing)
+
+
+@pytest.mark.asyncio
+async def test_update_fields_sets_columns(db, crud, thing):
+    """Known columns are written and committed."""
+    updated = await crud.update_fields(db, db_obj=thing, status="active")
+
+    assert updated.status == "active"
+    assert (await crud.get(db, id=thing.id)).status == "active"
+
+
+@pytest.mark.asyncio
+async def test_update_fields_rejects_unknown_names(db, crud, thing):
+    """A misspelled field raises instead of setting a stray attribute."""
+    with pytest.raises(AttributeError, match="statu"):
+        await crud.update_fields(db, db_obj=thing, statu="active")
+
+    assert not hasattr(thing, "statu")
@@ -1,6 +1,6 @@
 """Initialize the database with native connections."""
 
-from sqlalchemy import text
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.core.constants.reserved_ids import (
@@ -10,6 +10,10 @@ from airweave.core.constants.reserved_ids import (
 from airweave.core.shared_models import ConnectionStatus, IntegrationType
 from airweave.models.connection import Connection
 
+# Stable key for the transaction-scoped advisory lock that serializes native
+# connection initialization across concurrently starting replicas.
+_NATIVE_CONNECTIONS_LOCK_KEY = 0x41697277_4E617469  # "AirwNati"
+
 
 async def init_db_with_native_connections(db: AsyncSession) -> None:
     """Initialize the database with native connections.
@@ -43,26 +47,30 @@ async def init_db_with_native_connections(db: AsyncSession) -> None:
         },
     }
 
-    # Create connections if they don't exist
-    for short_name, connection_data in native_connections.items():
-        # Check if connection already exists
-        result = await db.execute(
-            text("SELECT id FROM connection WHERE short_name = :short_name"),
-            {"short_name": short_name},
-        )
-        existing_connection = result.scalar_one_or_none()
+    # Serialize concurrent startups (e.g. rolling restarts) so two replicas
+    # cannot both see a connection missing and insert it twice. Released on
+    # commit below.
+    await db.execute(select(func.pg_advisory_xact_lock(_NATIVE_CONNECTIONS_LOCK_KEY)))
 
-        if not existing_connection:
-            connection = Connection(
-                id=connection_data["id"],
-                name=connection_data["name"],
-                readable_id=connection_data["readable_id"],
-                integration_type=connection_data["integration_type"],
-                short_name=connection_data["short_name"],
-                status=connection_data["status"],
-                # organization_id, created_by_email, and modified_by_email are
-                # intentionally NULL for native connections
-            )
-            db.add(connection)
+    # One round-trip to find which native connections already exist
+    result = await db.execute(
+        select(Connection.short_name).where(Connection.short_name.in_(list(native_connections)))
+    )
+    existing = set(result.scalars())
+
+    db.add_all(
+        Connection(
+            id=connection_data["id"],
+            name=connection_data["name"],
+            readable_id=connection_data["readable_id"],
+            integration_type=connection_data["integration_type"],
+            short_name=connection_data["short_name"],
+            status=connection_data["status"],
+            # organization_id, created_by_email, and modified_by_email are
+            # intentionally NULL for native connections
+        )
+        for short_name, connection_data in native_connections.items()
+        if short_name not in existing
+    )
 
     await db.commit()
@@ -56,6 +56,10 @@ async_engine = create_async_engine(
     connect_args=connect_args_config,
 )
 
+# The engine (and so its connection pool) and this session factory are
+# process-wide singletons created at import. Always open sessions from
+# AsyncSessionLocal (or get_db / get_db_context); never create an engine or
+# sessionmaker per request, which would bypass the sized pool above.
 AsyncSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=async_engine)
 
 # Dedicated engine for health checks — isolated from the application pool so that
@@ -84,15 +88,10 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             await db.execute(...)
 
     """
+    # The session closes on exit; a connection the server already dropped
+    # (e.g. idle-in-transaction timeout) is invalidated by the pool on return.
     async with AsyncSessionLocal() as db:
-        try:
-            yield db
-        finally:
-            try:
-                await db.close()
-            except Exception:
-                # Connection may have been closed by server due to idle timeout; ignore on close
-                pass
+        yield db
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -103,12 +102,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         AsyncSession: An async database session
 
     """
+    # The session closes on exit; a connection the server already dropped
+    # (e.g. idle-in-transaction timeout) is invalidated by the pool on return.
     async with AsyncSessionLocal() as db:
-        try:
-            yield db
-        finally:
-            try:
-                await db.close()
-            except Exception:
-                # Connection may have been closed by server due to idle timeout; ignore on close
-                pass
+        yield db
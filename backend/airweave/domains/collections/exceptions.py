@@ -17,3 +17,12 @@ class CollectionAlreadyExistsError(Exception):
         """Initialize with the duplicate readable_id."""
         self.readable_id = readable_id
         super().__init__(f"Collection with readable_id '{readable_id}' already exists")
+
+
+class InvalidCollectionCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        """Initialize with the rejected cursor."""
+        self.cursor = cursor
+        super().__init__("Invalid collection cursor")
@@ -1,6 +1,6 @@
 """Fake collection repository for testing."""
 
-from typing import Any, Optional
+from typing import Any, Optional, cast
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from airweave import schemas
 from airweave.api.context import ApiContext
 from airweave.db.unit_of_work import UnitOfWork
+from airweave.domains.collections.pagination import CollectionCursor
 from airweave.domains.collections.protocols import CollectionListResult
 from airweave.models.collection import Collection
 
@@ -41,6 +42,14 @@ class FakeCollectionRepository:
         self._calls.append(("get_by_readable_id", db, readable_id, ctx))
         return self._readable_store.get(readable_id)
 
+    async def resolve_id(
+        self, db: AsyncSession, readable_id: str, ctx: ApiContext
+    ) -> Optional[UUID]:
+        """Return the ID of the seeded collection for a readable ID."""
+        self._calls.append(("resolve_id", db, readable_id, ctx))
+        obj = self._readable_store.get(readable_id)
+        return cast(UUID, obj.id) if obj is not None else None
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -49,9 +58,10 @@ class FakeCollectionRepository:
         skip: int = 0,
         limit: int = 100,
         search_query: Optional[str] = None,
+        cursor: Optional[CollectionCursor] = None,
     ) -> CollectionListResult:
         """Return seeded collections with optional search filter."""
-        self._calls.append(("get_multi", db, ctx, skip, limit, search_query))
+        self._calls.append(("get_multi", db, ctx, skip, limit, search_query, cursor))
         items = list(self._readable_store.values())
         if search_query:
             q = search_query.lower()
@@ -60,6 +70,10 @@ class FakeCollectionRepository:
                 for c in items
                 if q in getattr(c, "name", "").lower() or q in getattr(c, "readable_id", "").lower()
             ]
+        if cursor is not None:
+            ids = [c.id for c in items]
+            start = ids.index(cursor.id) + 1 if cursor.id in ids else len(items)
+            return CollectionListResult(collections=items[start : start + limit])
         return CollectionListResult(collections=items[skip : skip + limit])
 
     async def count(
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from airweave import schemas
 from airweave.api.context import ApiContext
 from airweave.domains.collections.exceptions import CollectionNotFoundError
+from airweave.domains.collections.pagination import CollectionCursor
 
 
 class FakeCollectionService:
@@ -45,10 +46,15 @@ class FakeCollectionService:
         skip: int = 0,
         limit: int = 100,
         search_query: Optional[str] = None,
+        cursor: Optional[CollectionCursor] = None,
     ) -> List[schemas.Collection]:
         """Return seeded collections."""
-        self._calls.append(("list", db, ctx, skip, limit, search_query))
-        return list(self._readable_store.values())[skip : skip + limit]
+        self._calls.append(("list", db, ctx, skip, limit, search_query, cursor))
+        items = list(self._readable_store.values())
+        if cursor is not None:
+            ids = [c.id for c in items]
+            skip = ids.index(cursor.id) + 1 if cursor.id in ids else len(items)
+        return items[skip : skip + limit]
 
     async def count(
         self, db: AsyncSession, *, ctx: ApiContext, search_query: Optional[str] = None
@@ -0,0 +1,52 @@
+"""Keyset pagination cursor for collection listings.
+
+Collections are listed newest first, ordered by ``(created_at, id)``.  A
+cursor captures the last row of a page so the next page is a bounded
+index seek (``WHERE (created_at, id) < cursor``) rather than an
+``OFFSET`` scan that grows with page depth.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from airweave.domains.collections.exceptions import InvalidCollectionCursorError
+
+_SEPARATOR = "|"
+
+
+@dataclass(frozen=True)
+class CollectionCursor:
+    """Position of the last collection on a page."""
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """Serialize to an opaque, URL-safe token."""
+        raw = f"{self.created_at.isoformat()}{_SEPARATOR}{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "CollectionCursor":
+        """Parse a token produced by :meth:`encode`.
+
+        ``created_at`` is stored as naive UTC, so a token carrying a timezone
+        offset was not produced by :meth:`encode` and is rejected rather than
+        compared against naive column values.
+
+        Raises:
+            InvalidCollectionCursorError: If the token is malformed.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            created_at_raw, id_ = raw.split(_SEPARATOR)
+            created_at = datetime.fromisoformat(created_at_raw)
+            if created_at.tzinfo is not None:
+                raise ValueError("cursor timestamp must be naive UTC")
+            return cls(created_at=created_at, id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCollectionCursorError(token) from e
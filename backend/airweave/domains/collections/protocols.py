@@ -10,6 +10,7 @@ from airweave import schemas
 from airweave.api.context import ApiContext
 from airweave.core.context import BaseContext
 from airweave.db.unit_of_work import UnitOfWork
+from airweave.domains.collections.pagination import CollectionCursor
 from airweave.models.collection import Collection
 from airweave.models.vector_db_deployment_metadata import VectorDbDeploymentMetadata
 from airweave.schemas.collection import SourceConnectionSummary
@@ -36,6 +37,12 @@ class CollectionRepositoryProtocol(Protocol):
         """Get a collection by human-readable ID within an organization."""
         ...
 
+    async def resolve_id(
+        self, db: AsyncSession, readable_id: str, ctx: ApiContext
+    ) -> Optional[UUID]:
+        """Resolve a human-readable ID to a collection ID, or None if not found."""
+        ...
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -44,8 +51,13 @@ class CollectionRepositoryProtocol(Protocol):
         skip: int = 0,
         limit: int = 100,
         search_query: Optional[str] = None,
+        cursor: Optional[CollectionCursor] = None,
     ) -> CollectionListResult:
-        """Get multiple collections with pagination and optional search."""
+        """Get multiple collections with pagination and optional search.
+
+        When ``cursor`` is given, ``skip`` is ignored and the page starts
+        right after the cursor position.
+        """
         ...
 
     async def count(
@@ -100,8 +112,13 @@ class CollectionServiceProtocol(Protocol):
         skip: int = 0,
         limit: int = 100,
         search_query: Optional[str] = None,
+        cursor: Optional[CollectionCursor] = None,
     ) -> List[schemas.Collection]:
-        """List collections with pagination and optional search."""
+        """List collections with pagination and optional search.
+
+        When ``cursor`` is given, ``skip`` is ignored and the page starts
+        right after the cursor position.
+        """
         ...
 
     async def count(
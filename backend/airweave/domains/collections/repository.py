@@ -1,6 +1,8 @@
 """Collection repository wrapping crud.collection with ephemeral status enrichment."""
 
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, cast
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +12,7 @@ from airweave.api.context import ApiContext
 from airweave.core.exceptions import NotFoundException
 from airweave.core.shared_models import CollectionStatus
 from airweave.db.unit_of_work import UnitOfWork
+from airweave.domains.collections.pagination import CollectionCursor
 from airweave.domains.collections.protocols import (
     CollectionListResult,
     CollectionRepositoryProtocol,
@@ -19,6 +22,11 @@ from airweave.domains.sources.protocols import SourceRegistryProtocol
 from airweave.models.collection import Collection
 from airweave.schemas.collection import SourceConnectionSummary
 
+# readable_id -> id is immutable for a collection's lifetime, so the only way
+# an entry goes stale is a delete in another process; the TTL bounds that.
+_ID_CACHE_TTL_SECONDS = 300.0
+_ID_CACHE_MAX_ENTRIES = 10_000
+
 
 class CollectionRepository(CollectionRepositoryProtocol):
     """Delegates to crud.collection, enriches with ephemeral status."""
@@ -30,6 +38,7 @@ class CollectionRepository(CollectionRepositoryProtocol):
     ) -> None:
         self._source_registry = source_registry
         self._sc_repo = sc_repo
+        self._id_cache: OrderedDict[tuple[UUID, str], tuple[float, UUID]] = OrderedDict()
 
     def _federated_lookup(self, short_name: str) -> bool:
         try:
@@ -86,7 +95,7 @@ class CollectionRepository(CollectionRepositoryProtocol):
 
         collection_ids = [c.readable_id for c in collections]
 
-        all_connections = await self._sc_repo.get_by_collection_ids(
+        all_connections, last_jobs = await self._sc_repo.get_by_collection_ids_with_last_jobs(
             db,
             organization_id=ctx.organization.id,
             readable_collection_ids=collection_ids,
@@ -97,8 +106,6 @@ class CollectionRepository(CollectionRepositoryProtocol):
                 collection.status = CollectionStatus.NEEDS_SOURCE
             return CollectionListResult(collections=collections)
 
-        last_jobs = await self._sc_repo.fetch_last_jobs(db, all_connections)
-
         connections_by_collection: Dict[str, List[Dict[str, Any]]] = {}
         for sc in all_connections:
             coll_id = sc.readable_collection_id
@@ -152,6 +159,45 @@ class CollectionRepository(CollectionRepositoryProtocol):
             collection = result.collections[0]
         return collection
 
+    async def resolve_id(
+        self, db: AsyncSession, readable_id: str, ctx: ApiContext
+    ) -> Optional[UUID]:
+        """Resolve a readable ID to a collection ID, cached per organization.
+
+        Skips the ephemeral status enrichment done by ``get_by_readable_id``,
+        so a cache miss costs a single query and a hit costs none.
+
+        The lookup itself is not scoped to the organization (admins and
+        multi-org users may resolve another organization's collection), and
+        a hit skips the access check, so only collections owned by
+        ``ctx.organization`` are cached.
+        """
+        key = (ctx.organization.id, readable_id)
+        cached = self._id_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _ID_CACHE_TTL_SECONDS:
+            self._id_cache.move_to_end(key)
+            return cached[1]
+
+        try:
+            collection = await crud.collection.get_by_readable_id(
+                db, readable_id=readable_id, ctx=ctx
+            )
+        except NotFoundException:
+            collection = None
+        if collection is None:
+            self._id_cache.pop(key, None)
+            return None
+
+        collection_id = cast(UUID, collection.id)
+        if collection.organization_id != ctx.organization.id:
+            return collection_id
+        self._id_cache[key] = (now, collection_id)
+        self._id_cache.move_to_end(key)
+        if len(self._id_cache) > _ID_CACHE_MAX_ENTRIES:
+            self._id_cache.popitem(last=False)
+        return collection_id
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -160,10 +206,16 @@ class CollectionRepository(CollectionRepositoryProtocol):
         skip: int = 0,
         limit: int = 100,
         search_query: Optional[str] = None,
+        cursor: Optional[CollectionCursor] = None,
     ) -> CollectionListResult:
         """Get multiple collections with pagination, optional search, and ephemeral status."""
         collections = await crud.collection.get_multi(
-            db, ctx=ctx, skip=skip, limit=limit, search_query=search_query
+            db,
+            ctx=ctx,
+            skip=skip,
+            limit=limit,
+            search_query=search_query,
+            after=(cursor.created_at, cursor.id) if cursor else None,
         )
         return await self._attach_ephemeral_status(db, collections, ctx)
 
@@ -197,4 +249,7 @@ class CollectionRepository(CollectionRepositoryProtocol):
 
     async def remove(self, db: AsyncSession, *, id: UUID, ctx: ApiContext) -> Optional[Collection]:
         """Delete a collection by ID."""
-        return await crud.collection.remove(db, id=id, ctx=ctx)
+        removed = await crud.collection.remove(db, id=id, ctx=ctx)
+        for key in [k for k, (_, cid) in self._id_cache.items() if cid == id]:
+            del self._id_cache[key]
+        return removed
@@ -1,6 +1,8 @@
 """Collection service — domain logic for collection lifecycle."""
 
+import time
 from typing import List, Optional
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +16,7 @@ from airweave.domains.collections.exceptions import (
     CollectionAlreadyExistsError,
     CollectionNotFoundError,
 )
+from airweave.domains.collections.pagination import CollectionCursor
 from airweave.domains.collections.protocols import (
     CollectionRepositoryProtocol,
     CollectionServiceProtocol,
@@ -25,6 +28,12 @@ from airweave.domains.syncs.protocols import SyncServiceProtocol
 from airweave.models.collection import Collection
 from airweave.schemas.collection import SourceConnectionSummary
 
+# Counts at or above this size are cached; smaller orgs always get an exact,
+# cheap COUNT(*) so their UI pagination reflects mutations immediately.
+_COUNT_CACHE_MIN_TOTAL = 1_000
+_COUNT_CACHE_TTL_SECONDS = 60.0
+_COUNT_CACHE_MAX_ENTRIES = 1_024
+
 
 class CollectionService(CollectionServiceProtocol):
     """Domain service for collection lifecycle operations."""
@@ -47,17 +56,29 @@ class CollectionService(CollectionServiceProtocol):
         self._settings = settings
         self._deployment_metadata_repo = deployment_metadata_repo
         self._dense_registry = dense_registry
+        # (organization_id, search_query) -> (stored_at, total)
+        self._count_cache: dict[tuple[UUID, Optional[str]], tuple[float, int]] = {}
+
+    def _invalidate_counts(self, organization_id: UUID) -> None:
+        """Drop cached collection counts for an organization."""
+        for key in [k for k in self._count_cache if k[0] == organization_id]:
+            del self._count_cache[key]
 
     def _to_response(
         self,
         db_obj: Collection,
         source_connection_summaries: Optional[List[SourceConnectionSummary]] = None,
     ) -> schemas.Collection:
-        """Convert an ORM Collection to a CollectionResponse with embedding metadata."""
+        """Convert an ORM Collection to a CollectionResponse with embedding metadata.
+
+        The record is validated once from the ORM row; the response is then
+        assembled with ``model_construct`` from those already-validated field
+        values instead of dumping and re-validating every field.
+        """
         vd = db_obj.vector_db_deployment_metadata
         base = schemas.CollectionRecord.model_validate(db_obj, from_attributes=True)
-        return schemas.Collection(
-            **base.model_dump(),
+        return schemas.Collection.model_construct(
+            **dict(base),
             vector_size=vd.embedding_dimensions,
             embedding_model_name=self._dense_registry.get(vd.dense_embedder).api_model_name,
             source_connection_summaries=source_connection_summaries or [],
@@ -71,10 +92,11 @@ class CollectionService(CollectionServiceProtocol):
         skip: int = 0,
         limit: int = 100,
         search_query: Optional[str] = None,
+        cursor: Optional[CollectionCursor] = None,
     ) -> List[schemas.Collection]:
         """List collections with pagination and optional search."""
         result = await self._collection_repo.get_multi(
-            db, ctx=ctx, skip=skip, limit=limit, search_query=search_query
+            db, ctx=ctx, skip=skip, limit=limit, search_query=search_query, cursor=cursor
         )
         return [
             self._to_response(c, result.summaries_by_collection.get(c.readable_id, []))
@@ -84,8 +106,23 @@ class CollectionService(CollectionServiceProtocol):
     async def count(
         self, db: AsyncSession, *, ctx: ApiContext, search_query: Optional[str] = None
     ) -> int:
-        """Get total count of collections."""
-        return await self._collection_repo.count(db, ctx=ctx, search_query=search_query)
+        """Get total count of collections.
+
+        Large totals are cached in-process for a short TTL; the COUNT(*)
+        scan is the dominant cost of paginating big organizations.
+        """
+        key = (ctx.organization.id, search_query)
+        cached = self._count_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _COUNT_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        total = await self._collection_repo.count(db, ctx=ctx, search_query=search_query)
+        if total >= _COUNT_CACHE_MIN_TOTAL:
+            if len(self._count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+                self._count_cache.clear()
+            self._count_cache[key] = (now, total)
+        return total
 
     async def create(
         self,
@@ -115,6 +152,8 @@ class CollectionService(CollectionServiceProtocol):
             await uow.session.flush()
             result = self._to_response(collection)
 
+        self._invalidate_counts(ctx.organization.id)
+
         # Publish event
         try:
             await self._event_bus.publish(
@@ -198,6 +237,7 @@ class CollectionService(CollectionServiceProtocol):
 
         # CASCADE-delete the collection and all child objects
         await self._collection_repo.remove(db, id=result.id, ctx=ctx)
+        self._invalidate_counts(ctx.organization.id)
 
         # Publish event
         try:
@@ -0,0 +1,33 @@
+"""Unit tests for the collection keyset pagination cursor."""
+
+import base64
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from airweave.domains.collections.exceptions import InvalidCollectionCursorError
+from airweave.domains.collections.pagination import CollectionCursor
+
+
+def test_cursor_round_trips():
+    cursor = CollectionCursor(created_at=datetime(2024, 1, 15, 9, 30, 0, 123456), id=uuid4())
+    assert CollectionCursor.decode(cursor.encode()) == cursor
+
+
+def test_encoded_cursor_is_url_safe():
+    token = CollectionCursor(created_at=datetime(2024, 1, 15), id=uuid4()).encode()
+    assert all(c.isalnum() or c in "-_" for c in token)
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "!!!", "Zm9vfGJhcg"])
+def test_malformed_cursor_raises(token):
+    with pytest.raises(InvalidCollectionCursorError):
+        CollectionCursor.decode(token)
+
+
+def test_timezone_aware_cursor_raises():
+    raw = f"2024-01-15T09:30:00+02:00|{uuid4()}"
+    token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+    with pytest.raises(InvalidCollectionCursorError):
+        CollectionCursor.decode(token)
@@ -7,6 +7,7 @@ from uuid import uuid4
 
 import pytest
 
+from airweave.core.exceptions import NotFoundException
 from airweave.core.shared_models import CollectionStatus
 from airweave.domains.collections.protocols import CollectionListResult
 from airweave.domains.collections.repository import CollectionRepository
@@ -321,8 +322,6 @@ class TestDelegatingMethods:
         repo = _repo()
 
         with patch("airweave.domains.collections.repository.crud") as mock_crud:
-            from airweave.core.exceptions import NotFoundException
-
             mock_crud.collection.get_by_readable_id = AsyncMock(
                 side_effect=NotFoundException("not found")
             )
@@ -366,3 +365,85 @@ class TestDelegatingMethods:
 
         assert result is expected
         mock_attach.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# resolve_id (cached readable_id -> id)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+class TestResolveId:
+    async def test_caches_per_organization(self):
+        repo = _repo()
+        ctx = MagicMock()
+        ctx.organization.id = uuid4()
+        col = MagicMock()
+        col.id = uuid4()
+        col.organization_id = ctx.organization.id
+
+        with patch("airweave.domains.collections.repository.crud") as mock_crud:
+            mock_crud.collection.get_by_readable_id = AsyncMock(return_value=col)
+
+            first = await repo.resolve_id(MagicMock(), "found", ctx)
+            second = await repo.resolve_id(MagicMock(), "found", ctx)
+
+        assert first == second == col.id
+        mock_crud.collection.get_by_readable_id.assert_awaited_once()
+
+    async def test_not_found_is_not_cached(self):
+        repo = _repo()
+        ctx = MagicMock()
+        ctx.organization.id = uuid4()
+
+        with patch("airweave.domains.collections.repository.crud") as mock_crud:
+            mock_crud.collection.get_by_readable_id = AsyncMock(
+                side_effect=NotFoundException("not found")
+            )
+
+            assert await repo.resolve_id(MagicMock(), "nope", ctx) is None
+            assert await repo.resolve_id(MagicMock(), "nope", ctx) is None
+
+        assert mock_crud.collection.get_by_readable_id.await_count == 2
+
+    async def test_remove_invalidates_cached_id(self):
+        repo = _repo()
+        ctx = MagicMock()
+        ctx.organization.id = uuid4()
+        col = MagicMock()
+        col.id = uuid4()
+        col.organization_id = ctx.organization.id
+
+        with patch("airweave.domains.collections.repository.crud") as mock_crud:
+            mock_crud.collection.get_by_readable_id = AsyncMock(return_value=col)
+            mock_crud.collection.remove = AsyncMock(return_value=col)
+
+            await repo.resolve_id(MagicMock(), "found", ctx)
+            await repo.remove(MagicMock(), id=col.id, ctx=ctx)
+            await repo.resolve_id(MagicMock(), "found", ctx)
+
+        assert mock_crud.collection.get_by_readable_id.await_count == 2
+
+    async def test_other_organizations_collection_is_not_cached(self):
+        """An admin resolving another org's collection must not fill that org's key."""
+        repo = _repo()
+        org_a, org_b = uuid4(), uuid4()
+        col = MagicMock()
+        col.id = uuid4()
+        col.organization_id = org_b
+        admin_ctx = MagicMock()
+        admin_ctx.organization.id = org_a
+        api_key_ctx = MagicMock()
+        api_key_ctx.organization.id = org_a
+
+        with patch("airweave.domains.collections.repository.crud") as mock_crud:
+            mock_crud.collection.get_by_readable_id = AsyncMock(return_value=col)
+            assert await repo.resolve_id(MagicMock(), "shared", admin_ctx) == col.id
+
+            # The API key for org A has no access to B; the lookup rejects it.
+            mock_crud.collection.get_by_readable_id = AsyncMock(
+                side_effect=NotFoundException("not found")
+            )
+            assert await repo.resolve_id(MagicMock(), "shared", api_key_ctx) is None
+
+        mock_crud.collection.get_by_readable_id.assert_awaited_once()
@@ -22,6 +22,7 @@ from airweave.domains.collections.fakes.repository import FakeCollectionReposito
 from airweave.domains.collections.fakes.vector_db_deployment_metadata_repository import (
     FakeVectorDbDeploymentMetadataRepository,
 )
+from airweave.domains.collections.pagination import CollectionCursor
 from airweave.domains.collections.service import CollectionService
 from airweave.domains.embedders.fakes.registry import FakeDenseEmbedderRegistry
 from airweave.domains.embedders.types import DenseEmbedderEntry
@@ -109,7 +110,7 @@ def _fake_dense_registry() -> FakeDenseEmbedderRegistry:
             max_dimensions=3072,
             max_tokens=8191,
             supports_matryoshka=True,
-            embedder_class_ref=object,
+            embedder_class_path="builtins:object",
         )
     )
     registry.seed(
@@ -123,7 +124,7 @@ def _fake_dense_registry() -> FakeDenseEmbedderRegistry:
             max_dimensions=1536,
             max_tokens=8191,
             supports_matryoshka=True,
-            embedder_class_ref=object,
+            embedder_class_path="builtins:object",
         )
     )
     return registry
@@ -191,6 +192,20 @@ async def test_list_skip_limit():
     assert len(result) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_cursor_starts_after_cursor_row():
+    """list() with a cursor returns the rows after the cursor position."""
+    repo = FakeCollectionRepository()
+    cols = [_collection(id=uuid4(), readable_id=f"col-{i}") for i in range(4)]
+    for c in cols:
+        repo.seed_readable(c.readable_id, c)
+
+    svc = _build_service(collection_repo=repo)
+    cursor = CollectionCursor(created_at=NOW, id=cols[1].id)
+    result = await svc.list(MagicMock(), ctx=_ctx(), skip=3, limit=2, cursor=cursor)
+    assert [r.readable_id for r in result] == ["col-2", "col-3"]
+
+
 @pytest.mark.asyncio
 async def test_list_search_query_passed_through():
     """list() passes search_query to repo."""
@@ -242,6 +257,30 @@ async def test_count_search_query_passed_through():
     assert result == 1
 
 
+@pytest.mark.asyncio
+async def test_count_caches_large_totals():
+    """count() serves large totals from cache on repeat calls."""
+    repo = FakeCollectionRepository()
+    repo.count = AsyncMock(return_value=5_000)
+
+    svc = _build_service(collection_repo=repo)
+    assert await svc.count(MagicMock(), ctx=_ctx()) == 5_000
+    assert await svc.count(MagicMock(), ctx=_ctx()) == 5_000
+    repo.count.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_count_does_not_cache_small_totals():
+    """count() always hits the repo for small organizations."""
+    repo = FakeCollectionRepository()
+    repo.count = AsyncMock(return_value=3)
+
+    svc = _build_service(collection_repo=repo)
+    await svc.count(MagicMock(), ctx=_ctx())
+    await svc.count(MagicMock(), ctx=_ctx())
+    assert repo.count.await_count == 2
+
+
 # ---------------------------------------------------------------------------
 # create() tests
 # ---------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Fake connection repository for testing."""
 
+from collections import deque
 from typing import Optional, Union
 from uuid import UUID, uuid4
 
@@ -11,15 +12,22 @@ from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.connection import Connection
 from airweave.schemas.connection import ConnectionCreate, ConnectionUpdate
 
+_MAX_RECORDED_CALLS = 10_000
+
 
 class FakeConnectionRepository:
     """In-memory fake for ConnectionRepositoryProtocol."""
 
-    def __init__(self) -> None:
-        """Initialize empty in-memory stores."""
+    def __init__(self, record_calls: bool = True) -> None:
+        """Initialize empty in-memory stores.
+
+        Args:
+            record_calls: Keep a bounded log of calls in ``_calls``.
+                Disable for tests that never inspect it.
+        """
         self._store: dict[UUID, Connection] = {}
         self._readable_store: dict[str, Connection] = {}
-        self._calls: list[tuple] = []
+        self._calls: deque[tuple] = deque(maxlen=_MAX_RECORDED_CALLS if record_calls else 0)
 
     def seed(self, id: UUID, obj: Connection) -> None:
         """Pre-populate a connection by ID."""
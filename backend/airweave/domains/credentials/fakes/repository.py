@@ -1,5 +1,6 @@
 """Fake integration credential repository for testing."""
 
+from collections import deque
 from typing import Optional, Union
 from uuid import UUID, uuid4
 
@@ -13,13 +14,15 @@ from airweave.schemas.integration_credential import (
     IntegrationCredentialUpdate,
 )
 
+_MAX_RECORDED_CALLS = 10_000
+
 
 class FakeIntegrationCredentialRepository:
     """In-memory fake for IntegrationCredentialRepositoryProtocol."""
 
-    def __init__(self) -> None:
+    def __init__(self, record_calls: bool = True) -> None:
         self._store: dict[UUID, IntegrationCredential] = {}
-        self._calls: list[tuple] = []
+        self._calls: deque[tuple] = deque(maxlen=_MAX_RECORDED_CALLS if record_calls else 0)
 
     def seed(self, id: UUID, obj: IntegrationCredential) -> None:
         self._store[id] = obj
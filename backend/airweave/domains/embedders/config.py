@@ -7,8 +7,11 @@ Startup validation ensures they exist in the registry, dimensions are valid,
 credentials are present, and the DB deployment metadata row is consistent.
 """
 
+from typing import Any
+
 import httpx
-from sqlalchemy import select
+from sqlalchemy import Result, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.core.config import settings
@@ -52,14 +55,11 @@ def validate_embedding_config_sync(
     Raises:
         EmbeddingConfigError on any mismatch.
     """
-    dense_names = [e.short_name for e in dense_registry.list_all()]
-    sparse_names = [e.short_name for e in sparse_registry.list_all()]
-
     # Check required settings are present
     if not DENSE_EMBEDDER:
         raise EmbeddingConfigError(
             f"Required environment variable 'DENSE_EMBEDDER' is not set. "
-            f"Add it to your .env file.\n  Available options: {', '.join(dense_names)}"
+            f"Add it to your .env file.\n  Available options: {_available(dense_registry)}"
         )
     if not EMBEDDING_DIMENSIONS:
         raise EmbeddingConfigError(
@@ -69,7 +69,7 @@ def validate_embedding_config_sync(
     if not SPARSE_EMBEDDER:
         raise EmbeddingConfigError(
             f"Required environment variable 'SPARSE_EMBEDDER' is not set. "
-            f"Add it to your .env file.\n  Available options: {', '.join(sparse_names)}"
+            f"Add it to your .env file.\n  Available options: {_available(sparse_registry)}"
         )
 
     # Check embedder names exist in registry
@@ -78,7 +78,7 @@ def validate_embedding_config_sync(
     except KeyError:
         raise EmbeddingConfigError(
             f"Dense embedder '{DENSE_EMBEDDER}' not found in registry. "
-            f"Available options: {', '.join(dense_names)}"
+            f"Available options: {_available(dense_registry)}"
         )
 
     try:
@@ -86,7 +86,7 @@ def validate_embedding_config_sync(
     except KeyError:
         raise EmbeddingConfigError(
             f"Sparse embedder '{SPARSE_EMBEDDER}' not found in registry. "
-            f"Available options: {', '.join(sparse_names)}"
+            f"Available options: {_available(sparse_registry)}"
         )
 
     _validate_dimensions(dense_spec)
@@ -94,6 +94,13 @@ def validate_embedding_config_sync(
     _validate_local_reachability(dense_spec)
 
 
+def _available(
+    registry: DenseEmbedderRegistryProtocol | SparseEmbedderRegistryProtocol,
+) -> str:
+    """Comma-separated embedder names, built only when an error message needs them."""
+    return ", ".join(e.short_name for e in registry.list_all())
+
+
 async def validate_embedding_config(db: AsyncSession) -> None:
     """Reconcile embedding config against the DB deployment metadata table.
 
@@ -108,19 +115,22 @@ async def validate_embedding_config(db: AsyncSession) -> None:
 
 
 def _validate_dimensions(dense_spec: DenseEmbedderEntry) -> None:
-    """Validate EMBEDDING_DIMENSIONS against the dense embedder spec."""
-    if dense_spec.supports_matryoshka:
-        if EMBEDDING_DIMENSIONS > dense_spec.max_dimensions:
-            raise EmbeddingConfigError(
-                f"EMBEDDING_DIMENSIONS={EMBEDDING_DIMENSIONS} exceeds max_dimensions="
-                f"{dense_spec.max_dimensions} for dense embedder '{DENSE_EMBEDDER}'."
-            )
-    elif EMBEDDING_DIMENSIONS != dense_spec.max_dimensions:
-        raise EmbeddingConfigError(
-            f"Dense embedder '{DENSE_EMBEDDER}' does not support Matryoshka dimensions — "
-            f"EMBEDDING_DIMENSIONS must be exactly {dense_spec.max_dimensions}, "
-            f"got {EMBEDDING_DIMENSIONS}."
-        )
+    """Validate EMBEDDING_DIMENSIONS against the dense embedder spec.
+
+    Matryoshka models accept any size up to ``max_dimensions``; all others
+    require exactly ``max_dimensions``.
+    """
+    max_dims = dense_spec.max_dimensions
+    matryoshka = dense_spec.supports_matryoshka
+    if EMBEDDING_DIMENSIONS <= max_dims and (matryoshka or EMBEDDING_DIMENSIONS == max_dims):
+        return
+
+    allowed = f"at most {max_dims}" if matryoshka else f"exactly {max_dims}"
+    raise EmbeddingConfigError(
+        f"EMBEDDING_DIMENSIONS={EMBEDDING_DIMENSIONS} is invalid for dense embedder "
+        f"'{DENSE_EMBEDDER}' (max_dimensions={max_dims}, "
+        f"supports_matryoshka={matryoshka}): must be {allowed}."
+    )
 
 
 def _validate_credentials(
@@ -152,9 +162,7 @@ def _validate_local_reachability(dense_spec: DenseEmbedderEntry) -> None:
     endpoint with a short timeout. Raises EmbeddingConfigError with actionable
     instructions if the service is unreachable.
     """
-    from airweave.domains.embedders.dense.local import LocalDenseEmbedder
-
-    if dense_spec.embedder_class_ref is not LocalDenseEmbedder:
+    if dense_spec.class_name != "LocalDenseEmbedder":
         return
 
     inference_url = settings.TEXT2VEC_INFERENCE_URL
@@ -177,22 +185,38 @@ def _validate_local_reachability(dense_spec: DenseEmbedderEntry) -> None:
 
 async def _reconcile_db(db: AsyncSession) -> None:
     """Reconcile code config against the vector_db_deployment_metadata table."""
-    result = await db.execute(select(VectorDbDeploymentMetadata).limit(1))
-    row = result.scalar_one_or_none()
+    # Only the three compared columns are needed, so no ORM object is built.
+    stored_config = select(
+        VectorDbDeploymentMetadata.dense_embedder,
+        VectorDbDeploymentMetadata.embedding_dimensions,
+        VectorDbDeploymentMetadata.sparse_embedder,
+    ).limit(1)
+    row = (await db.execute(stored_config)).first()
 
     if row is None:
-        row = VectorDbDeploymentMetadata(
-            dense_embedder=DENSE_EMBEDDER,
-            embedding_dimensions=EMBEDDING_DIMENSIONS,
-            sparse_embedder=SPARSE_EMBEDDER,
+        # Several processes can boot against a fresh database at once; the
+        # singleton unique index lets exactly one insert win.
+        result: Result[Any] = await db.execute(
+            pg_insert(VectorDbDeploymentMetadata)
+            .values(
+                singleton=True,
+                dense_embedder=DENSE_EMBEDDER,
+                embedding_dimensions=EMBEDDING_DIMENSIONS,
+                sparse_embedder=SPARSE_EMBEDDER,
+            )
+            .on_conflict_do_nothing(index_elements=["singleton"])
+            .returning(VectorDbDeploymentMetadata.id)
         )
-        db.add(row)
+        created = result.first() is not None
         await db.commit()
-        logger.info(
-            f"[EmbeddingConfig] First deploy — created vector_db_deployment_metadata row: "
-            f"dense={DENSE_EMBEDDER}, dims={EMBEDDING_DIMENSIONS}, sparse={SPARSE_EMBEDDER}"
-        )
-        return
+        if created:
+            logger.info(
+                f"[EmbeddingConfig] First deploy — created vector_db_deployment_metadata row: "
+                f"dense={DENSE_EMBEDDER}, dims={EMBEDDING_DIMENSIONS}, sparse={SPARSE_EMBEDDER}"
+            )
+            return
+        # Another process created the row first; check ours against it.
+        row = (await db.execute(stored_config)).one()
 
     mismatches = []
     if row.dense_embedder != DENSE_EMBEDDER:
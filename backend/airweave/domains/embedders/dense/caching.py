@@ -0,0 +1,112 @@
+"""Content-addressed LRU cache in front of a dense embedder.
+
+Search traffic repeats itself: the same queries are issued again and again,
+and each one costs a provider round trip (or a local forward pass) that
+always yields the same vector. This wrapper keeps the most recent vectors in
+process, keyed by a digest of the text, and only sends misses to the
+wrapped embedder.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from airweave.domains.embedders.protocols import DenseEmbedderProtocol
+from airweave.domains.embedders.types import DenseEmbedding
+
+
+def _digest(text: str) -> bytes:
+    """Fixed-size cache key for *text*, so long inputs are not held as keys."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class CachingDenseEmbedder(DenseEmbedderProtocol):
+    """Dense embedder that serves repeated texts from an in-memory LRU cache.
+
+    The cache belongs to a single wrapped embedder, whose model and
+    dimensions are fixed, so the text digest alone identifies a vector.
+    Cached ``DenseEmbedding`` objects are shared between callers and must
+    not be mutated.
+
+    ``close`` closes the wrapped embedder.
+    """
+
+    _MAX_ENTRIES: int = 256
+
+    def __init__(self, inner: DenseEmbedderProtocol, *, max_entries: int = _MAX_ENTRIES) -> None:
+        """Initialize the caching embedder.
+
+        Args:
+            inner: The embedder that computes vectors on a cache miss.
+            max_entries: How many vectors to keep before evicting the least recent.
+        """
+        self._inner = inner
+        self._max_entries = max_entries
+        self._cache: OrderedDict[bytes, DenseEmbedding] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    @property
+    def model_name(self) -> str:
+        """The model identifier of the wrapped embedder."""
+        return self._inner.model_name
+
+    @property
+    def dimensions(self) -> int:
+        """The output vector dimensionality of the wrapped embedder."""
+        return self._inner.dimensions
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        """Embed a single text into a dense vector."""
+        results = await self.embed_many([text])
+        return results[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        """Return cached vectors and embed only the texts not seen recently."""
+        if not texts:
+            return []
+
+        keys = [_digest(text) for text in texts]
+        cached = [self._lookup(key) for key in keys]
+
+        # Each distinct missing text is embedded once, even if repeated in the call.
+        misses: dict[bytes, str] = {}
+        for key, text, hit in zip(keys, texts, cached, strict=True):
+            if hit is None:
+                misses.setdefault(key, text)
+
+        fresh: dict[bytes, DenseEmbedding] = {}
+        if misses:
+            embeddings = await self._inner.embed_many(list(misses.values()))
+            fresh = dict(zip(misses, embeddings, strict=True))
+            for key, embedding in fresh.items():
+                self._store(key, embedding)
+
+        results: list[DenseEmbedding] = [
+            fresh[key] if hit is None else hit for key, hit in zip(keys, cached, strict=True)
+        ]
+        return results
+
+    async def close(self) -> None:
+        """Drop the cache and close the wrapped embedder."""
+        self._cache.clear()
+        await self._inner.close()
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: bytes) -> DenseEmbedding | None:
+        """Return the cached vector for *key*, marking it most recently used."""
+        embedding = self._cache.get(key)
+        if embedding is not None:
+            self._cache.move_to_end(key)
+        return embedding
+
+    def _store(self, key: bytes, embedding: DenseEmbedding) -> None:
+        """Cache *embedding*, evicting the least recently used entry if full."""
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
@@ -0,0 +1,159 @@
+"""Request-coalescing wrapper around a dense embedder.
+
+Concurrent search requests each embed one or two short queries. Sending
+each as its own provider call pays a full round trip per request; this
+wrapper collects calls that arrive within a short window and sends them as
+one ``embed_many`` batch, then hands every caller its own slice.
+"""
+
+import asyncio
+
+from airweave.domains.embedders.exceptions import EmbedderInputError
+from airweave.domains.embedders.protocols import DenseEmbedderProtocol
+from airweave.domains.embedders.types import DenseEmbedding
+
+_Pending = tuple[list[str], "asyncio.Future[list[DenseEmbedding]]"]
+
+
+class CoalescingDenseEmbedder(DenseEmbedderProtocol):
+    """Dense embedder that merges concurrent calls into batched provider calls.
+
+    A lone call is dispatched unchanged after the window expires. If a merged
+    batch is rejected for its input, each caller is retried on its own so that
+    one bad input surfaces only to the caller that sent it; any other failure
+    is raised to every caller in the batch.
+
+    The wrapped embedder is shared and owned by the container; ``close`` does
+    not close it.
+    """
+
+    _WINDOW_SECONDS: float = 0.005
+    _MAX_PENDING_CALLS: int = 32
+
+    def __init__(
+        self,
+        inner: DenseEmbedderProtocol,
+        *,
+        window_seconds: float = _WINDOW_SECONDS,
+        max_pending_calls: int = _MAX_PENDING_CALLS,
+    ) -> None:
+        """Initialize the coalescing embedder.
+
+        Args:
+            inner: The embedder that performs the actual provider calls.
+            window_seconds: How long to wait for more calls before flushing.
+            max_pending_calls: Flush immediately once this many calls are queued.
+        """
+        self._inner = inner
+        self._window_seconds = window_seconds
+        self._max_pending_calls = max_pending_calls
+        self._pending: list[_Pending] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    @property
+    def model_name(self) -> str:
+        """The model identifier of the wrapped embedder."""
+        return self._inner.model_name
+
+    @property
+    def dimensions(self) -> int:
+        """The output vector dimensionality of the wrapped embedder."""
+        return self._inner.dimensions
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        """Embed a single text into a dense vector."""
+        results = await self.embed_many([text])
+        return results[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        """Queue texts for the next batched provider call and await their vectors."""
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[DenseEmbedding]] = loop.create_future()
+        self._pending.append((texts, future))
+
+        if len(self._pending) >= self._max_pending_calls:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_seconds, self._flush)
+
+        return await future
+
+    async def close(self) -> None:
+        """Flush queued calls; the wrapped embedder is left open."""
+        self._flush()
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Batching
+    # ------------------------------------------------------------------
+
+    def _flush(self) -> None:
+        """Hand all queued calls to a single dispatch task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[_Pending]) -> None:
+        """Embed a batch of queued calls and resolve each caller's future."""
+        live = [(texts, future) for texts, future in batch if not future.done()]
+        if not live:
+            return
+
+        try:
+            await self._embed_live(live)
+        except asyncio.CancelledError:
+            # Never leave a caller awaiting a future nobody will resolve.
+            for _, future in live:
+                future.cancel()
+            raise
+        except BaseException as e:
+            _fail(live, e)
+            raise
+
+    async def _embed_live(self, live: list[_Pending]) -> None:
+        """Send *live* as one provider call and hand every caller its slice."""
+        flat = [text for texts, _ in live for text in texts]
+        try:
+            embeddings = await self._inner.embed_many(flat)
+        except EmbedderInputError as e:
+            if len(live) == 1:
+                _fail(live, e)
+                return
+            # One caller's input may be bad; retry each caller on its own.
+            await asyncio.gather(*(self._dispatch([item]) for item in live))
+            return
+        except Exception as e:
+            # Rate limits, timeouts and outages fail every caller alike;
+            # retrying per caller would only add load on a failing provider.
+            _fail(live, e)
+            return
+
+        offset = 0
+        for texts, future in live:
+            if not future.done():
+                future.set_result(embeddings[offset : offset + len(texts)])
+            offset += len(texts)
+
+
+def _fail(live: list[_Pending], error: BaseException) -> None:
+    """Raise *error* to every caller still waiting in *live*."""
+    for _, future in live:
+        if not future.done():
+            future.set_exception(error)
@@ -0,0 +1,78 @@
+"""Unit tests for CachingDenseEmbedder."""
+
+import pytest
+
+from airweave.domains.embedders.dense.caching import CachingDenseEmbedder
+from airweave.domains.embedders.types import DenseEmbedding
+
+
+class _RecordingEmbedder:
+    """Inner embedder that encodes each text's length and records every call."""
+
+    model_name = "recording"
+    dimensions = 1
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.closed = False
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        self.calls.append(list(texts))
+        return [DenseEmbedding(vector=[float(len(t))]) for t in texts]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_repeated_texts_are_served_from_cache():
+    inner = _RecordingEmbedder()
+    embedder = CachingDenseEmbedder(inner)
+
+    first = await embedder.embed_many(["a", "bb"])
+    second = await embedder.embed_many(["bb", "ccc", "a"])
+
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    assert [e.vector for e in second] == [[2.0], [3.0], [1.0]]
+    assert second[0] is first[1]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_misses_are_embedded_once():
+    inner = _RecordingEmbedder()
+    embedder = CachingDenseEmbedder(inner)
+
+    results = await embedder.embed_many(["a", "a", "bb"])
+
+    assert inner.calls == [["a", "bb"]]
+    assert [e.vector for e in results] == [[1.0], [1.0], [2.0]]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    inner = _RecordingEmbedder()
+    embedder = CachingDenseEmbedder(inner, max_entries=2)
+
+    await embedder.embed("a")
+    await embedder.embed("bb")
+    await embedder.embed("a")  # refresh "a"; "bb" is now the oldest
+    await embedder.embed("ccc")  # evicts "bb"
+    await embedder.embed("a")
+    await embedder.embed("bb")
+
+    assert inner.calls == [["a"], ["bb"], ["ccc"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_close_closes_inner():
+    inner = _RecordingEmbedder()
+    embedder = CachingDenseEmbedder(inner)
+
+    assert await embedder.embed_many([]) == []
+    await embedder.close()
+
+    assert inner.calls == []
+    assert inner.closed is True
@@ -0,0 +1,114 @@
+"""Unit tests for CoalescingDenseEmbedder."""
+
+import asyncio
+
+import pytest
+
+from airweave.domains.embedders.dense.coalescing import CoalescingDenseEmbedder
+from airweave.domains.embedders.exceptions import EmbedderInputError, EmbedderRateLimitError
+from airweave.domains.embedders.types import DenseEmbedding
+
+
+class _RecordingEmbedder:
+    """Inner embedder that encodes each text's length and records every call."""
+
+    model_name = "recording"
+    dimensions = 1
+
+    def __init__(self, reject: str | None = None, error: Exception | None = None) -> None:
+        self.calls: list[list[str]] = []
+        self._reject = reject
+        self._error = error
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        self.calls.append(list(texts))
+        if self._error is not None:
+            raise self._error
+        if self._reject is not None and self._reject in texts:
+            raise EmbedderInputError(f"rejected {self._reject!r}")
+        return [DenseEmbedding(vector=[float(len(t))]) for t in texts]
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_provider_call():
+    inner = _RecordingEmbedder()
+    embedder = CoalescingDenseEmbedder(inner)
+
+    a, b = await asyncio.gather(embedder.embed_many(["a", "bb"]), embedder.embed("ccc"))
+
+    assert inner.calls == [["a", "bb", "ccc"]]
+    assert [e.vector for e in a] == [[1.0], [2.0]]
+    assert b.vector == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_flushes_immediately_at_max_pending_calls():
+    inner = _RecordingEmbedder()
+    embedder = CoalescingDenseEmbedder(inner, window_seconds=60.0, max_pending_calls=2)
+
+    await asyncio.wait_for(asyncio.gather(embedder.embed("a"), embedder.embed("b")), 1.0)
+
+    assert inner.calls == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_per_caller():
+    inner = _RecordingEmbedder(reject="bad")
+    embedder = CoalescingDenseEmbedder(inner)
+
+    good, bad = await asyncio.gather(
+        embedder.embed("good"), embedder.embed("bad"), return_exceptions=True
+    )
+
+    assert isinstance(good, DenseEmbedding)
+    assert good.vector == [4.0]
+    assert isinstance(bad, EmbedderInputError)
+    assert inner.calls == [["good", "bad"], ["good"], ["bad"]]
+
+
+@pytest.mark.asyncio
+async def test_provider_error_is_not_retried_per_caller():
+    error = EmbedderRateLimitError("slow down", provider="test")
+    inner = _RecordingEmbedder(error=error)
+    embedder = CoalescingDenseEmbedder(inner)
+
+    results = await asyncio.gather(embedder.embed("a"), embedder.embed("b"), return_exceptions=True)
+
+    assert results == [error, error]
+    assert inner.calls == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_empty_input_skips_provider():
+    inner = _RecordingEmbedder()
+    embedder = CoalescingDenseEmbedder(inner)
+
+    assert await embedder.embed_many([]) == []
+    assert inner.calls == []
+
+
+@pytest.mark.asyncio
+async def test_cancelled_dispatch_cancels_waiting_callers():
+    started = asyncio.Event()
+
+    class _HangingEmbedder(_RecordingEmbedder):
+        async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+            started.set()
+            await asyncio.Event().wait()
+            return []
+
+    embedder = CoalescingDenseEmbedder(_HangingEmbedder())
+    calls = asyncio.gather(embedder.embed("a"), embedder.embed("b"), return_exceptions=True)
+    await started.wait()
+    for task in list(embedder._dispatches):
+        task.cancel()
+
+    results = await asyncio.wait_for(calls, timeout=1)
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
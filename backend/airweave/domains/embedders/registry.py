@@ -1,5 +1,8 @@
 """Embedder registries — in-memory registries built once at startup."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from airweave.core.logging import logger
 from airweave.domains.embedders.protocols import (
     DenseEmbedderRegistryProtocol,
@@ -17,8 +20,8 @@ class DenseEmbedderRegistry(DenseEmbedderRegistryProtocol):
 
     def __init__(self) -> None:
         """Initialize with empty entries."""
-        self._entries: dict[str, DenseEmbedderEntry] = {}
-        self._by_provider: dict[str, list[DenseEmbedderEntry]] = {}
+        self._entries: Mapping[str, DenseEmbedderEntry] = MappingProxyType({})
+        self._by_provider: Mapping[str, list[DenseEmbedderEntry]] = MappingProxyType({})
 
     def get(self, short_name: str) -> DenseEmbedderEntry:
         """Get a dense embedder entry by short name.
@@ -56,22 +59,28 @@ class DenseEmbedderRegistry(DenseEmbedderRegistryProtocol):
         """
         from airweave.domains.embedders.registry_data import DENSE_EMBEDDERS
 
+        entries: dict[str, DenseEmbedderEntry] = {}
+        by_provider: dict[str, list[DenseEmbedderEntry]] = {}
         for spec in DENSE_EMBEDDERS:
             entry = DenseEmbedderEntry(
                 short_name=spec.short_name,
                 name=spec.name,
                 description=spec.description,
-                class_name=spec.embedder_class.__name__,
+                class_name=spec.class_name,
                 provider=spec.provider,
                 api_model_name=spec.api_model_name,
                 max_dimensions=spec.max_dimensions,
                 max_tokens=spec.max_tokens,
                 supports_matryoshka=spec.supports_matryoshka,
-                embedder_class_ref=spec.embedder_class,
+                embedder_class_path=spec.embedder_class_path,
                 required_setting=spec.required_setting,
             )
-            self._entries[entry.short_name] = entry
-            self._by_provider.setdefault(entry.provider, []).append(entry)
+            entries[entry.short_name] = entry
+            by_provider.setdefault(entry.provider, []).append(entry)
+
+        # Lookups share these across every request; expose them read-only.
+        self._entries = MappingProxyType(entries)
+        self._by_provider = MappingProxyType(by_provider)
 
         registry_logger.info(f"Built dense embedder registry with {len(self._entries)} entries.")
 
@@ -81,8 +90,8 @@ class SparseEmbedderRegistry(SparseEmbedderRegistryProtocol):
 
     def __init__(self) -> None:
         """Initialize with empty entries."""
-        self._entries: dict[str, SparseEmbedderEntry] = {}
-        self._by_provider: dict[str, list[SparseEmbedderEntry]] = {}
+        self._entries: Mapping[str, SparseEmbedderEntry] = MappingProxyType({})
+        self._by_provider: Mapping[str, list[SparseEmbedderEntry]] = MappingProxyType({})
 
     def get(self, short_name: str) -> SparseEmbedderEntry:
         """Get a sparse embedder entry by short name.
@@ -120,18 +129,24 @@ class SparseEmbedderRegistry(SparseEmbedderRegistryProtocol):
         """
         from airweave.domains.embedders.registry_data import SPARSE_EMBEDDERS
 
+        entries: dict[str, SparseEmbedderEntry] = {}
+        by_provider: dict[str, list[SparseEmbedderEntry]] = {}
         for spec in SPARSE_EMBEDDERS:
             entry = SparseEmbedderEntry(
                 short_name=spec.short_name,
                 name=spec.name,
                 description=spec.description,
-                class_name=spec.embedder_class.__name__,
+                class_name=spec.class_name,
                 provider=spec.provider,
                 api_model_name=spec.api_model_name,
-                embedder_class_ref=spec.embedder_class,
+                embedder_class_path=spec.embedder_class_path,
                 required_setting=spec.required_setting,
             )
-            self._entries[entry.short_name] = entry
-            self._by_provider.setdefault(entry.provider, []).append(entry)
+            entries[entry.short_name] = entry
+            by_provider.setdefault(entry.provider, []).append(entry)
+
+        # Lookups share these across every request; expose them read-only.
+        self._entries = MappingProxyType(entries)
+        self._by_provider = MappingProxyType(by_provider)
 
         registry_logger.info(f"Built sparse embedder registry with {len(self._entries)} entries.")
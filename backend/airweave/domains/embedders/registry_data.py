@@ -4,16 +4,43 @@ This is the single source of truth for all known embedder models.
 Add new models here — the domain registry reads this at startup.
 """
 
+import importlib
 from dataclasses import dataclass
+from functools import cache
+from typing import Any
 
-from airweave.domains.embedders.dense.local import LocalDenseEmbedder
-from airweave.domains.embedders.dense.mistral import MistralDenseEmbedder
-from airweave.domains.embedders.dense.openai import OpenAIDenseEmbedder
-from airweave.domains.embedders.sparse.fastembed import FastEmbedSparseEmbedder
 
+# Embedder classes are referenced by "module:attribute" path and imported on
+# first use, so importing this module does not pull in the provider SDKs
+# (openai, mistralai, fastembed/ONNX).
+@cache
+def resolve_embedder_class(path: str) -> type:
+    """Import and return the class at *path* (``"package.module:ClassName"``)."""
+    module_name, _, attr = path.partition(":")
+    cls: type = getattr(importlib.import_module(module_name), attr)
+    return cls
 
-@dataclass(frozen=True)
-class DenseEmbedderSpec:
+
+class _EmbedderClassRef:
+    """Lazy access to the embedder class named by ``embedder_class_path``."""
+
+    __slots__ = ()
+
+    embedder_class_path: str
+
+    @property
+    def class_name(self) -> str:
+        """Name of the embedder class, without importing it."""
+        return self.embedder_class_path.rpartition(":")[2]
+
+    @property
+    def embedder_class(self) -> type:
+        """The embedder class, imported on first access."""
+        return resolve_embedder_class(self.embedder_class_path)
+
+
+@dataclass(frozen=True, slots=True)
+class DenseEmbedderSpec(_EmbedderClassRef):
     """Specification for registering a dense embedding model."""
 
     short_name: str
@@ -24,12 +51,12 @@ class DenseEmbedderSpec:
     max_dimensions: int
     max_tokens: int
     supports_matryoshka: bool
-    embedder_class: type
+    embedder_class_path: str
     required_setting: str | None
 
 
-@dataclass(frozen=True)
-class SparseEmbedderSpec:
+@dataclass(frozen=True, slots=True)
+class SparseEmbedderSpec(_EmbedderClassRef):
     """Specification for registering a sparse embedding model."""
 
     short_name: str
@@ -37,69 +64,99 @@ class SparseEmbedderSpec:
     description: str
     provider: str
     api_model_name: str
-    embedder_class: type
+    embedder_class_path: str
     required_setting: str | None
 
 
-DENSE_EMBEDDERS: list[DenseEmbedderSpec] = [
-    DenseEmbedderSpec(
-        short_name="openai_text_embedding_3_small",
-        name="OpenAI text-embedding-3-small",
-        description="OpenAI small embedding model with Matryoshka support (up to 1536d)",
-        provider="openai",
-        api_model_name="text-embedding-3-small",
-        max_dimensions=1536,
-        max_tokens=8192,
-        supports_matryoshka=True,
-        embedder_class=OpenAIDenseEmbedder,
-        required_setting="OPENAI_API_KEY",
-    ),
-    DenseEmbedderSpec(
-        short_name="openai_text_embedding_3_large",
-        name="OpenAI text-embedding-3-large",
-        description="OpenAI large embedding model with Matryoshka support (up to 3072d)",
+def _openai_spec(
+    *, short_name: str, name: str, description: str, api_model_name: str, max_dimensions: int
+) -> DenseEmbedderSpec:
+    """Build a spec for an OpenAI text-embedding-3 model; only these fields vary."""
+    return DenseEmbedderSpec(
+        short_name=short_name,
+        name=name,
+        description=description,
         provider="openai",
-        api_model_name="text-embedding-3-large",
-        max_dimensions=3072,
+        api_model_name=api_model_name,
+        max_dimensions=max_dimensions,
         max_tokens=8192,
         supports_matryoshka=True,
-        embedder_class=OpenAIDenseEmbedder,
+        embedder_class_path="airweave.domains.embedders.dense.openai:OpenAIDenseEmbedder",
         required_setting="OPENAI_API_KEY",
-    ),
-    DenseEmbedderSpec(
-        short_name="mistral_embed",
-        name="Mistral Embed",
-        description="Mistral embedding model with fixed 1024 dimensions",
-        provider="mistral",
-        api_model_name="mistral-embed",
-        max_dimensions=1024,
-        max_tokens=8192,
-        supports_matryoshka=False,
-        embedder_class=MistralDenseEmbedder,
-        required_setting="MISTRAL_API_KEY",
-    ),
-    DenseEmbedderSpec(
-        short_name="local_minilm",
-        name="Local MiniLM-L6-v2",
-        description="Local sentence-transformers model via text2vec container (384d)",
-        provider="local",
-        api_model_name="sentence-transformers/all-MiniLM-L6-v2",
-        max_dimensions=384,
-        max_tokens=512,
-        supports_matryoshka=False,
-        embedder_class=LocalDenseEmbedder,
-        required_setting="TEXT2VEC_INFERENCE_URL",
-    ),
-]
-
-SPARSE_EMBEDDERS: list[SparseEmbedderSpec] = [
-    SparseEmbedderSpec(
-        short_name="fastembed_bm25",
-        name="FastEmbed BM25",
-        description="Sparse BM25 embeddings via FastEmbed (Qdrant/bm25 model)",
-        provider="fastembed",
-        api_model_name="Qdrant/bm25",
-        embedder_class=FastEmbedSparseEmbedder,
-        required_setting=None,
-    ),
-]
+    )
+
+
+def _build_dense() -> tuple[DenseEmbedderSpec, ...]:
+    """Build the dense embedder specs."""
+    return (
+        _openai_spec(
+            short_name="openai_text_embedding_3_small",
+            name="OpenAI text-embedding-3-small",
+            description="OpenAI small embedding model with Matryoshka support (up to 1536d)",
+            api_model_name="text-embedding-3-small",
+            max_dimensions=1536,
+        ),
+        _openai_spec(
+            short_name="openai_text_embedding_3_large",
+            name="OpenAI text-embedding-3-large",
+            description="OpenAI large embedding model with Matryoshka support (up to 3072d)",
+            api_model_name="text-embedding-3-large",
+            max_dimensions=3072,
+        ),
+        DenseEmbedderSpec(
+            short_name="mistral_embed",
+            name="Mistral Embed",
+            description="Mistral embedding model with fixed 1024 dimensions",
+            provider="mistral",
+            api_model_name="mistral-embed",
+            max_dimensions=1024,
+            max_tokens=8192,
+            supports_matryoshka=False,
+            embedder_class_path="airweave.domains.embedders.dense.mistral:MistralDenseEmbedder",
+            required_setting="MISTRAL_API_KEY",
+        ),
+        DenseEmbedderSpec(
+            short_name="local_minilm",
+            name="Local MiniLM-L6-v2",
+            description="Local sentence-transformers model via text2vec container (384d)",
+            provider="local",
+            api_model_name="sentence-transformers/all-MiniLM-L6-v2",
+            max_dimensions=384,
+            max_tokens=512,
+            supports_matryoshka=False,
+            embedder_class_path="airweave.domains.embedders.dense.local:LocalDenseEmbedder",
+            required_setting="TEXT2VEC_INFERENCE_URL",
+        ),
+    )
+
+
+def _build_sparse() -> tuple[SparseEmbedderSpec, ...]:
+    """Build the sparse embedder specs."""
+    return (
+        SparseEmbedderSpec(
+            short_name="fastembed_bm25",
+            name="FastEmbed BM25",
+            description="Sparse BM25 embeddings via FastEmbed (Qdrant/bm25 model)",
+            provider="fastembed",
+            api_model_name="Qdrant/bm25",
+            embedder_class_path=(
+                "airweave.domains.embedders.sparse.fastembed:FastEmbedSparseEmbedder"
+            ),
+            required_setting=None,
+        ),
+    )
+
+
+# The spec lists are built on first access (PEP 562) and then cached as
+# ordinary module globals, so importing this module constructs nothing.
+_BUILDERS = {"DENSE_EMBEDDERS": _build_dense, "SPARSE_EMBEDDERS": _build_sparse}
+
+
+def __getattr__(name: str) -> Any:
+    """Build and cache ``DENSE_EMBEDDERS`` / ``SPARSE_EMBEDDERS`` on first access."""
+    builder = _BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value
+    return value
@@ -26,7 +26,7 @@ def _make_entry(embedder_class: type, **overrides) -> DenseEmbedderEntry:
         max_dimensions=384,
         max_tokens=512,
         supports_matryoshka=False,
-        embedder_class_ref=embedder_class,
+        embedder_class_path=f"{embedder_class.__module__}:{embedder_class.__name__}",
         required_setting="TEXT2VEC_INFERENCE_URL",
     )
     defaults.update(overrides)
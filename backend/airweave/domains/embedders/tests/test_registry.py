@@ -33,6 +33,10 @@ class _StubSparseEmbedder:
     """Stub sparse embedder class for tests."""
 
 
+_STUB_DENSE_PATH = f"{__name__}:_StubDenseEmbedder"
+_STUB_SPARSE_PATH = f"{__name__}:_StubSparseEmbedder"
+
+
 def _make_dense_spec(**overrides) -> DenseEmbedderSpec:
     """Build a DenseEmbedderSpec with sensible defaults, overridable."""
     defaults = {
@@ -44,7 +48,7 @@ def _make_dense_spec(**overrides) -> DenseEmbedderSpec:
         "max_dimensions": 1536,
         "max_tokens": 8192,
         "supports_matryoshka": False,
-        "embedder_class": _StubDenseEmbedder,
+        "embedder_class_path": _STUB_DENSE_PATH,
         "required_setting": None,
     }
     defaults.update(overrides)
@@ -59,7 +63,7 @@ def _make_sparse_spec(**overrides) -> SparseEmbedderSpec:
         "description": "A test sparse embedder",
         "provider": "test_provider",
         "api_model_name": "test-sparse-model",
-        "embedder_class": _StubSparseEmbedder,
+        "embedder_class_path": _STUB_SPARSE_PATH,
         "required_setting": None,
     }
     defaults.update(overrides)
@@ -212,7 +216,7 @@ def test_dense_entry_fields():
         max_dimensions=1536,
         max_tokens=8192,
         supports_matryoshka=True,
-        embedder_class=_StubDenseEmbedder,
+        embedder_class_path=_STUB_DENSE_PATH,
         required_setting="OPENAI_API_KEY",
     )
     registry = _build_dense_registry([spec])
@@ -231,6 +235,14 @@ def test_dense_entry_fields():
     assert entry.required_setting == "OPENAI_API_KEY"
 
 
+def test_spec_resolves_embedder_class_on_demand():
+    """The class name comes from the path; the class itself is imported lazily."""
+    spec = _make_dense_spec()
+
+    assert spec.class_name == "_StubDenseEmbedder"
+    assert spec.embedder_class is _StubDenseEmbedder
+
+
 # ===========================================================================
 # DenseEmbedderRegistry — build() with real data
 # ===========================================================================
@@ -331,7 +343,7 @@ def test_sparse_entry_fields():
         description="Sparse BM25",
         provider="fastembed",
         api_model_name="Qdrant/bm25",
-        embedder_class=_StubSparseEmbedder,
+        embedder_class_path=_STUB_SPARSE_PATH,
         required_setting=None,
     )
     registry = _build_sparse_registry([spec])
@@ -3,6 +3,7 @@
 from pydantic import BaseModel, Field
 
 from airweave.core.protocols.registry import BaseRegistryEntry
+from airweave.domains.embedders.registry_data import resolve_embedder_class
 
 # ---------------------------------------------------------------------------
 # Embedding value types
@@ -40,14 +41,24 @@ class DenseEmbedderEntry(BaseRegistryEntry):
     max_dimensions: int
     max_tokens: int
     supports_matryoshka: bool
-    embedder_class_ref: type
+    embedder_class_path: str
     required_setting: str | None = None
 
+    @property
+    def embedder_class_ref(self) -> type:
+        """The embedder class, imported on first access."""
+        return resolve_embedder_class(self.embedder_class_path)
+
 
 class SparseEmbedderEntry(BaseRegistryEntry):
     """A registered sparse embedding model."""
 
     provider: str
     api_model_name: str
-    embedder_class_ref: type
+    embedder_class_path: str
     required_setting: str | None = None
+
+    @property
+    def embedder_class_ref(self) -> type:
+        """The embedder class, imported on first access."""
+        return resolve_embedder_class(self.embedder_class_path)
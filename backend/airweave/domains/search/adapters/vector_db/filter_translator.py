@@ -60,7 +60,7 @@ class FilterTranslator:
         else:
             result = " OR ".join(group_clauses)
 
-        self._logger.debug(f"[FilterTranslator] Translated {len(filter_groups)} filter groups")
+        self._logger.debug("[FilterTranslator] Translated %d filter groups", len(filter_groups))
         return result
 
     def _translate_group(self, group: FilterGroup) -> Optional[str]:
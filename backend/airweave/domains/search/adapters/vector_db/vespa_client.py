@@ -100,7 +100,7 @@ class VespaVectorDB:
         display_query = f"YQL:\n{yql}\n\nParams:\n{json.dumps(display_params, indent=2)}"
 
         self._logger.debug(
-            f"[VespaVectorDB] Compiled query: YQL={len(yql)} chars, params={len(params)} keys"
+            "[VespaVectorDB] Compiled query: YQL=%d chars, params=%d keys", len(yql), len(params)
         )
 
         return CompiledQuery(
@@ -150,9 +150,11 @@ class VespaVectorDB:
         coverage_pct = coverage.get("coverage", 100.0)
 
         self._logger.debug(
-            f"[VespaVectorDB] Query completed in {query_time_ms:.1f}ms, "
-            f"total={total_count}, hits={len(hits)}, "
-            f"coverage={coverage_pct:.1f}%"
+            "[VespaVectorDB] Query completed in %.1fms, total=%s, hits=%d, coverage=%.1f%%",
+            query_time_ms,
+            total_count,
+            len(hits),
+            coverage_pct,
         )
 
         return self._convert_hits_to_results(hits)
@@ -199,7 +201,7 @@ class VespaVectorDB:
         raw_json = response.json if hasattr(response, "json") else {}
         total_count = raw_json.get("root", {}).get("fields", {}).get("totalCount", 0)
 
-        self._logger.debug(f"[VespaVectorDB] Count query: {total_count} matches")
+        self._logger.debug("[VespaVectorDB] Count query: %s matches", total_count)
         return total_count
 
     async def filter_search(
@@ -243,7 +245,7 @@ class VespaVectorDB:
             raise VectorDBError(f"Vespa filter search error: {error_msg}")
 
         hits = response.hits or []
-        self._logger.debug(f"[VespaVectorDB] Filter search: {len(hits)} hits")
+        self._logger.debug("[VespaVectorDB] Filter search: %d hits", len(hits))
 
         results = self._convert_hits_to_results(hits)
         return results.results
@@ -388,7 +390,7 @@ class VespaVectorDB:
             if sparse_tensor:
                 params["input.query(q_sparse)"] = sparse_tensor
                 num_tokens = len(sparse_tensor.get("cells", {}))
-                self._logger.debug(f"[VespaVectorDB] Sparse embedding: {num_tokens} tokens")
+                self._logger.debug("[VespaVectorDB] Sparse embedding: %d tokens", num_tokens)
             else:
                 self._logger.warning("[VespaVectorDB] Sparse embedding conversion returned None")
         elif plan.retrieval_strategy in (
@@ -404,9 +406,11 @@ class VespaVectorDB:
         )
         has_sparse = "input.query(q_sparse)" in params
         self._logger.debug(
-            f"[VespaVectorDB] Query params: dense={has_dense}, sparse={has_sparse}, "
-            f"profile={params.get('ranking.profile')}, "
-            f"rerankCount={global_phase_rerank}"
+            "[VespaVectorDB] Query params: dense=%s, sparse=%s, profile=%s, rerankCount=%s",
+            has_dense,
+            has_sparse,
+            params.get("ranking.profile"),
+            global_phase_rerank,
         )
 
         return params
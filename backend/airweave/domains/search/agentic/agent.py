@@ -195,13 +195,13 @@ class Agent:
         config = self._config
 
         # ── SETUP ──────────────────────────────────────────────────────
-        collection = await self._collection_repo.get_by_readable_id(db, readable_id, ctx)
-        if not collection:
+        collection_uuid = await self._collection_repo.resolve_id(db, readable_id, ctx)
+        if collection_uuid is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Collection '{readable_id}' not found",
             )
-        collection_id = str(collection.id)
+        collection_id = str(collection_uuid)
 
         metadata = await self._metadata_builder.build(db, ctx, readable_id)
         system_prompt = build_system_prompt(metadata, config.MAX_ITERATIONS)
@@ -256,10 +256,13 @@ class Agent:
             diag.cache_read += response.cache_read_input_tokens
             diag.llm_retries += response.retries
             ctx.logger.debug(
-                f"Agentic iteration={iteration} tool_calls={len(response.tool_calls)} "
-                f"prompt_tokens={response.prompt_tokens} "
-                f"completion_tokens={response.completion_tokens} "
-                f"llm_duration_ms={llm_duration}"
+                "Agentic iteration=%d tool_calls=%d prompt_tokens=%d "
+                "completion_tokens=%d llm_duration_ms=%d",
+                iteration,
+                len(response.tool_calls),
+                response.prompt_tokens,
+                response.completion_tokens,
+                llm_duration,
             )
 
             # 3. Emit thinking event
@@ -468,7 +471,7 @@ class Agent:
                     cache_creation_input_tokens=diag.cache_creation,
                     cache_read_input_tokens=diag.cache_read,
                 ),
-                collection_id=collection.id,  # type: ignore[arg-type]
+                collection_id=collection_uuid,
             )
         )
 
@@ -54,12 +54,12 @@ class BrowseService(BrowseServiceProtocol):
             f"Browse started collection={readable_id} limit={request.limit} offset={request.offset}"
         )
 
-        collection = await self._collection_repo.get_by_readable_id(db, readable_id, ctx)
-        if not collection:
+        collection_uuid = await self._collection_repo.resolve_id(db, readable_id, ctx)
+        if collection_uuid is None:
             raise HTTPException(status_code=404, detail=f"Collection '{readable_id}' not found")
 
         filter_groups = self._build_filter_groups(request)
-        collection_id = str(collection.id)
+        collection_id = str(collection_uuid)
         name_substring = (request.name_query or "").strip() or None
 
         results, total = await asyncio.gather(
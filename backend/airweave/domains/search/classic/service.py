@@ -11,7 +11,6 @@ import functools
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
-from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -113,8 +112,8 @@ class ClassicSearchService(ClassicSearchServiceProtocol):
     ) -> SearchResults:
         """Internal execution — resolve collection, LLM strategy, search, rerank."""
         # 1. Resolve collection
-        collection = await self._collection_repo.get_by_readable_id(db, readable_id, ctx)
-        if not collection:
+        collection_id = await self._collection_repo.resolve_id(db, readable_id, ctx)
+        if collection_id is None:
             raise HTTPException(status_code=404, detail=f"Collection '{readable_id}' not found")
 
         # 2. Build system prompt
@@ -130,9 +129,10 @@ class ClassicSearchService(ClassicSearchServiceProtocol):
         prompt = f"User query: {request.query}\nUser filter: {user_filter_md}"
         strategy = await self._llm.structured_output(prompt, ClassicSearchStrategy, system_prompt)
         ctx.logger.debug(
-            f"Classic search LLM strategy primary={strategy.query.primary!r} "
-            f"retrieval={strategy.retrieval_strategy} "
-            f"filter_groups={len(strategy.filter_groups or [])}"
+            "Classic search LLM strategy primary=%r retrieval=%s filter_groups=%d",
+            strategy.query.primary,
+            strategy.retrieval_strategy,
+            len(strategy.filter_groups or []),
         )
 
         # Guard: if LLM returned an empty or non-word primary query, fall back to the
@@ -157,7 +157,7 @@ class ClassicSearchService(ClassicSearchServiceProtocol):
         results = await self._executor.execute(
             plan=plan,
             user_filter=request.filter or [],
-            collection_id=str(collection.id),
+            collection_id=str(collection_id),
             db=db,
             ctx=ctx,
             collection_readable_id=readable_id,
@@ -184,7 +184,7 @@ class ClassicSearchService(ClassicSearchServiceProtocol):
                 plan=ctx.billing_plan,
                 results=[r.model_dump(mode="json") for r in results.results],
                 duration_ms=duration_ms,
-                collection_id=UUID(str(collection.id)),
+                collection_id=collection_id,
             )
         )
 
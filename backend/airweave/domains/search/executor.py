@@ -348,7 +348,7 @@ class SearchPlanExecutor(SearchPlanExecutorProtocol):
     ) -> list[SearchResult]:
         """Search a single federated source with retries on transient errors."""
         source_name = source.__class__.__name__
-        ctx.logger.debug(f"[FederatedSearch] Searching {source_name} with query: '{query}'")
+        ctx.logger.debug("[FederatedSearch] Searching %s with query: '%s'", source_name, query)
 
         last_error: Exception | None = None
         delay = self._FEDERATED_INITIAL_DELAY
@@ -357,7 +357,9 @@ class SearchPlanExecutor(SearchPlanExecutorProtocol):
             try:
                 entities = await source.search(query, limit=limit)  # type: ignore[misc]
                 ctx.logger.debug(
-                    f"[FederatedSearch] {source_name} returned {len(entities)} results"  # type: ignore[arg-type]
+                    "[FederatedSearch] %s returned %d results",
+                    source_name,
+                    len(entities),  # type: ignore[arg-type]
                 )
                 break
             except Exception as e:
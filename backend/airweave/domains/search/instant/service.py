@@ -93,8 +93,8 @@ class InstantSearchService(InstantSearchServiceProtocol):
         user_principal_override: str | None = None,
     ) -> SearchResults:
         """Internal execution — resolve collection, build plan, execute."""
-        collection = await self._collection_repo.get_by_readable_id(db, readable_id, ctx)
-        if not collection:
+        collection_id = await self._collection_repo.resolve_id(db, readable_id, ctx)
+        if collection_id is None:
             raise HTTPException(status_code=404, detail=f"Collection '{readable_id}' not found")
 
         plan = SearchPlan(
@@ -107,7 +107,7 @@ class InstantSearchService(InstantSearchServiceProtocol):
         results = await self._executor.execute(
             plan=plan,
             user_filter=request.filter or [],
-            collection_id=str(collection.id),
+            collection_id=str(collection_id),
             db=db,
             ctx=ctx,
             collection_readable_id=readable_id,
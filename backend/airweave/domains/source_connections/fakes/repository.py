@@ -1,6 +1,7 @@
 """Fake source connection repository for testing."""
 
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,12 +13,19 @@ from airweave.domains.source_connections.types import ScheduleInfo, SourceConnec
 from airweave.models.connection_init_session import ConnectionInitSession
 from airweave.models.source_connection import SourceConnection
 
+_MAX_RECORDED_CALLS = 10_000
+
 
 class FakeSourceConnectionRepository(SourceConnectionRepositoryProtocol):
     """In-memory fake for SourceConnectionRepositoryProtocol."""
 
-    def __init__(self) -> None:
-        """Initialize with empty stores."""
+    def __init__(self, record_calls: bool = True) -> None:
+        """Initialize with empty stores.
+
+        Args:
+            record_calls: Keep a bounded log of calls in ``_calls``.
+                Disable for tests that never inspect it.
+        """
         self._store: dict[UUID, SourceConnection] = {}
         self._by_sync_id: dict[UUID, SourceConnection] = {}
         self._schedule_info: dict[UUID, ScheduleInfo] = {}
@@ -26,7 +34,9 @@ class FakeSourceConnectionRepository(SourceConnectionRepositoryProtocol):
         self._sync_ids_by_collection: dict[str, List[UUID]] = {}
         self._org_counts: dict[UUID, int] = {}
         self._last_jobs: Dict[UUID, Dict] = {}
-        self._calls: list[tuple[Any, ...]] = []
+        self._calls: deque[tuple[Any, ...]] = deque(
+            maxlen=_MAX_RECORDED_CALLS if record_calls else 0
+        )
 
     def seed(self, id: UUID, obj: SourceConnection) -> None:
         """Seed a source connection by ID."""
@@ -144,15 +154,32 @@ class FakeSourceConnectionRepository(SourceConnectionRepositoryProtocol):
         ]
 
     def seed_last_jobs(self, last_jobs: Dict[UUID, Dict]) -> None:
-        """Seed the last-jobs map returned by fetch_last_jobs."""
+        """Seed the last-jobs map returned by get_by_collection_ids_with_last_jobs."""
         self._last_jobs = dict(last_jobs)
 
-    async def fetch_last_jobs(
-        self, db: AsyncSession, source_conns: List[SourceConnection]
-    ) -> Dict[UUID, Dict]:
-        """Return seeded last-jobs map."""
-        self._calls.append(("fetch_last_jobs", db, source_conns))
-        return dict(self._last_jobs)
+    async def get_by_collection_ids_with_last_jobs(
+        self,
+        db: AsyncSession,
+        *,
+        organization_id: UUID,
+        readable_collection_ids: List[str],
+    ) -> Tuple[List[SourceConnection], Dict[UUID, Dict]]:
+        """Return matching source connections and their seeded last jobs."""
+        self._calls.append(
+            (
+                "get_by_collection_ids_with_last_jobs",
+                db,
+                organization_id,
+                readable_collection_ids,
+            )
+        )
+        connections = [
+            sc
+            for sc in self._store.values()
+            if getattr(sc, "readable_collection_id", None) in readable_collection_ids
+        ]
+        ids = {sc.id for sc in connections}
+        return connections, {k: v for k, v in self._last_jobs.items() if k in ids}
 
     async def update(
         self,
@@ -1,7 +1,7 @@
 """Protocols for source connection domain."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -90,10 +90,14 @@ class SourceConnectionRepositoryProtocol(Protocol):
         """Get all source connections for the given collection readable IDs."""
         ...
 
-    async def fetch_last_jobs(
-        self, db: AsyncSession, source_conns: List[SourceConnection]
-    ) -> Dict[UUID, Dict]:
-        """Fetch the most recent sync job for each connection."""
+    async def get_by_collection_ids_with_last_jobs(
+        self,
+        db: AsyncSession,
+        *,
+        organization_id: UUID,
+        readable_collection_ids: List[str],
+    ) -> Tuple[List[SourceConnection], Dict[UUID, Dict]]:
+        """Get source connections for collections together with their latest sync job."""
         ...
 
     async def update(
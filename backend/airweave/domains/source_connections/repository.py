@@ -1,9 +1,9 @@
 """Source connection repository wrapping crud.source_connection."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -15,6 +15,7 @@ from airweave.domains.source_connections.types import ScheduleInfo, SourceConnec
 from airweave.domains.sources.protocols import SourceRegistryProtocol
 from airweave.models.connection_init_session import ConnectionInitSession
 from airweave.models.source_connection import SourceConnection
+from airweave.models.sync_job import SyncJob
 
 
 class SourceConnectionRepository(SourceConnectionRepositoryProtocol):
@@ -116,11 +117,52 @@ class SourceConnectionRepository(SourceConnectionRepositoryProtocol):
         result = await db.execute(query)
         return list(result.scalars().all())
 
-    async def fetch_last_jobs(
-        self, db: AsyncSession, source_conns: List[SourceConnection]
-    ) -> Dict[UUID, Dict]:
-        """Fetch the most recent sync job for each connection."""
-        return await crud.source_connection._fetch_last_jobs(db, source_conns)
+    async def get_by_collection_ids_with_last_jobs(
+        self,
+        db: AsyncSession,
+        *,
+        organization_id: UUID,
+        readable_collection_ids: List[str],
+    ) -> Tuple[List[SourceConnection], Dict[UUID, Dict]]:
+        """Get source connections and each one's latest sync job in a single query.
+
+        The latest job is picked per row by a LATERAL subquery that walks
+        ``idx_sync_job_sync_id_created_at`` and stops at the first row, instead of ranking
+        every job of every sync with a window function in a second round trip.
+        """
+        latest_job = (
+            select(SyncJob.status, SyncJob.completed_at, SyncJob.error_category)
+            .where(SyncJob.sync_id == SourceConnection.sync_id)
+            .order_by(SyncJob.created_at.desc())
+            .limit(1)
+            .lateral("latest_job")
+        )
+        query = (
+            select(
+                SourceConnection,
+                latest_job.c.status,
+                latest_job.c.completed_at,
+                latest_job.c.error_category,
+            )
+            .outerjoin(latest_job, true())
+            .where(
+                SourceConnection.organization_id == organization_id,
+                SourceConnection.readable_collection_id.in_(readable_collection_ids),
+            )
+        )
+        result = await db.execute(query)
+
+        connections: List[SourceConnection] = []
+        last_jobs: Dict[UUID, Dict] = {}
+        for sc, status, completed_at, error_category in result.all():
+            connections.append(sc)
+            if status is not None:
+                last_jobs[sc.id] = {
+                    "status": status,
+                    "completed_at": completed_at,
+                    "error_category": error_category,
+                }
+        return connections, last_jobs
 
     async def update(
         self,
@@ -182,21 +182,31 @@ class TestGetByCollectionIds:
 
 
 # ---------------------------------------------------------------------------
-# fetch_last_jobs
+# get_by_collection_ids_with_last_jobs
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.asyncio
-class TestFetchLastJobs:
-    async def test_delegates_to_crud(self):
+class TestGetByCollectionIdsWithLastJobs:
+    async def test_single_query_returns_connections_and_last_jobs(self):
         repo = _repo()
-        sc_id = uuid4()
-        sc = SimpleNamespace(id=sc_id)
-        expected = {sc_id: {"status": "completed"}}
+        with_job = SimpleNamespace(id=uuid4())
+        without_job = SimpleNamespace(id=uuid4())
 
-        with patch("airweave.domains.source_connections.repository.crud") as mock_crud:
-            mock_crud.source_connection._fetch_last_jobs = AsyncMock(return_value=expected)
+        db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            (with_job, "completed", None, None),
+            (without_job, None, None, None),
+        ]
+        db.execute = AsyncMock(return_value=mock_result)
 
-            result = await repo.fetch_last_jobs(MagicMock(), [sc])
+        connections, last_jobs = await repo.get_by_collection_ids_with_last_jobs(
+            db, organization_id=uuid4(), readable_collection_ids=["col-1"]
+        )
 
-        assert result == expected
+        assert connections == [with_job, without_job]
+        assert last_jobs == {
+            with_job.id: {"status": "completed", "completed_at": None, "error_category": None}
+        }
+        db.execute.assert_awaited_once()
@@ -1,5 +1,6 @@
 """Cleanup sync data activity — removes external data (Vespa, ARF, schedules) for deleted syncs."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, List
 from uuid import UUID
@@ -89,12 +90,17 @@ class CleanupSyncDataActivity:
             sync_id = UUID(sync_id_str)
             logger.info(f"Cleaning up external data for sync {sync_id}")
 
-            for sid in schedule_ids.all_schedule_ids(sync_id):
-                try:
-                    await self.temporal_schedule_service.delete_schedule_handle(sid)
+            # Schedule deletions are independent Temporal RPCs: fan them out.
+            sids = schedule_ids.all_schedule_ids(sync_id)
+            results = await asyncio.gather(
+                *(self.temporal_schedule_service.delete_schedule_handle(sid) for sid in sids),
+                return_exceptions=True,
+            )
+            for sid, result in zip(sids, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.debug(f"Schedule {sid} not deleted: {result}")
+                else:
                     summary["schedules_deleted"] += 1
-                except Exception as e:
-                    logger.debug(f"Schedule {sid} not deleted: {e}")
 
             if vespa:
                 try:
@@ -1,5 +1,6 @@
 """Self-destruct orphaned sync activity — cleans up schedules for deleted syncs."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict
 
@@ -54,13 +55,16 @@ class SelfDestructOrphanedSyncActivity:
 
         all_sids = schedule_ids.all_schedule_ids(sync_id)
 
-        for schedule_id in all_sids:
-            try:
-                await self.temporal_schedule_service.delete_schedule_handle(schedule_id)
+        results = await asyncio.gather(
+            *(self.temporal_schedule_service.delete_schedule_handle(sid) for sid in all_sids),
+            return_exceptions=True,
+        )
+        for schedule_id, result in zip(all_sids, results, strict=True):
+            if isinstance(result, BaseException):
+                ctx.logger.debug(f"  Schedule {schedule_id} not found: {result}")
+            else:
                 ctx.logger.info(f"  Deleted schedule: {schedule_id}")
                 cleanup_summary["schedules_deleted"].append(schedule_id)
-            except Exception as e:
-                ctx.logger.debug(f"  Schedule {schedule_id} not found: {e}")
 
         ctx.logger.info(
             f"Self-destruct cleanup complete for sync {sync_id}. "
@@ -10,7 +10,7 @@ import re
 import socket
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol, Set, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Set, TypeGuard, runtime_checkable
 from uuid import UUID
 
 from airweave.core.logging import logger as _logger
@@ -30,13 +30,27 @@ class WorkerPoolProtocol(Protocol):
         ...
 
 
+def _is_worker_pool(worker_pool: Any, pool_id: str) -> TypeGuard[WorkerPoolProtocol]:
+    """Whether *worker_pool* can be tracked; non-conforming pools are logged and dropped."""
+    if worker_pool is None:
+        return False
+    if not isinstance(worker_pool, WorkerPoolProtocol):
+        _logger.warning(
+            f"Worker pool '{pool_id}' does not expose active_and_pending_count; not tracking it."
+        )
+        return False
+    return True
+
+
 class WorkerMetricsRegistry:
     """Global registry for tracking active activities in this worker process."""
 
     def __init__(self) -> None:
         """Initialize the metrics registry."""
         self._active_activities: Dict[str, Dict[str, Any]] = {}
-        self._worker_pools: Dict[str, Any] = {}
+        # Only pools satisfying WorkerPoolProtocol are stored; the structural
+        # isinstance check runs once at registration, not on every scrape.
+        self._worker_pools: Dict[str, WorkerPoolProtocol] = {}
         self._lock = asyncio.Lock()
         self._worker_start_time = datetime.now(timezone.utc)
         self._worker_id = self._generate_worker_id()
@@ -103,10 +117,11 @@ class WorkerMetricsRegistry:
                 "sync_id": str(sync_id) if sync_id else None,
                 "organization_id": str(organization_id) if organization_id else None,
                 "start_time": start_time.isoformat(),
+                "started_at": start_time,
                 "metadata": metadata or {},
             }
 
-            if worker_pool is not None:
+            if _is_worker_pool(worker_pool, activity_id):
                 self._worker_pools[activity_id] = worker_pool
 
         try:
@@ -119,25 +134,22 @@ class WorkerMetricsRegistry:
     async def get_active_activities(self) -> List[Dict[str, Any]]:
         """Get list of currently active activities with duration info."""
         async with self._lock:
-            now = datetime.now(timezone.utc)
-            activities = []
-
-            for _activity_id, info in self._active_activities.items():
-                start_time = datetime.fromisoformat(info["start_time"])
-                duration = (now - start_time).total_seconds()
-
-                activities.append(
-                    {
-                        "activity_name": info["activity_name"],
-                        "sync_job_id": info["sync_job_id"],
-                        "organization_id": info["organization_id"],
-                        "start_time": info["start_time"],
-                        "duration_seconds": round(duration, 2),
-                        "metadata": info["metadata"],
-                    }
-                )
-
-            return activities
+            return self._describe_activities()
+
+    def _describe_activities(self) -> List[Dict[str, Any]]:
+        """Build the public view of every active activity; caller holds the lock."""
+        now = datetime.now(timezone.utc)
+        return [
+            {
+                "activity_name": info["activity_name"],
+                "sync_job_id": info["sync_job_id"],
+                "organization_id": info["organization_id"],
+                "start_time": info["start_time"],
+                "duration_seconds": round((now - info["started_at"]).total_seconds(), 2),
+                "metadata": info["metadata"],
+            }
+            for info in self._active_activities.values()
+        ]
 
     async def get_active_sync_job_ids(self) -> Set[str]:
         """Get set of sync job IDs currently being processed."""
@@ -172,8 +184,7 @@ class WorkerMetricsRegistry:
         async with self._lock:
             total = 0
             for pool in self._worker_pools.values():
-                if pool is not None and isinstance(pool, WorkerPoolProtocol):
-                    total += pool.active_and_pending_count
+                total += pool.active_and_pending_count
             return total
 
     async def get_per_sync_worker_counts(self) -> list[SyncWorkerCount]:
@@ -188,9 +199,6 @@ class WorkerMetricsRegistry:
                 if not pool_id.startswith("sync_"):
                     continue
 
-                if pool is None or not isinstance(pool, WorkerPoolProtocol):
-                    continue
-
                 try:
                     parts = pool_id.split("_job_")
                     if len(parts) != 2:
@@ -240,7 +248,8 @@ class WorkerMetricsRegistry:
                     f"Existing pool: {existing_pool}, New pool: {worker_pool}"
                 )
 
-        self._worker_pools[pool_id] = worker_pool
+        if _is_worker_pool(worker_pool, pool_id):
+            self._worker_pools[pool_id] = worker_pool
 
     def unregister_worker_pool(self, pool_id: str) -> None:
         """Unregister a worker pool from metrics tracking (synchronous)."""
@@ -266,9 +275,6 @@ class WorkerMetricsRegistry:
                 connector_stats[connector]["active_syncs"] += 1
 
             for activity_id, pool in self._worker_pools.items():
-                if pool is None or not isinstance(pool, WorkerPoolProtocol):
-                    continue
-
                 activity_info = self._active_activities.get(activity_id)
                 if activity_info:
                     connector = activity_info.get("metadata", {}).get("source_type", "unknown")
@@ -287,8 +293,10 @@ class WorkerMetricsRegistry:
 
     async def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary metrics about this worker."""
-        activities = await self.get_active_activities()
-        sync_job_ids = await self.get_active_sync_job_ids()
+        # One lock hold and one pass: the job ids come from the same view.
+        async with self._lock:
+            activities = self._describe_activities()
+        sync_job_ids = {a["sync_job_id"] for a in activities if a["sync_job_id"]}
 
         return {
             "worker_id": self.worker_id,
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectorSnapshot:
     """Per-connector-type metrics at scrape time."""
 
@@ -11,7 +11,7 @@ class ConnectorSnapshot:
     active_and_pending_workers: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkerMetricsSnapshot:
     """Complete worker metrics snapshot passed to the gauge adapter."""
 
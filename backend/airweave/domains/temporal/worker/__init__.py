@@ -9,8 +9,9 @@ Package structure:
 
 import asyncio
 import signal
+import sys
 from datetime import timedelta
-from typing import Any
+from typing import Any, Callable
 
 from temporalio.worker import Worker
 
@@ -21,11 +22,21 @@ from .config import WorkerConfig
 from .control_server import WorkerControlServer, WorkerState
 from .wiring import create_activities, get_workflows
 
+# uvloop ships with ``uvicorn[standard]`` and is not available on Windows.
+if sys.platform == "win32":
+    uvloop = None
+else:
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None  # type: ignore[assignment]
+
 __all__ = [
     "TemporalWorker",
     "WorkerConfig",
     "WorkerControlServer",
     "WorkerState",
+    "loop_factory",
     "main",
 ]
 
@@ -163,6 +174,13 @@ class TemporalWorker:
 # =============================================================================
 
 
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory for ``asyncio.run``, or None for the default loop."""
+    if uvloop is None:
+        return None
+    return uvloop.new_event_loop
+
+
 async def main() -> None:
     """Main entry point for the worker process."""
     # 1. Initialize DI container (fail fast if wiring is broken)
@@ -203,4 +221,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=loop_factory())
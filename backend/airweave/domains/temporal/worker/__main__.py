@@ -2,7 +2,7 @@
 
 import asyncio
 
-from . import main
+from . import loop_factory, main
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=loop_factory())
@@ -6,6 +6,11 @@ Endpoints:
     GET  /status  - JSON debug status
     POST /drain   - Initiate graceful shutdown
 
+The server runs on its own event loop in a daemon thread so that a busy
+worker loop cannot stall Kubernetes probes. ``/health`` is answered on that
+loop directly; ``/metrics``, ``/status`` and ``/drain`` hand their work to
+the worker loop, which owns the metrics registry and the Temporal worker.
+
 Security Notes:
     - Local dev: Access via kubectl port-forward
     - Kubernetes: Internal ClusterIP service only
@@ -13,8 +18,9 @@ Security Notes:
 """
 
 import asyncio
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, TypeVar
 
 from aiohttp import web
 
@@ -30,6 +36,8 @@ from airweave.domains.temporal.metrics import ConnectorSnapshot, WorkerMetricsSn
 
 from .config import WorkerConfig
 
+T = TypeVar("T")
+
 # =============================================================================
 # Worker State
 # =============================================================================
@@ -67,19 +75,30 @@ class WorkerControlServer:
         self._worker_metrics = worker_metrics
         self._renderer = renderer
         self._runner: web.AppRunner | None = None
+        # Loop that runs the Temporal worker, and the server's own loop/thread.
+        self._worker_loop: asyncio.AbstractEventLoop | None = None
+        self._server_loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        # psutil.Process handle, created on first use and kept so that
+        # cpu_percent() can measure against the previous call without blocking.
+        self._process: Any = None
 
     async def start(self) -> None:
-        """Start the control server."""
-        app = web.Application()
-        app.router.add_get("/health", self._handle_health)
-        app.router.add_get("/metrics", self._handle_metrics)
-        app.router.add_get("/status", self._handle_status)
-        app.router.add_post("/drain", self._handle_drain)
+        """Start the control server on a dedicated thread and event loop."""
+        self._worker_loop = asyncio.get_running_loop()
+        self._server_loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._server_loop.run_forever,
+            name="worker-control-server",
+            daemon=True,
+        )
+        self._thread.start()
 
-        self._runner = web.AppRunner(app)
-        await self._runner.setup()
-        site = web.TCPSite(self._runner, "0.0.0.0", self._config.metrics_port)
-        await site.start()
+        try:
+            await self._on_server_loop(self._serve())
+        except Exception:
+            await self._shutdown_server_loop()
+            raise
 
         logger.info(
             f"Control server started on 0.0.0.0:{self._config.metrics_port} "
@@ -87,12 +106,62 @@ class WorkerControlServer:
         )
 
     async def stop(self) -> None:
-        """Stop the control server."""
+        """Stop the control server and its thread."""
         if self._runner:
             try:
-                await self._runner.cleanup()
+                await self._on_server_loop(self._runner.cleanup())
             except Exception as e:
                 logger.warning(f"Control server cleanup error: {e}")
+            self._runner = None
+        await self._shutdown_server_loop()
+
+    async def _serve(self) -> None:
+        """Bind the HTTP app; runs on the server loop."""
+        app = web.Application()
+        app.router.add_get("/health", self._handle_health)
+        app.router.add_get("/metrics", self._handle_metrics)
+        app.router.add_get("/status", self._handle_status)
+        app.router.add_post("/drain", self._handle_drain)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "0.0.0.0", self._config.metrics_port)
+        await site.start()
+
+    async def _shutdown_server_loop(self) -> None:
+        """Stop the server loop and wait for its thread to exit."""
+        loop, thread = self._server_loop, self._thread
+        self._server_loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        await asyncio.to_thread(thread.join)
+        loop.close()
+
+    # -------------------------------------------------------------------------
+    # Cross-loop dispatch
+    # -------------------------------------------------------------------------
+
+    async def _on_server_loop(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the server loop and await it from the caller's loop."""
+        if self._server_loop is None:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._server_loop))
+
+    async def _on_worker_loop(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the worker loop and await it from the server loop."""
+        loop = self._worker_loop
+        if loop is None or loop is asyncio.get_running_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def _spawn_on_worker_loop(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Schedule a fire-and-forget coroutine on the worker loop."""
+        loop = self._worker_loop
+        if loop is None or loop is asyncio.get_running_loop():
+            asyncio.create_task(coro)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, loop)
 
     # -------------------------------------------------------------------------
     # Handlers
@@ -112,14 +181,14 @@ class WorkerControlServer:
         self._state.draining = True
 
         if self._state.on_drain_requested:
-            asyncio.create_task(self._state.on_drain_requested())
+            self._spawn_on_worker_loop(self._state.on_drain_requested())
 
         return web.Response(text="Drain initiated")
 
     async def _handle_metrics(self, request: web.Request) -> web.Response:
         """Metrics endpoint."""
         try:
-            metrics_data = await self._collect_prometheus_metrics()
+            metrics_data = await self._on_worker_loop(self._collect_prometheus_metrics())
             return web.Response(
                 body=metrics_data,
                 content_type=self._renderer.content_type,
@@ -132,7 +201,7 @@ class WorkerControlServer:
     async def _handle_status(self, request: web.Request) -> web.Response:
         """JSON status endpoint for debugging."""
         try:
-            status_data = await self._collect_json_status()
+            status_data = await self._on_worker_loop(self._collect_json_status())
             return web.json_response(status_data)
         except Exception as e:
             logger.error(f"Error generating JSON status: {e}", exc_info=True)
@@ -230,10 +299,20 @@ class WorkerControlServer:
         """Get CPU and memory usage."""
         try:
             import psutil
+        except ImportError:
+            return 0.0, 0
+
+        try:
+            if self._process is None:
+                process = psutil.Process()
+                process.cpu_percent(interval=None)  # establish the baseline
+                self._process = process
 
-            process = psutil.Process()
-            cpu_percent = round(process.cpu_percent(interval=0.1), 1)
-            memory_mb = int(process.memory_info().rss / 1024 / 1024)
-            return cpu_percent, memory_mb
+            cpu_percent = round(self._process.cpu_percent(interval=None), 1)
+            memory_mb = int(self._process.memory_info().rss / 1024 / 1024)
         except ImportError:
             return 0.0, 0
+        except psutil.Error:
+            self._process = None
+            return 0.0, 0
+        return cpu_percent, memory_mb
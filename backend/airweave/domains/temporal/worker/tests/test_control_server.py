@@ -0,0 +1,95 @@
+"""Tests for WorkerControlServer — the server runs on its own thread and loop."""
+
+import asyncio
+import socket
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.domains.temporal.worker.config import WorkerConfig
+from airweave.domains.temporal.worker.control_server import WorkerControlServer, WorkerState
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _make_server(state: WorkerState) -> WorkerControlServer:
+    config = WorkerConfig(
+        task_queue="test-queue",
+        metrics_port=_free_port(),
+        graceful_shutdown_timeout_seconds=30,
+    )
+    return WorkerControlServer(
+        worker_state=state,
+        config=config,
+        registry=MagicMock(),
+        worker_metrics=MagicMock(),
+        renderer=MagicMock(),
+    )
+
+
+def _get_status(port: int, path: str, timeout: float, method: str = "GET") -> int:
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            return int(r.status)
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+@pytest.mark.asyncio
+async def test_health_answers_while_worker_loop_is_blocked():
+    """A blocked worker loop does not stall /health."""
+    server = _make_server(WorkerState(running=True))
+    await server.start()
+    answered = threading.Event()
+
+    def probe() -> int:
+        status = _get_status(server._config.metrics_port, "/health", 2.0)
+        answered.set()
+        return status
+
+    try:
+        result = asyncio.get_running_loop().run_in_executor(None, probe)
+        # Block the worker loop until the probe has been answered.
+        assert answered.wait(timeout=5.0)
+        assert await result == 200
+    finally:
+        await server.stop()
+
+    assert server._thread is None
+
+
+@pytest.mark.asyncio
+async def test_drain_runs_callback_on_worker_loop():
+    """/drain schedules the drain callback on the loop that started the server."""
+    state = WorkerState(running=True)
+    worker_loop = asyncio.get_running_loop()
+    called_on: list[asyncio.AbstractEventLoop] = []
+
+    async def on_drain() -> None:
+        called_on.append(asyncio.get_running_loop())
+
+    state.on_drain_requested = AsyncMock(side_effect=on_drain)
+    server = _make_server(state)
+    await server.start()
+    try:
+        status = await asyncio.to_thread(
+            _get_status, server._config.metrics_port, "/drain", 2.0, "POST"
+        )
+        assert status == 200
+        for _ in range(50):
+            if called_on:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await server.stop()
+
+    assert state.draining is True
+    assert called_on == [worker_loop]
@@ -14,6 +14,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse
 from pydantic import ValidationError
 
+from airweave.api.health_interceptor import HealthCheckInterceptor
 from airweave.api.middleware import (
     DynamicCORSMiddleware,
     add_request_id,
@@ -170,6 +171,10 @@ app.add_middleware(
     default_origins=CORS_ORIGINS,
 )
 
+# Added last so it is outermost: health probes are answered before any of the
+# middleware above runs.
+app.add_middleware(HealthCheckInterceptor)
+
 
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
 async def show_docs_reference() -> HTMLResponse:
@@ -48,4 +48,8 @@ class Collection(OrganizationBase, UserMixin):
         passive_deletes=True,
     )
 
-    __table_args__ = (Index("idx_collection_vdb_metadata_id", "vector_db_deployment_metadata_id"),)
+    __table_args__ = (
+        Index("idx_collection_vdb_metadata_id", "vector_db_deployment_metadata_id"),
+        # Serves newest-first keyset pagination in list endpoints.
+        Index("idx_collection_org_created_at_id", "organization_id", "created_at", "id"),
+    )
@@ -56,6 +56,7 @@ class SyncJob(OrganizationBase, UserMixin):
 
     __table_args__ = (
         Index("idx_sync_job_sync_id", "sync_id"),
+        Index("idx_sync_job_sync_id_created_at", "sync_id", "created_at"),
         Index("idx_sync_job_status", "status"),
         Index("idx_sync_job_status_modified_at", "status", "modified_at"),
         Index("idx_sync_job_status_started_at", "status", "started_at"),
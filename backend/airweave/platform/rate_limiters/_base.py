@@ -1,6 +1,7 @@
 """Base rate limiter for API clients."""
 
 import asyncio
+import random
 import time
 from typing import Optional
 
@@ -18,7 +19,7 @@ class BaseRateLimiter:
     RATE_LIMIT_PER_POD_RPS: float = NotImplemented  # Requests per second per pod
     RATE_LIMIT_WINDOW_SECONDS: float = 1.0  # Sliding window size
     MAX_WAIT_FOR_SLOT_SECONDS: float = 30.0  # Max wait time
-    POLL_INTERVAL_SECONDS: float = 0.1  # Poll interval
+    POLL_INTERVAL_SECONDS: float = 0.1  # Max jitter added to each wait for a free slot
 
     _instance: Optional["BaseRateLimiter"] = None
 
@@ -54,6 +55,9 @@ class BaseRateLimiter:
         Uses sliding window algorithm to enforce rate limit.
         All instances in this pod share this limiter.
 
+        When the window is full, waiters sleep until the oldest request leaves
+        it, plus a random jitter so they do not all wake at the same instant.
+
         Raises:
             TimeoutError: If can't acquire slot within MAX_WAIT_FOR_SLOT_SECONDS
         """
@@ -80,5 +84,9 @@ class BaseRateLimiter:
                     self._request_times.append(now)
                     return
 
-            # At limit - wait and retry
-            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+                # At limit - wait until the oldest request expires
+                wait = min(self._request_times, default=now) + self.RATE_LIMIT_WINDOW_SECONDS - now
+
+            # Jitter spreads waiting pods apart; it is not security-sensitive.
+            jitter = random.uniform(0, self.POLL_INTERVAL_SECONDS)  # noqa: S311
+            await asyncio.sleep(max(wait, 0.0) + jitter)
@@ -35,7 +35,7 @@ class MistralRateLimiter(BaseRateLimiter):
 
     # Acquisition timeout (very long - rate limiter paces but never fails sync)
     MAX_WAIT_FOR_SLOT_SECONDS = 3600.0  # 1 hour - only paces, never stops sync
-    POLL_INTERVAL_SECONDS = 0.1  # Check availability every 100ms
+    POLL_INTERVAL_SECONDS = 0.1  # Up to 100ms jitter on slot waits
 
     # ==========================================================================
 
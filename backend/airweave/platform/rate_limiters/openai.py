@@ -29,7 +29,7 @@ class OpenAIRateLimiter(BaseRateLimiter):
     # Sliding window configuration
     RATE_LIMIT_WINDOW_SECONDS = 1.0  # 1 second window
     MAX_WAIT_FOR_SLOT_SECONDS = 30.0  # Max wait time
-    POLL_INTERVAL_SECONDS = 0.1  # Poll every 100ms
+    POLL_INTERVAL_SECONDS = 0.1  # Up to 100ms jitter on slot waits
 
     # ==========================================================================
 
@@ -0,0 +1,26 @@
+"""add collection keyset pagination index
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+
+revision = '0001'
+down_revision = '0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_collection_org_created_at_id',
+        'collection',
+        ['organization_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_collection_org_created_at_id', table_name='collection')
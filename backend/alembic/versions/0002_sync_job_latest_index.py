@@ -0,0 +1,26 @@
+"""add sync job (sync_id, created_at) index for latest-job lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_sync_job_sync_id_created_at',
+        'sync_job',
+        ['sync_id', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sync_job_sync_id_created_at', table_name='sync_job')
@@ -53,4 +53,4 @@ cd /app && poetry run alembic upgrade head
 
 # Start application
 echo "Starting application..."
-poetry run uvicorn airweave.main:app --host 0.0.0.0 --port 8001 --reload
+poetry run uvicorn airweave.main:app --host 0.0.0.0 --port 8001 --loop uvloop --http httptools
@@ -43,7 +43,7 @@ class TestCreateDenseEmbedder:
             max_dimensions=1536,
             max_tokens=8192,
             supports_matryoshka=True,
-            embedder_class=OpenAIDenseEmbedder,
+            embedder_class_path="airweave.domains.embedders.dense.openai:OpenAIDenseEmbedder",
             required_setting="OPENAI_API_KEY",
         )
         registry = _build_registry(spec)
@@ -68,7 +68,7 @@ class TestCreateDenseEmbedder:
             max_dimensions=1024,
             max_tokens=8192,
             supports_matryoshka=False,
-            embedder_class=MistralDenseEmbedder,
+            embedder_class_path="airweave.domains.embedders.dense.mistral:MistralDenseEmbedder",
             required_setting="MISTRAL_API_KEY",
         )
         registry = _build_registry(spec)
@@ -93,7 +93,7 @@ class TestCreateDenseEmbedder:
             max_dimensions=384,
             max_tokens=512,
             supports_matryoshka=False,
-            embedder_class=LocalDenseEmbedder,
+            embedder_class_path="airweave.domains.embedders.dense.local:LocalDenseEmbedder",
             required_setting="TEXT2VEC_INFERENCE_URL",
         )
         registry = _build_registry(spec)
@@ -108,9 +108,6 @@ class TestCreateDenseEmbedder:
         assert result.dimensions == 384
 
     def test_raises_for_unknown_embedder_class(self):
-        class _UnknownEmbedder:
-            pass
-
         spec = DenseEmbedderSpec(
             short_name="unknown",
             name="Unknown",
@@ -120,7 +117,7 @@ class TestCreateDenseEmbedder:
             max_dimensions=128,
             max_tokens=512,
             supports_matryoshka=False,
-            embedder_class=_UnknownEmbedder,
+            embedder_class_path="example.embedders:UnknownEmbedder",
             required_setting=None,
         )
         registry = _build_registry(spec)
@@ -314,6 +314,33 @@ async def test_json_status_endpoint_psutil_fallback(
             assert data["metrics"]["memory_mb"] == 0
 
 
+@pytest.mark.asyncio
+async def test_json_status_endpoint_psutil_error_fallback(
+    mock_registry, mock_settings, test_worker_config
+):
+    """Test /status endpoint falls back gracefully when psutil cannot read the process."""
+    import psutil
+
+    with patch(
+        "airweave.domains.temporal.worker.control_server.get_active_thread_count",
+        return_value=10,
+    ):
+        with patch("psutil.Process", side_effect=psutil.AccessDenied()):
+            server, state, _, _ = create_control_server(
+                test_worker_config, mock_registry, running=True
+            )
+
+            request = MagicMock()
+            response = await server._handle_status(request)
+
+            assert response.status == 200
+            import json
+
+            data = json.loads(response.body.decode("utf-8"))
+            assert data["metrics"]["cpu_percent"] == 0.0
+            assert data["metrics"]["memory_mb"] == 0
+
+
 @pytest.mark.asyncio
 async def test_json_status_endpoint_handles_missing_sync_id(
     mock_registry, mock_settings, test_worker_config